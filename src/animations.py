@@ -4,6 +4,7 @@ import math
 import pygame 
 
 from .constants import * 
+from .fonts import render
 
 
 class Animation(Enum):
@@ -96,9 +97,14 @@ class Animator:
 
         self.need_update = True
 
-    def animate_nodes(self):
+    def animate_nodes(self) -> list[pygame.Rect]:
         """Animate nodes in the nodes_to_animate list
+
+        Returns:
+            list[pygame.Rect]: Screen areas that were drawn over
         """
+        rects = []
+
         # Update starting time for animating nodes
         if self.need_update:
             for center in self.nodes_to_animate:
@@ -129,27 +135,29 @@ class Animator:
                 self._path_animation(node)
             else:
                 self._weight_animation(node)
+            rects.append(node.rect.copy())
 
             # Handle node images
             row, col = self.maze.get_cell_pos(node.center)
             if (row, col) == self.maze.start:
                 image_rect = START.get_rect(center=node.center)
                 self.surface.blit(START, image_rect)
+                rects.append(image_rect)
 
             elif (row, col) == self.maze.goal:
                 image_rect = GOAL.get_rect(center=node.center)
                 self.surface.blit(GOAL, image_rect)
+                rects.append(image_rect)
 
             elif (cost := self.maze.maze[row][col].cost) > 1:
                 image_rect = WEIGHT.get_rect(center=node.center)
                 self.surface.blit(WEIGHT, image_rect)
 
-                text = FONT_14.render(
-                    str(cost), True, GRAY
-                )
+                text = render(str(cost), GRAY, 14)
                 text_rect = text.get_rect()
                 text_rect.center = image_rect.center
                 self.surface.blit(text, text_rect)
+                rects.append(image_rect)
 
             # Update maze node and remove current animating node
             if node.progress >= node.duration:
@@ -163,6 +171,8 @@ class Animator:
                 if node.after_animation:
                     node.after_animation()
 
+        return rects
+
     def _wall_animation(self, node: AnimatingNode) -> None:
         """Handle wall animation
 
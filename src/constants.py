@@ -1,8 +1,5 @@
 import sys
-import pygame
-
-pygame.font.init()
-pygame.display.init()
+from typing import Any
 
 # Colors
 BLACK = (0, 0, 0)
@@ -18,17 +15,41 @@ BLUE_2 = (81, 145, 228)
 DARK_BLUE_2 = (44, 67, 208)
 PURPLE = (17, 104, 217)
 
-# Window Dimensions
-WINDOW_INFO = pygame.display.Info()
-SCREEN_WIDTH, SCREEN_HEIGHT = WINDOW_INFO.current_w, WINDOW_INFO.current_h
-WIDTH = 1280 if SCREEN_WIDTH >= 1280 else SCREEN_WIDTH - 150
-HEIGHT = 900 if SCREEN_HEIGHT >= 900 else SCREEN_HEIGHT - 150
 HEADER_HEIGHT = 200
 
-# Maze
-CELL_SIZE = 26
-if len(sys.argv) > 1:
-    arg = sys.argv[1]
+# Framerate
+FPS = 60
+
+# Everything below depends on the display, the command line or the asset
+# files. It is loaded on first access, so importing this module (or the
+# pathfinder package) doesn't initialize pygame.
+_DISPLAY_CONSTANTS = (
+    "WINDOW_INFO", "SCREEN_WIDTH", "SCREEN_HEIGHT", "WIDTH", "HEIGHT",
+    "CELL_SIZE", "REMAINDER_W", "REMAINDER_H", "MAZE_WIDTH", "MAZE_HEIGHT",
+    "CLOCK", "WEIGHT", "START", "GOAL", "FONT_14", "FONT_18",
+    "MIN_SIZE", "MAX_SIZE",
+)
+
+__all__ = [
+    "BLACK", "DARK", "GREEN", "GREEN_2", "BLUE", "WHITE", "YELLOW", "GRAY",
+    "DARK_BLUE", "BLUE_2", "DARK_BLUE_2", "PURPLE", "HEADER_HEIGHT", "FPS",
+    *_DISPLAY_CONSTANTS,
+]
+
+
+def _parse_cell_size(argv: list[str]) -> int:
+    """Read the cell size from the command line
+
+    Args:
+        argv (list[str]): Command line arguments
+
+    Returns:
+        int: Cell size, 26 if not given
+    """
+    if len(argv) <= 1:
+        return 26
+
+    arg = argv[1]
 
     try:
         assert arg.startswith("--cell-size:") == True
@@ -41,34 +62,67 @@ if len(sys.argv) > 1:
         elif size > 90:
             size = 90
 
-        CELL_SIZE = size
+        return size
     except:
         print("\nInvalid command line arguments")
         print("USAGE: python3 run.pyw [ --cell-size:<int> ]")
         exit(1)
 
-REMAINDER_W = WIDTH % CELL_SIZE
-if REMAINDER_W == 0:
-    REMAINDER_W = CELL_SIZE
 
-REMAINDER_H = (HEIGHT - HEADER_HEIGHT) % CELL_SIZE
-if REMAINDER_H == 0:
-    REMAINDER_H = CELL_SIZE
+def _load_display_constants() -> dict[str, Any]:
+    """Initialize the display and fonts, and load the images and fonts
 
-MAZE_WIDTH = WIDTH - REMAINDER_W
-MAZE_HEIGHT = HEIGHT - HEADER_HEIGHT - REMAINDER_H
+    Returns:
+        dict[str, Any]: Display dependent constants
+    """
+    import pygame
 
-# Framerate
-FPS = 60
-CLOCK = pygame.time.Clock()
-
-# Images and fonts
-WEIGHT = pygame.image.load("assets/images/weight.png")
-START = pygame.image.load("assets/images/triangle.png")
-GOAL = pygame.image.load("assets/images/circle.png")
-FONT_14 = pygame.font.Font("assets/font/Montserrat-Regular.ttf", 14)
-FONT_18 = pygame.font.Font("assets/font/Montserrat-Regular.ttf", 18)
-
-# Animations
-MIN_SIZE = 0.3 * CELL_SIZE
-MAX_SIZE = 1.2 * CELL_SIZE
+    from .fonts import REGULAR, get_font
+
+    pygame.font.init()
+    pygame.display.init()
+
+    # Window Dimensions
+    WINDOW_INFO = pygame.display.Info()
+    SCREEN_WIDTH, SCREEN_HEIGHT = WINDOW_INFO.current_w, WINDOW_INFO.current_h
+    WIDTH = 1280 if SCREEN_WIDTH >= 1280 else SCREEN_WIDTH - 150
+    HEIGHT = 900 if SCREEN_HEIGHT >= 900 else SCREEN_HEIGHT - 150
+
+    # Maze
+    CELL_SIZE = _parse_cell_size(sys.argv)
+
+    REMAINDER_W = WIDTH % CELL_SIZE
+    if REMAINDER_W == 0:
+        REMAINDER_W = CELL_SIZE
+
+    REMAINDER_H = (HEIGHT - HEADER_HEIGHT) % CELL_SIZE
+    if REMAINDER_H == 0:
+        REMAINDER_H = CELL_SIZE
+
+    MAZE_WIDTH = WIDTH - REMAINDER_W
+    MAZE_HEIGHT = HEIGHT - HEADER_HEIGHT - REMAINDER_H
+
+    CLOCK = pygame.time.Clock()
+
+    # Images and fonts
+    WEIGHT = pygame.image.load("assets/images/weight.png")
+    START = pygame.image.load("assets/images/triangle.png")
+    GOAL = pygame.image.load("assets/images/circle.png")
+    FONT_14 = get_font(REGULAR, 14)
+    FONT_18 = get_font(REGULAR, 18)
+
+    # Animations
+    MIN_SIZE = 0.3 * CELL_SIZE
+    MAX_SIZE = 1.2 * CELL_SIZE
+
+    local = locals()
+    return {name: local[name] for name in _DISPLAY_CONSTANTS}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DISPLAY_CONSTANTS:
+        constants = _load_display_constants()
+        globals().update(constants)
+        return constants[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
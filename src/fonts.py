@@ -0,0 +1,70 @@
+from collections import OrderedDict
+import pygame
+
+# Font faces
+REGULAR = "assets/font/Montserrat-Regular.ttf"
+BOLD = "assets/font/Montserrat-Bold.ttf"
+
+# Most rendered texts kept by `render`
+MAX_TEXTS = 256
+
+# face, size, text, color
+TextKey = tuple[str, int, str, tuple[int, ...]]
+
+_fonts: dict[tuple[str, int], pygame.font.Font] = {}
+_texts: OrderedDict[TextKey, pygame.surface.Surface] = OrderedDict()
+
+
+def get_font(face: str, size: int) -> pygame.font.Font:
+    """Get a font, loading it from disk only the first time
+
+    Args:
+        face (str): Path of the font file
+        size (int): Font size
+
+    Returns:
+        pygame.font.Font: Font shared by every caller
+    """
+    font = _fonts.get((face, size))
+
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[(face, size)] = font
+
+    return font
+
+
+def render(
+    text: str,
+    color: tuple[int, int, int] | pygame.Color,
+    size: int,
+    face: str = REGULAR
+) -> pygame.surface.Surface:
+    """Render antialiased text, reusing recently rendered surfaces
+
+    The least recently used surfaces are dropped once more than
+    MAX_TEXTS are kept. Surfaces are shared, so they must not be drawn on.
+
+    Args:
+        text (str): Text to render
+        color (tuple[int, int, int] | pygame.Color): Text color
+        size (int): Font size
+        face (str, optional): Path of the font file. Defaults to REGULAR.
+
+    Returns:
+        pygame.surface.Surface: Rendered text
+    """
+    key = (face, size, text, tuple(color))
+    surface = _texts.get(key)
+
+    if surface is not None:
+        _texts.move_to_end(key)
+        return surface
+
+    surface = get_font(face, size).render(text, True, color)
+    _texts[key] = surface
+
+    if len(_texts) > MAX_TEXTS:
+        _texts.popitem(last=False)
+
+    return surface
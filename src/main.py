@@ -5,6 +5,9 @@ from .state import State
 from .maze import Maze, GOAL, START, Maze, WEIGHT
 from .animations import Animation, Animator, AnimatingNode
 from .generate import MazeGenerator
+from .fonts import render
+from .pathfinder.models.solution import Solution
+from .pathfinder.results import add_result, average_results
 
 from .constants import * 
 from .widgets import *
@@ -20,13 +23,17 @@ pygame.display.set_caption("Pathfinding Visualiser")
 # Top bar
 top = pygame.Rect(0, 0, WIDTH, 80)
 
+# Top bar, title and legend, drawn by `draw_header` and blitted at the
+# start of every frame
+header = pygame.Surface((WIDTH, HEADER_HEIGHT), 0, WINDOW)
+
 # Title
 title = Label(
     "Pathfinding Visualiser", 20, 0,
     background_color=pygame.Color(*DARK_BLUE),
     foreground_color=pygame.Color(*WHITE),
     padding=6, font_size=20, bold=True,
-    surface=WINDOW,
+    surface=header,
 )
 title.rect.centery = top.centery
 
@@ -101,6 +108,69 @@ algo_menu = Menu(
             foreground_color=pygame.Color(*WHITE),
             font_size=20, outline=False
         ),
+        Button(
+            surface=WINDOW,
+            text="Jump Point Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 5,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Bidirectional BFS",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 6,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Bidirectional A* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 7,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="HPA* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 8,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="LPA* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 9,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="Weighted A* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 10,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
+        Button(
+            surface=WINDOW,
+            text="ARA* Search",
+            x=algorithm_btn.rect.x - 40,
+            y=algorithm_btn.rect.y + algorithm_btn.height * 11,
+            background_color=pygame.Color(*DARK_BLUE),
+            foreground_color=pygame.Color(*WHITE),
+            font_size=20, outline=False
+        ),
     ]
 )
 
@@ -340,6 +410,11 @@ def main() -> None:
                 if dragging:
                     dragging = False
 
+                    # Replace the drag preview with the selected algorithm
+                    if state.done_visualising:
+                        text = state.label.text.split(" took")[0]
+                        instant_algorithm(maze, text)
+
                     pos = pygame.mouse.get_pos()
                     if not maze.mouse_within_bounds(pos):
                         break
@@ -353,8 +428,9 @@ def main() -> None:
 
                 cell_under_mouse = (-1, -1)
 
+        rects = []
         if state.need_update:
-            draw()
+            rects = draw()
 
         # Get pressed keys for weighted nodes
         draw_weighted_nodes, key = get_pressed()
@@ -404,20 +480,28 @@ def main() -> None:
 
                     cell_under_mouse = (row, col)
 
+        # Queue the cells a running search has expanded since last frame
+        maze.feed_stream()
+
         # Animate nodes
-        if animator.nodes_to_animate and state.need_update:
+        if (animator.nodes_to_animate or maze.stream is not None) \
+                and state.need_update:
             animator.animating = True
-            animator.animate_nodes()
+            rects.extend(animator.animate_nodes())
         else:
             animator.animating = False
 
         # Handle moving start and target nodes
         if dragging and not state.done_visualising and not animator.animating:
             x, y = pygame.mouse.get_pos()
-            if cell_value == "A":
-                WINDOW.blit(START, (x - 10, y - 10))
-            else:
-                WINDOW.blit(GOAL, (x - 10, y - 10))
+            image = START if cell_value == "A" else GOAL
+            image_rect = WINDOW.blit(image, (x - 10, y - 10))
+
+            # Erase the preview next frame
+            rects.append(image_rect)
+            maze.mark_dirty(image_rect)
+            if not maze.rect.contains(image_rect):
+                state.full_redraw = True
 
         # Instantly find path if dragging post visualisation
         if dragging and state.done_visualising and not animator.animating:
@@ -432,24 +516,30 @@ def main() -> None:
                     maze.set_cell(cell_under_mouse, "1")
 
                     text = state.label.text.split(" took")[0]
-                    instant_algorithm(maze, text)
+                    instant_algorithm(maze, text, dragged=cell_value)
                     cell_under_mouse = (row, col)
 
         # Update
-        pygame.display.update()
+        pygame.display.update(rects)
         CLOCK.tick(FPS)
 
 
-def instant_algorithm(maze: Maze, algo_name: str):
+def instant_algorithm(maze: Maze, algo_name: str, dragged: str | None = None):
     """Find path without animation
 
     Args:
         maze (Maze): Maze
         algo_name (str): Algorithm name
+        dragged (str, optional): "A" or "B" while that endpoint is being
+            dragged. The shortest path is then previewed from a cached
+            tree instead of running the algorithm. Defaults to None.
     """
     maze.clear_visited()
 
-    solution = maze.solve(algo_name=algo_name)
+    if dragged:
+        solution = maze.solve_dragged(moving=dragged)
+    else:
+        solution = maze.solve(algo_name=algo_name)
 
     path = solution.path
     explored = solution.explored_states
@@ -487,12 +577,15 @@ def get_pressed() -> tuple[bool, int | None]:
     return False, None
 
 
-def draw() -> None:
-    """Draw things (except Visualise button)
+def draw_header() -> None:
+    """Draw the top bar, title and legend into the header layer
+
+    They don't change from frame to frame, so this only runs again after
+    `state.header_changed` is set.
     """
     # Fill white, draw top background and title text
-    WINDOW.fill(WHITE)
-    pygame.draw.rect(WINDOW, DARK_BLUE, top)
+    header.fill(WHITE)
+    pygame.draw.rect(header, DARK_BLUE, top)
     title.draw()
 
     # Draw maze legend
@@ -510,15 +603,15 @@ def draw() -> None:
     y = top.bottom + 20
     for text in texts:
         # Rectangle (Symbol)
-        pygame.draw.rect(WINDOW, texts[text], (x, y, 30, 30))
-        pygame.draw.rect(WINDOW, GRAY, (x, y, 30, 30), width=1)
+        pygame.draw.rect(header, texts[text], (x, y, 30, 30))
+        pygame.draw.rect(header, GRAY, (x, y, 30, 30), width=1)
 
         # Text (Meaning)
-        text_surf = FONT_18.render(text, True, DARK)
+        text_surf = render(text, DARK, 18)
         text_rect = text_surf.get_rect()
         text_rect.centery = y + 30 // 2
 
-        WINDOW.blit(text_surf, (x + 30 + 10, text_rect.y))
+        header.blit(text_surf, (x + 30 + 10, text_rect.y))
 
         # Formating
         if texts[text] == DARK:
@@ -528,20 +621,46 @@ def draw() -> None:
 
         # Draw images for weighted, start and target node
         if text == "Weighted Node":
-            WINDOW.blit(WEIGHT, (x + 3, y + 3))
+            header.blit(WEIGHT, (x + 3, y + 3))
             x = 50
         elif text == "Start Node":
             image_rect = START.get_rect(center=(65, top.bottom + 35))
-            WINDOW.blit(START, image_rect)
+            header.blit(START, image_rect)
         elif text == "Target Node":
             image_rect = GOAL.get_rect(center=(65, y + 15))
-            WINDOW.blit(GOAL, image_rect)
+            header.blit(GOAL, image_rect)
+
+
+def draw() -> list[pygame.Rect]:
+    """Draw things (except Visualise button)
+
+    The header is drawn every frame, but only the cells that changed are
+    redrawn unless something covered the maze, like an open menu or the
+    results popup.
+
+    Returns:
+        list[pygame.Rect]: Areas of the window that were drawn over
+    """
+    menus = (algo_menu, speed_menu, comapre_menu, generate_menu)
+    covered = any(menu.clicked for menu in menus) \
+        or state.results_popup is not None
+
+    # Fill white and draw the header
+    if state.full_redraw:
+        WINDOW.fill(WHITE)
+        maze.full_redraw = True
+
+    if state.header_changed:
+        draw_header()
+        state.header_changed = False
+    WINDOW.blit(header, (0, 0))
 
     # Draw algo label
     state.label.draw()
     state.speed_label.draw()
 
-    maze.draw()
+    rects = [pygame.Rect(0, 0, WIDTH, HEADER_HEIGHT)]
+    rects.extend(maze.draw())
 
     # Handle buttons
     if (algo_menu.draw() or algo_menu.clicked) \
@@ -659,6 +778,16 @@ def draw() -> None:
             state.results_popup = None
             state.overlay = False
 
+    # Menus and popups are drawn over the maze, so the whole window is
+    # redrawn while they are shown and once more after they close
+    covered = covered or any(menu.clicked for menu in menus) \
+        or state.results_popup is not None
+    if covered or state.full_redraw:
+        rects = [WINDOW.get_rect()]
+    state.full_redraw = covered
+
+    return rects
+
 
 def run_single(idx: int) -> None:
     """Run a single algorithm on one maze
@@ -668,9 +797,8 @@ def run_single(idx: int) -> None:
     """
     maze.clear_visited()
     text = algo_menu.children[idx].text
-    solution = maze.solve(text)
 
-    def callback():
+    def callback(solution: Solution):
         state.done_visualising = True
         state.label = Label(
             f"{text} took {solution.explored_length} steps in "
@@ -683,7 +811,7 @@ def run_single(idx: int) -> None:
         state.label.rect.bottom = HEADER_HEIGHT - 10
         state.overlay = False
 
-    maze.visualize(solution=solution, after_animation=callback)
+    maze.visualize_stream(maze.solve_stream(text), after_animation=callback)
 
     state.label = Label(
         f"Running {text}", "center", 0,
@@ -705,7 +833,9 @@ def run_all(algo_idx: int, maze_idx: int = -1) -> None:
     maze.clear_visited()
     text = algo_menu.children[algo_idx].text
 
-    def callback():
+    def callback(solution: Solution):
+        add_result(state.results, text, solution)
+
         if algo_idx + 1 < len(algo_menu.children):
             run_all(algo_idx + 1, maze_idx)
         elif state.run_all_mazes \
@@ -747,32 +877,16 @@ def run_all(algo_idx: int, maze_idx: int = -1) -> None:
             )
             state.label.rect.bottom = HEADER_HEIGHT - 10
 
-            results = list(state.results.items())
-
-            if state.run_all_mazes:
-                for result in results:
-                    result[1]["path_length"] //= maze_idx + 2
-                    result[1]["path_cost"] //= maze_idx + 2
-                    result[1]["explored_length"] //= maze_idx + 2
-                    result[1]["time"] /= maze_idx + 2
-
-            results.sort(key=lambda item: item[1]["time"])
+            results = average_results(
+                state.results,
+                runs=maze_idx + 2 if state.run_all_mazes else 1
+            )
 
             show_results(results)
             state.run_all_mazes = False
             state.overlay = False
 
-    solution = maze.solve(text)
-
-    if text not in state.results:
-        state.results[text] = vars(solution)
-    else:
-        state.results[text]["explored_length"] += solution.explored_length
-        state.results[text]["path_length"] += solution.path_length
-        state.results[text]["path_cost"] += solution.path_cost
-        state.results[text]["time"] += solution.time
-
-    maze.visualize(solution=solution, after_animation=callback)
+    maze.visualize_stream(maze.solve_stream(text), after_animation=callback)
 
     state.label = Label(
         f"Running {text}", "center", 0,
@@ -926,7 +1040,7 @@ def show_results(results: list[tuple[str, dict[str, float]]]) -> None:
             Table(
                 x=0,
                 y=0,
-                rows=6,
+                rows=len(children),
                 columns=5,
                 padding=20,
                 color=DARK,
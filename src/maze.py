@@ -1,16 +1,35 @@
-from typing import Optional
+from array import array
+from typing import Any, Callable, Iterator, Optional
+import math
+import time
 import pygame 
 
 from .pathfinder.models.node import Node
 from .animations import AnimatingNode, Animation, AnimationCallback, Animator
+from .fonts import render
 from .generate import MazeGenerator, GenerationCallback
+from .pathfinder.cache import SolutionCache
+from .pathfinder.models.cells import Cells
+from .pathfinder.models.events import Event, SearchEvent
 from .pathfinder.models.solution import Solution
 from .pathfinder.main import PathFinder
 from .pathfinder.models.grid import Grid
+from .pathfinder.models.path_tree import PathTree
+from .pathfinder.search.hpa import HierarchicalGraph
+from .pathfinder.search.lpa import LifelongPlanner
 from .pathfinder.models.search_types import Search
 
 from .constants import * 
 
+# Called with the finished solution once a streamed search is animated
+StreamCallback = Callable[[Solution], None]
+
+# Longest a frame spends pulling events from a streamed search, in seconds
+STREAM_BUDGET = 0.008
+
+# Most areas `Maze.draw` reports before merging them into one
+MAX_DIRTY_RECTS = 256
+
 
 class MazeNode(Node):
     def __init__(self,
@@ -48,8 +67,51 @@ class Maze:
         self.maze[self.goal[0]][self.goal[1]].value = "B" 
         self.maze[self.goal[0]][self.goal[1]].cost = 1
 
+        # Cells currently marked as visited ("V") or path ("*")
+        self.visited: set[tuple[int, int]] = set()
+
+        # Compiled grid kept in sync by `set_cell`, and the HPA* graph
+        # and LPA* planner built from it on first use
+        self.grid = Grid(self.maze, self.start, self.goal)  # type: ignore
+        self.hierarchy: HierarchicalGraph | None = None
+        self.planner: LifelongPlanner | None = None
+
+        # Shortest-path tree used to re-solve while an endpoint is dragged
+        self.tree: PathTree | None = None
+
+        # Solutions of earlier queries, recognized by the grid's content
+        self.cache = SolutionCache()
+
+        # Search being streamed into the animator, see `visualize_stream`
+        self.stream: Iterator[SearchEvent] | None = None
+        self.stream_callback: StreamCallback | None = None
+        self.stream_clock = 0
+        self.stream_time = 0.0
+        self.stream_count = 0
+        self.stream_last: AnimatingNode | None = None
+        self.stream_bound: float | None = None
+
         # Generate screen coordinates for maze
         self.coords = self._generate_coordinates() 
+        self.rect = pygame.Rect(REMAINDER_W // 2, HEADER_HEIGHT,
+                                self.width * CELL_SIZE,
+                                self.height * CELL_SIZE)
+
+        # Cells to redraw in the next frame, see `draw`
+        self.full_redraw = True
+        self.dirty: set[tuple[int, int]] = set()
+        self.animated: set[tuple[int, int]] = set()
+
+        # How far images and growing animations reach past a cell's edges
+        image_size = max(WEIGHT.get_width(), START.get_width(),
+                         GOAL.get_width())
+        self.images_spill = image_size > CELL_SIZE
+        self.spill = math.ceil(
+            max(image_size - CELL_SIZE, MAX_SIZE - CELL_SIZE, 0) / 2)
+
+        # Empty grid, drawn by `_draw_base` on first use. Cells that look
+        # the same as in it are not drawn again.
+        self.base: pygame.surface.Surface | None = None
 
         self.speed = "Fast"
     
@@ -78,6 +140,12 @@ class Maze:
         return coords
 
 
+    @property
+    def fingerprint(self) -> int:
+        """64-bit Zobrist fingerprint of the walls, weights, start and goal,
+        kept up to date by `set_cell`"""
+        return self.grid.fingerprint
+
     def get_cell_value(self, pos: tuple[int, int]) -> str:
         """Get cell value
 
@@ -111,6 +179,10 @@ class Maze:
             forced (bool): Whether or not to force set
         """
         row, col = pos[0], pos[1] 
+        self.dirty.add(pos)
+        if value in ("V", "*"):
+            self.visited.add(pos)
+
         if pos in (self.start, self.goal) and not forced:
             if value == "V": 
                 self.maze[row][col].color = BLUE 
@@ -123,12 +195,12 @@ class Maze:
                 color = WHITE
                 cost = 0 
                 self.start = pos 
-                self.maze[row][col].parent = None
+                self.grid.start = pos
             case "B": 
                 color = WHITE
                 cost = 1 
                 self.goal = pos 
-                self.maze[row][col].parent = None
+                self.grid.end = pos
             case "#":
                 color = DARK
                 cost = -1 
@@ -146,6 +218,25 @@ class Maze:
         self.maze[row][col].cost = cost 
         self.maze[row][col].color = color
 
+        if self.grid.update_cell(pos, value == "#", cost):
+            self._cell_changed(pos)
+
+    def _cell_changed(self, pos: tuple[int, int]) -> None:
+        """Tell the structures built from the grid that a cell's wall or
+        cost changed
+
+        Args:
+            pos (tuple[int, int]): Position of the cell
+        """
+        if self.hierarchy is not None:
+            self.hierarchy.mark_dirty(pos)
+
+        if self.planner is not None:
+            self.planner.mark_dirty(pos)
+
+        if self.tree is not None and not self.tree.holds(self.grid, pos):
+            self.tree = None
+
     def set_speed(self, speed_str: str) -> None:
         if speed_str not in {"Fast", "Medium", "Slow"}:
             return
@@ -157,25 +248,29 @@ class Maze:
         self.maze = [[MazeNode("1", (row, col), 1)
                 for col in range(self.width)]
             for row in range(self.height)]
+        self.visited.clear()
+
+        self.grid = Grid(self.maze, self.start, self.goal)  # type: ignore
+        self.hierarchy = None
+        self.planner = None
+        self.tree = None
+        self.full_redraw = True
         
         self.set_cell(self.start, "A", forced=True)
         self.set_cell(self.goal, "B", forced=True)
 
     def clear_visited(self) -> None: 
         """Clear visited nodes
-        """
-        for r in range(self.height):
-            for c in range(self.width):
-                node = self.maze[r][c]
-                value = str(node.cost) if node.value in ("V", "*") else node.value
-                self.maze[r][c] = MazeNode(
-                    value=value,
-                    state=(r, c),
-                    cost=node.cost
-                )
 
-                self.set_cell((r, c), value)
+        Searches don't write into the maze nodes, so only the cells
+        marked while visualizing a solution need to be reset.
+        """
+        for pos in self.visited:
+            node = self.get_node(pos)
+            if node.value in ("V", "*"):
+                self.set_cell(pos, str(node.cost))
 
+        self.visited.clear()
         self.set_cell(self.start, "A", forced=True)
         self.set_cell(self.goal, "B", forced=True)
 
@@ -211,32 +306,234 @@ class Maze:
             (x - REMAINDER_W // 2) // CELL_SIZE
         )
 
-    def draw(self) -> None:
-        """Draw maze"""
+    def mark_dirty(self, rect: pygame.Rect) -> None:
+        """Redraw the cells under an area of the screen in the next frame
+
+        Args:
+            rect (pygame.Rect): Screen area something was drawn over
+        """
+        rect = rect.clip(self.rect)
+        if not rect:
+            return
+
+        top, left = self.get_cell_pos(rect.topleft)
+        bottom, right = self.get_cell_pos((rect.right - 1, rect.bottom - 1))
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                self.dirty.add((row, col))
+
+    def draw(self) -> list[pygame.Rect]:
+        """Draw the cells that changed since the last frame
+
+        Cells changed by `set_cell`, marked by `mark_dirty` or being
+        animated are redrawn along with their neighbors, since images and
+        growing animations reach into the cells around them. Redrawn
+        cells are grouped into runs along each row. A run is clipped to
+        its own area and drawn together with the neighbors that reach
+        into it, in the same order as a full redraw, so the result is the
+        same. Every cell is drawn after `full_redraw` is set.
+
+        Cells are drawn over the empty grid layer, skipping those that
+        look the same as in it.
+
+        Returns:
+            list[pygame.Rect]: Screen areas that were drawn over
+        """
         nodes_to_animate = self.animator.nodes_to_animate 
 
-        # Draw every cell on the screen
-        for r, row in enumerate(self.maze):
-            for c, node in enumerate(row):
-                x, y = self.coords[r][c]
-                center = (x + CELL_SIZE // 2, y + CELL_SIZE // 2)
-
-                if not center in nodes_to_animate: 
-                    self._draw_rect((r, c), node.color)
-                    continue 
-
-                # center is in nodes_to_animate 
-                for k in range(len(nodes_to_animate[center]) - 1, -1, -1):
-                    animating_node = nodes_to_animate[center][k]
-                    if animating_node.progress > 0:
-                        self._draw_rect(
-                            coords=(r, c),
-                            color=animating_node.color,
-                            node=animating_node
-                        )
-                        break 
-                else:
-                    self._draw_rect((r,c), node.color)
+        # Cells whose animation has started
+        animated = {
+            self.get_cell_pos(center)
+            for center, nodes in nodes_to_animate.items()
+            if any(node.progress > 0 for node in nodes)
+        }
+
+        if self.base is None:
+            self.base = self._draw_base()
+
+        if self.full_redraw:
+            self.surface.blit(self.base, self.rect)
+            for r, c in animated:
+                self._clear_cell(r, c)
+
+            for r in range(self.height):
+                for c in range(self.width):
+                    if not self._shows_base(r, c, animated):
+                        self._draw_cell(r, c)
+
+            self.full_redraw = False
+            self.dirty.clear()
+            self.animated = animated
+            return [self.rect.inflate(2 * self.spill, 2 * self.spill)]
+
+        # Last frame's animations are redrawn once more to erase them
+        changed = self.dirty | animated | self.animated
+        cells = sorted({
+            (r + dr, c + dc)
+            for r, c in changed
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            if 0 <= r + dr < self.height and 0 <= c + dc < self.width
+        })
+
+        self.dirty.clear()
+        self.animated = animated
+
+        # Runs of consecutive cells in a row, as (row, first col, last col)
+        runs = []
+        for r, c in cells:
+            if runs and runs[-1][0] == r and runs[-1][2] == c - 1:
+                runs[-1][2] = c
+            else:
+                runs.append([r, c, c])
+
+        rects = []
+        for r, first, last in runs:
+            x, y = self.coords[r][first]
+            rect = pygame.Rect(x, y, (last - first + 1) * CELL_SIZE, CELL_SIZE)
+            self.surface.set_clip(rect)
+            self.surface.blit(
+                self.base, rect, rect.move(-self.rect.x, -self.rect.y))
+            for col in range(first, last + 1):
+                if (r, col) in animated:
+                    self._clear_cell(r, col)
+
+            for row in range(max(r - 1, 0), min(r + 2, self.height)):
+                for col in range(max(first - 1, 0),
+                                 min(last + 2, self.width)):
+                    if row == r and first <= col <= last:
+                        if not self._shows_base(row, col, animated):
+                            self._draw_cell(row, col)
+                    elif self._spills((row, col), animated):
+                        self._draw_cell(row, col)
+
+            rects.append(rect)
+
+        self.surface.set_clip(None)
+
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+
+        return rects
+
+    def _spills(
+        self,
+        pos: tuple[int, int],
+        animated: set[tuple[int, int]]
+    ) -> bool:
+        """Check whether drawing a cell reaches into its neighbors
+
+        Args:
+            pos (tuple[int, int]): Position of the cell
+            animated (set[tuple[int, int]]): Cells whose animation has
+                started
+
+        Returns:
+            bool: Whether the cell is animated or has an image larger
+                than a cell
+        """
+        if pos in animated:
+            return True
+
+        return self.images_spill and (
+            pos in (self.start, self.goal)
+            or self.maze[pos[0]][pos[1]].cost > 1)
+
+    def _shows_base(
+        self,
+        r: int,
+        c: int,
+        animated: set[tuple[int, int]]
+    ) -> bool:
+        """Check whether a cell looks the same as in the empty grid
+
+        Args:
+            r (int): Row of the cell
+            c (int): Column of the cell
+            animated (set[tuple[int, int]]): Cells whose animation has
+                started
+
+        Returns:
+            bool: Whether the cell is plain and none of the neighbors
+                drawn before it reach into it
+        """
+        if (r, c) in animated or (r, c) in (self.start, self.goal):
+            return False
+
+        node = self.maze[r][c]
+        if node.color != WHITE or node.cost > 1:
+            return False
+
+        return not any(
+            self._spills((row, col), animated)
+            for row, col in ((r - 1, c - 1), (r - 1, c), (r - 1, c + 1),
+                             (r, c - 1))
+            if 0 <= row < self.height and 0 <= col < self.width
+        )
+
+    def _clear_cell(self, r: int, c: int) -> None:
+        """Erase the borders of the empty grid from a cell
+
+        Animation frames don't always cover their cell, and show a white
+        background around them.
+
+        Args:
+            r (int): Row of the cell
+            c (int): Column of the cell
+        """
+        x, y = self.coords[r][c]
+        self.surface.fill(WHITE, (x, y, CELL_SIZE, CELL_SIZE))
+
+    def _draw_base(self) -> pygame.surface.Surface:
+        """Draw the empty grid into a layer of its own
+
+        Returns:
+            pygame.surface.Surface: White cells with their borders, the
+                size of the maze
+        """
+        base = pygame.Surface(self.rect.size, 0, self.surface)
+        base.fill(WHITE)
+
+        for r in range(self.height):
+            for c in range(self.width):
+                pygame.draw.rect(
+                    surface=base,
+                    color=GRAY,
+                    rect=pygame.Rect(
+                        c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE),
+                    width=1
+                )
+
+        return base
+
+    def _draw_cell(self, r: int, c: int) -> None:
+        """Draw a cell as it is, or the frame of its animation
+
+        Args:
+            r (int): Row of the cell
+            c (int): Column of the cell
+        """
+        nodes_to_animate = self.animator.nodes_to_animate
+        node = self.maze[r][c]
+        x, y = self.coords[r][c]
+        center = (x + CELL_SIZE // 2, y + CELL_SIZE // 2)
+
+        if not center in nodes_to_animate: 
+            self._draw_rect((r, c), node.color)
+            return
+
+        # center is in nodes_to_animate 
+        for k in range(len(nodes_to_animate[center]) - 1, -1, -1):
+            animating_node = nodes_to_animate[center][k]
+            if animating_node.progress > 0:
+                self._draw_rect(
+                    coords=(r, c),
+                    color=animating_node.color,
+                    node=animating_node
+                )
+                break 
+        else:
+            self._draw_rect((r,c), node.color)
         
     def generate_maze(
             self, 
@@ -254,7 +551,7 @@ class Maze:
                 self.generator.basic_random_maze() 
             case "Basic Weight Maze":
                 self.generator.basic_weight_maze()
-            case "Randomized DFS":
+            case "Randomized DFS" | "Randomised DFS":
                 self.generator.randomized_dfs()
             case "Prim's Algorithm":
                 self.generator.randomized_prims_algorithm()
@@ -333,11 +630,18 @@ class Maze:
 
         self.animator.add_nodes_to_animate(nodes_to_animate)
     
-    def solve(self, algo_name: str,) -> Solution:
-        """Solve the maze with an algorithm
+    def _search_setup(
+        self,
+        algo_name: str
+    ) -> tuple[Grid, Search, dict[str, Any]]:
+        """Get the grid, search type and options to solve the maze with
 
         Args:
             algo_name (str): Name of algorithm
+
+        Returns:
+            tuple[Grid, Search, dict[str, Any]]: Grid, search type and
+                extra keyword arguments for the search
         """
         # String -> Search Algorithm
         mapper: dict[str, Search] = {
@@ -346,19 +650,95 @@ class Maze:
             "Greedy Best First Search": Search.GREEDY_BEST_FIRST_SEARCH,
             "Breadth First Search": Search.BREADTH_FIRST_SEARCH,
             "Depth First Search": Search.DEPTH_FIRST_SEARCH,
+            "Jump Point Search": Search.JUMP_POINT_SEARCH,
+            "Bidirectional BFS": Search.BIDIRECTIONAL_BREADTH_FIRST_SEARCH,
+            "Bidirectional A* Search": Search.BIDIRECTIONAL_ASTAR_SEARCH,
+            "HPA* Search": Search.HIERARCHICAL_SEARCH,
+            "LPA* Search": Search.LIFELONG_PLANNING_ASTAR_SEARCH,
+            "Weighted A* Search": Search.WEIGHTED_ASTAR_SEARCH,
+            "ARA* Search": Search.ANYTIME_REPAIRING_ASTAR_SEARCH,
         }
+        search_type = mapper[algo_name.strip()]
+
+        # The compiled grid is kept up to date by `set_cell`
+        grid = self.grid.with_endpoints(self.start, self.goal)
+
+        options = {}
+        if search_type == Search.HIERARCHICAL_SEARCH:
+            if self.hierarchy is None:
+                self.hierarchy = PathFinder.build_hierarchy(grid)
+            options["hierarchy"] = self.hierarchy
+        elif search_type == Search.LIFELONG_PLANNING_ASTAR_SEARCH:
+            if self.planner is None:
+                self.planner = LifelongPlanner(grid)
+            options["planner"] = self.planner
 
-        # Instantiate Grid for PathFinder
-        grid = Grid(self.maze, self.start, self.goal)  # type: ignore
+        return grid, search_type, options
+
+    def solve(self, algo_name: str,) -> Solution:
+        """Solve the maze with an algorithm
+
+        Args:
+            algo_name (str): Name of algorithm
+        """
+        grid, search_type, options = self._search_setup(algo_name)
 
         # Solve the maze
         solution = PathFinder.find_path(
             grid=grid,
-            search_type=mapper[algo_name.strip()],
+            search_type=search_type,
+            cache=self.cache,
+            **options,
         )
 
         return solution
 
+    def solve_stream(self, algo_name: str) -> Iterator[SearchEvent]:
+        """Start solving the maze with an algorithm, one event at a time
+
+        The search runs on a snapshot of the maze, so cells edited while
+        it is animated don't change it halfway through.
+
+        Args:
+            algo_name (str): Name of algorithm
+
+        Returns:
+            Iterator[SearchEvent]: Events of the search
+        """
+        grid, search_type, options = self._search_setup(algo_name)
+        grid.walls = bytearray(grid.walls)
+        grid.costs = array("i", grid.costs)
+
+        return PathFinder.stream_path(
+            grid=grid,
+            search_type=search_type,
+            **options,
+        )
+
+    def solve_dragged(self, moving: str) -> Solution:
+        """Solve the maze while one endpoint is being dragged, by walking
+        a shortest-path tree rooted at the other one
+
+        The tree is built on first use and kept until a wall or weight
+        changes, so every new position is answered without a search.
+
+        Args:
+            moving (str): "A" if the start is moving, "B" for the goal
+
+        Returns:
+            Solution: Shortest path, with no explored states
+        """
+        reverse = moving == "A"
+        root = self.goal if reverse else self.start
+
+        grid = self.grid.with_endpoints(self.start, self.goal)
+
+        if self.tree is None or self.tree.reverse != reverse \
+                or self.tree.root != root:
+            self.tree = PathFinder.path_tree(grid, reverse=reverse)
+
+        return self.tree.solve(grid)
+
     def visualize(
         self,
         solution: Solution,
@@ -372,22 +752,120 @@ class Maze:
         """
 
         # Animate solution nodes
-        nodes = []
-        for cell in solution.explored_states:
-            x, y = self.coords[cell[0]][cell[1]]
-            nodes.append(
-                AnimatingNode(
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    rect=pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE),
-                    ticks=pygame.time.get_ticks(),
-                    value="V",
-                    color=WHITE,
-                    colors=[YELLOW, DARK_BLUE_2, BLUE_2, GREEN_2, BLUE],
-                    duration=1500,
-                    animation=Animation.PATH_ANIMATION
-                )
-            )
+        nodes = [self._visited_node(cell) for cell in solution.explored_states]
+
+        gap, path_gap = self._animation_gaps()
+
+        self.animator.add_nodes_to_animate(nodes, gap=gap)
+
+        if not solution.path:
+            nodes[-1].after_animation = after_animation
+            return
+
+        # Color the shortest path in yellowd
+        nodes = [self._path_node(cell) for cell in solution.path]
+
+        self.animator.add_nodes_to_animate(nodes, delay=600, gap=path_gap)
+        nodes[-1].after_animation = after_animation
+
+    def visualize_stream(
+        self,
+        events: Iterator[SearchEvent],
+        after_animation: Optional[StreamCallback] = None,
+    ) -> None:
+        """Visualize a search while it runs
+
+        The events are pulled by `feed_stream` once per frame, only as
+        fast as the animation shows them, so the first cells are drawn
+        right away and the explored cells are never all held at once.
+
+        Args:
+            events (Iterator[SearchEvent]): Events of a streamed search
+            after_animation (Optional[StreamCallback], optional): Called
+                with the solution after animation. Defaults to None.
+        """
+        self.stream = events
+        self.stream_callback = after_animation
+
+        # The first cell is due on the next frame
+        gap, _ = self._animation_gaps()
+        self.stream_clock = pygame.time.get_ticks() - gap
+        self.stream_time = 0.0
+        self.stream_count = 0
+        self.stream_last = None
+        self.stream_bound = None
+
+    def feed_stream(self) -> None:
+        """Pull the events due this frame from the streamed search and
+        queue their animations
+        """
+        if self.stream is None:
+            return
 
+        gap, path_gap = self._animation_gaps()
+
+        # Expansions are shown one every `gap` ms, as in `visualize`
+        due = (pygame.time.get_ticks() - self.stream_clock) // gap
+        if due <= 0:
+            return
+
+        cells = []
+        finished = None
+        start_time = time.perf_counter()
+        deadline = start_time + STREAM_BUDGET
+        for event in self.stream:
+            if event[0] is Event.EXPANDED:
+                cells.append(event[1])
+                if len(cells) >= due or time.perf_counter() > deadline:
+                    break
+            elif event[0] is Event.IMPROVED:
+                self.stream_bound = event[3]
+            elif event[0] is Event.FINISHED:
+                finished = event
+                break
+        self.stream_time += (time.perf_counter() - start_time) * 1000
+
+        nodes = [self._visited_node(divmod(index, self.width))
+                 for index in cells]
+        self.stream_clock += len(nodes) * gap
+        self.stream_count += len(nodes)
+        self.animator.add_nodes_to_animate(nodes, gap=gap)
+        if nodes:
+            self.stream_last = nodes[-1]
+
+        if finished is None:
+            return
+
+        _, path, path_cost = finished
+        solution = Solution(path=path,
+                            explored_states=Cells(width=self.width),
+                            time=self.stream_time,
+                            path_cost=path_cost,
+                            explored_length=self.stream_count,
+                            bound=self.stream_bound
+                            )
+
+        callback = self.stream_callback
+        after_animation = (lambda: callback(solution)) if callback else None
+        self.stream = None
+        self.stream_callback = None
+
+        if path:
+            nodes = [self._path_node(cell) for cell in path]
+            self.animator.add_nodes_to_animate(nodes, delay=600, gap=path_gap)
+            nodes[-1].after_animation = after_animation
+        elif self.stream_last is not None and self.stream_last in \
+                self.animator.nodes_to_animate.get(self.stream_last.center, []):
+            self.stream_last.after_animation = after_animation
+        elif after_animation:
+            after_animation()
+
+    def _animation_gaps(self) -> tuple[int, int]:
+        """Get the time between animated cells at the current speed
+
+        Returns:
+            tuple[int, int]: Gaps for explored cells and path cells, in ms
+        """
         match self.speed:
             case "Fast":
                 gap = 5
@@ -398,38 +876,55 @@ class Maze:
             case _:
                 gap = 5
 
-        self.animator.add_nodes_to_animate(nodes, gap=gap)
-
-        if not solution.path:
-            nodes[-1].after_animation = after_animation
-            return
-
-        # Color the shortest path in yellowd
-        nodes = []
-        for cell in solution.path:
-            x, y = self.coords[cell[0]][cell[1]]
-            nodes.append(
-                AnimatingNode(
-                    center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
-                    rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
-                    ticks=pygame.time.get_ticks(),
-                    value="*",
-                    color=YELLOW,
-                    duration=1000,
-                )
-            )
-
         match gap:
-            case 5:
-                gap = 30
             case 30:
-                gap = 50
+                path_gap = 50
             case 1000:
-                gap = 50
+                path_gap = 50
+            case _:
+                path_gap = 30
 
-        self.animator.add_nodes_to_animate(nodes, delay=600, gap=gap)
-        nodes[-1].after_animation = after_animation
-    
+        return gap, path_gap
+
+    def _visited_node(self, cell: tuple[int, int]) -> AnimatingNode:
+        """Create the animating node of an explored cell
+
+        Args:
+            cell (tuple[int, int]): Cell position
+
+        Returns:
+            AnimatingNode: Node ready for the animator
+        """
+        x, y = self.coords[cell[0]][cell[1]]
+        return AnimatingNode(
+            center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
+            rect=pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE),
+            ticks=pygame.time.get_ticks(),
+            value="V",
+            color=WHITE,
+            colors=[YELLOW, DARK_BLUE_2, BLUE_2, GREEN_2, BLUE],
+            duration=1500,
+            animation=Animation.PATH_ANIMATION
+        )
+
+    def _path_node(self, cell: tuple[int, int]) -> AnimatingNode:
+        """Create the animating node of a cell on the shortest path
+
+        Args:
+            cell (tuple[int, int]): Cell position
+
+        Returns:
+            AnimatingNode: Node ready for the animator
+        """
+        x, y = self.coords[cell[0]][cell[1]]
+        return AnimatingNode(
+            center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2),
+            rect=pygame.Rect(0, 0, MIN_SIZE, MIN_SIZE),
+            ticks=pygame.time.get_ticks(),
+            value="*",
+            color=YELLOW,
+            duration=1000,
+        )
 
     def _draw_rect(
             self,
@@ -476,9 +971,7 @@ class Maze:
                 center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2))
             self.surface.blit(WEIGHT, image_rect)
 
-            text = FONT_14.render(
-                str(n.cost if not node else node.value), True, GRAY
-            )
+            text = render(str(n.cost if not node else node.value), GRAY, 14)
             text_rect = text.get_rect()
             text_rect.center = image_rect.center
             self.surface.blit(text, text_rect)
@@ -0,0 +1,255 @@
+"""Benchmark the search algorithms on seeded random mazes, without pygame
+
+Usage:
+    python -m src.pathfinder.bench --sizes 50x50 200x200 \\
+        --densities 0.2 0.3 --weights 0 0.1 --seeds 3 --json results.json
+"""
+import argparse
+import json
+import random
+import tracemalloc
+from typing import Any
+
+from .main import PathFinder, SEARCH
+from .models.grid import Grid
+from .models.node import Node
+from .models.search_types import Search
+
+
+def generate_grid(
+    height: int,
+    width: int,
+    density: float,
+    weights: float,
+    seed: int
+) -> Grid:
+    """Generate a random maze with walls and weighted cells
+
+    Args:
+        height (int): Number of rows
+        width (int): Number of columns
+        density (float): Share of cells that are walls
+        weights (float): Share of cells that are weighted (cost 2-51)
+        seed (int): Random seed, the same seed gives the same maze
+
+    Returns:
+        Grid: Grid with a random start and goal on open cells
+    """
+    rnd = random.Random(seed)
+
+    maze = []
+    for row in range(height):
+        nodes = []
+        for col in range(width):
+            roll = rnd.random()
+            if roll < density:
+                nodes.append(Node("#", (row, col), -1))
+            elif roll < density + weights:
+                cost = rnd.randint(2, 51)
+                nodes.append(Node(str(cost), (row, col), cost))
+            else:
+                nodes.append(Node("1", (row, col), 1))
+        maze.append(nodes)
+
+    cells = [(row, col) for row in range(height) for col in range(width)
+             if maze[row][col].value != "#"]
+    if len(cells) < 2:
+        raise ValueError("Not enough open cells for a start and a goal")
+
+    start, end = rnd.sample(cells, 2)
+    maze[start[0]][start[1]] = Node("A", start, 0)
+    maze[end[0]][end[1]] = Node("B", end, 1)
+
+    return Grid(maze, start, end)
+
+
+def run_benchmark(
+    sizes: list[tuple[int, int]],
+    densities: list[float],
+    weights: list[float],
+    seeds: int = 3,
+    base_seed: int = 0,
+    algorithms: list[Search] | None = None
+) -> list[dict[str, Any]]:
+    """Run every algorithm on every generated maze
+
+    Every search runs twice: once timed, and once under tracemalloc to
+    measure its peak memory, since tracing slows the search down.
+
+    Args:
+        sizes (list[tuple[int, int]]): (height, width) of the mazes
+        densities (list[float]): Wall densities
+        weights (list[float]): Weighted cell ratios
+        seeds (int, optional): Mazes per configuration. Defaults to 3.
+        base_seed (int, optional): Seed of the first maze. Defaults to 0.
+        algorithms (list[Search], optional): Algorithms to run. Defaults
+            to every entry in `SEARCH`.
+
+    Returns:
+        list[dict[str, Any]]: One record per run
+    """
+    algorithms = algorithms or list(SEARCH)
+
+    records = []
+    for height, width in sizes:
+        for density in densities:
+            for weight in weights:
+                for seed in range(base_seed, base_seed + seeds):
+                    grid = generate_grid(height, width, density, weight, seed)
+
+                    for search_type in algorithms:
+                        solution = PathFinder.find_path(grid, search_type)
+
+                        tracemalloc.start()
+                        PathFinder.find_path(grid, search_type)
+                        _, peak = tracemalloc.get_traced_memory()
+                        tracemalloc.stop()
+
+                        records.append({
+                            "algorithm": search_type.value,
+                            "height": height,
+                            "width": width,
+                            "density": density,
+                            "weights": weight,
+                            "seed": seed,
+                            "solved": bool(solution.path),
+                            "time": solution.time,
+                            "expansions": solution.explored_length,
+                            "path_length": solution.path_length,
+                            "path_cost": solution.path_cost,
+                            "peak_memory": peak,
+                        })
+
+    return records
+
+
+def summarize(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Average the runs of every algorithm on every configuration
+
+    Args:
+        records (list[dict[str, Any]]): Records from `run_benchmark`
+
+    Returns:
+        list[dict[str, Any]]: One row per configuration and algorithm
+    """
+    groups: dict[tuple, list[dict[str, Any]]] = {}
+    for record in records:
+        key = (record["height"], record["width"], record["density"],
+               record["weights"], record["algorithm"])
+        groups.setdefault(key, []).append(record)
+
+    rows = []
+    for (height, width, density, weight, algorithm), runs in groups.items():
+        solved = [run for run in runs if run["solved"]]
+        rows.append({
+            "algorithm": algorithm,
+            "size": f"{height}x{width}",
+            "density": density,
+            "weights": weight,
+            "runs": len(runs),
+            "solved": len(solved),
+            "time": sum(run["time"] for run in runs) / len(runs),
+            "expansions": sum(run["expansions"] for run in runs) / len(runs),
+            "path_cost": sum(run["path_cost"] for run in solved) / len(solved)
+                if solved else None,
+            "peak_memory": max(run["peak_memory"] for run in runs),
+        })
+
+    return rows
+
+
+def format_table(rows: list[dict[str, Any]]) -> str:
+    """Format summary rows as a text table
+
+    Args:
+        rows (list[dict[str, Any]]): Rows from `summarize`
+
+    Returns:
+        str: Aligned table
+    """
+    headers = ["Size", "Density", "Weights", "Algorithm", "Solved",
+               "Time (ms)", "Expansions", "Path cost", "Peak (KiB)"]
+    lines = [[
+        row["size"],
+        f"{row['density']:.2f}",
+        f"{row['weights']:.2f}",
+        row["algorithm"],
+        f"{row['solved']}/{row['runs']}",
+        f"{row['time']:.2f}",
+        f"{row['expansions']:.0f}",
+        "-" if row["path_cost"] is None else f"{row['path_cost']:.1f}",
+        f"{row['peak_memory'] / 1024:.1f}",
+    ] for row in rows]
+
+    widths = [max(len(cell) for cell in column)
+              for column in zip(headers, *lines)]
+
+    def format_line(cells: list[str]) -> str:
+        return "  ".join(cell.rjust(width) for cell, width in zip(cells, widths))
+
+    table = [format_line(headers), "  ".join("-" * width for width in widths)]
+    table.extend(format_line(line) for line in lines)
+    return "\n".join(table)
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """Parse a HEIGHTxWIDTH size, or a single number for a square"""
+    value = value.lower()
+    try:
+        if "x" in value:
+            height, width = value.split("x")
+            return int(height), int(width)
+        return int(value), int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    names = {search_type.value: search_type for search_type in SEARCH}
+
+    parser = argparse.ArgumentParser(
+        prog="python -m src.pathfinder.bench",
+        description="Benchmark the search algorithms on seeded random mazes"
+    )
+    parser.add_argument("--sizes", type=parse_size, nargs="+",
+                        default=[(50, 50), (100, 100)],
+                        help="maze sizes as HEIGHTxWIDTH")
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.25],
+                        help="share of cells that are walls")
+    parser.add_argument("--weights", type=float, nargs="+", default=[0.0, 0.1],
+                        help="share of cells that are weighted")
+    parser.add_argument("--seeds", type=int, default=3,
+                        help="mazes per configuration")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first maze")
+    parser.add_argument("--algorithms", nargs="+", choices=list(names),
+                        help="algorithms to run, all by default")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write the runs and summary as JSON, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    records = run_benchmark(
+        sizes=args.sizes,
+        densities=args.densities,
+        weights=args.weights,
+        seeds=args.seeds,
+        base_seed=args.seed,
+        algorithms=[names[name] for name in args.algorithms]
+            if args.algorithms else None,
+    )
+    rows = summarize(records)
+
+    if args.json:
+        report = json.dumps({"runs": records, "summary": rows}, indent=2)
+        if args.json == "-":
+            print(report)
+            return
+
+        with open(args.json, "w") as file:
+            file.write(report)
+
+    print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
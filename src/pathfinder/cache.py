@@ -0,0 +1,115 @@
+import sys
+from collections import OrderedDict
+
+from .models.grid import Grid
+from .models.search_types import Search
+from .models.solution import Solution
+
+# grid fingerprint, height, width, search type
+CacheKey = tuple[int, int, int, Search]
+
+
+class SolutionCache:
+    """Least recently used cache of solutions
+
+    Solutions are keyed by the fingerprint of the grid, which covers its
+    endpoints, and the search type, so a map is recognized without
+    scanning it. Once the solutions take more than `max_bytes`, the least
+    recently used ones are evicted.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[CacheKey, tuple[Solution, int]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(grid: Grid, search_type: Search) -> CacheKey:
+        """Get the key of a query
+
+        Args:
+            grid (Grid): Grid of points
+            search_type (Search): Search algorithm
+
+        Returns:
+            CacheKey: Key of the query
+        """
+        return (grid.fingerprint, grid.height, grid.width, search_type)
+
+    def get(self, grid: Grid, search_type: Search) -> Solution | None:
+        """Look up the solution of a query
+
+        Args:
+            grid (Grid): Grid of points
+            search_type (Search): Search algorithm
+
+        Returns:
+            Solution | None: Cached solution, None on a miss
+        """
+        key = SolutionCache.key(grid, search_type)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, grid: Grid, search_type: Search, solution: Solution) -> None:
+        """Store the solution of a query, evicting old ones to stay under
+        the memory cap
+
+        Args:
+            grid (Grid): Grid of points
+            search_type (Search): Search algorithm
+            solution (Solution): Solution to store
+        """
+        key = SolutionCache.key(grid, search_type)
+        size = SolutionCache.solution_bytes(solution)
+
+        if size > self.max_bytes:
+            return
+
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+
+        self.entries[key] = (solution, size)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= evicted
+
+    def clear(self) -> None:
+        """Remove every solution"""
+        self.entries.clear()
+        self.size = 0
+
+    @staticmethod
+    def solution_bytes(solution: Solution) -> int:
+        """Estimate the memory a solution takes
+
+        Args:
+            solution (Solution): Solution
+
+        Returns:
+            int: Size in bytes
+        """
+        size = sys.getsizeof(solution) + sys.getsizeof(vars(solution))
+        for cells in (solution.path, solution.explored_states):
+            size += sys.getsizeof(cells) + sys.getsizeof(cells.indices)
+
+        return size
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"SolutionCache({len(self)} solutions, {self.size} bytes, " \
+            f"{self.hits} hits, {self.misses} misses)"
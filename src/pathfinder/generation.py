@@ -0,0 +1,288 @@
+"""Maze generation algorithms
+
+These only compute which cells change, in the order they change, so they
+can run without pygame. `src/generate.py` turns the result into animated
+cells on screen.
+"""
+import random
+
+
+def _two_step_neighbors(
+    height: int,
+    width: int,
+    cell: tuple[int, int]
+) -> list[tuple[int, int]]:
+    """Get the cells two steps away from a cell that are inside the maze
+
+    Args:
+        height (int): Number of rows
+        width (int): Number of columns
+        cell (tuple[int, int]): Cell position
+
+    Returns:
+        list[tuple[int, int]]: Neighbor positions
+    """
+    neighbors = [(cell[0] + 2, cell[1]),
+                 (cell[0] - 2, cell[1]),
+                 (cell[0], cell[1] + 2),
+                 (cell[0], cell[1] - 2)]
+
+    return [(row, col) for row, col in neighbors
+            if 0 <= row < height and 0 <= col < width]
+
+
+def random_cells(
+    height: int,
+    width: int,
+    rnd: random.Random | None = None
+) -> list[tuple[int, int]]:
+    """Pick about 30% of the cells at random, column by column
+
+    Args:
+        height (int): Number of rows
+        width (int): Number of columns
+        rnd (random.Random, optional): Random generator. Defaults to a
+            new unseeded one.
+
+    Returns:
+        list[tuple[int, int]]: Picked cells
+    """
+    rnd = rnd or random.Random()
+
+    return [(row, col) for col in range(width) for row in range(height)
+            if rnd.randint(1, 10) >= 8]
+
+
+def randomized_dfs(
+    height: int,
+    width: int,
+    start: tuple[int, int],
+    rnd: random.Random | None = None
+) -> list[tuple[int, int]]:
+    """Carve a maze out of a grid full of walls with randomized DFS
+
+    Args:
+        height (int): Number of rows
+        width (int): Number of columns
+        start (tuple[int, int]): Cell to carve from
+        rnd (random.Random, optional): Random generator. Defaults to a
+            new unseeded one.
+
+    Returns:
+        list[tuple[int, int]]: Cells to open, in order. Every new cell is
+            followed by the wall between it and the cell it came from.
+    """
+    rnd = rnd or random.Random()
+
+    carved = []
+    stack = [start]
+    visited = {start}
+
+    while stack:
+        # Pop one cell from the stack
+        curr = stack.pop()
+
+        # Get unvisited two step neighbors of current cell
+        unvisited_neighbors = [
+            neighbor for neighbor in _two_step_neighbors(height, width, curr)
+            if neighbor not in visited
+        ]
+
+        # If the cell has unvisited neighbors, push it to the stack
+        # Choose one neighbor and break wall between the neighbor
+        # and the current cell
+        if unvisited_neighbors:
+            next = rnd.choice(unvisited_neighbors)
+            stack.append(curr)
+
+            wall = ((curr[0] + next[0]) // 2, (curr[1] + next[1]) // 2)
+            carved.extend((next, wall))
+
+            # Add the neighbor to the visited set and push it
+            # to the stack
+            visited.add(next)
+            stack.append(next)
+
+    return carved
+
+
+def randomized_prims(
+    height: int,
+    width: int,
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    rnd: random.Random | None = None
+) -> list[tuple[int, int]]:
+    """Carve a maze out of a grid full of walls with randomized Prim's
+    algorithm
+
+    Args:
+        height (int): Number of rows
+        width (int): Number of columns
+        start (tuple[int, int]): Start position, carved from the beginning
+        goal (tuple[int, int]): Goal position, carved from the beginning
+        rnd (random.Random, optional): Random generator. Defaults to a
+            new unseeded one.
+
+    Returns:
+        list[tuple[int, int]]: Cells to open, in order. Every broken wall
+            is followed by the frontier cell it connects.
+    """
+    rnd = rnd or random.Random()
+
+    # Simple copy of the maze with walls everywhere
+    maze = [["#" for _ in range(width)] for _ in range(height)]
+    maze[start[0]][start[1]] = "1"
+    maze[goal[0]][goal[1]] = "1"
+
+    # Create a list for storing frontier cells
+    frontier = [neighbor for neighbor in _two_step_neighbors(height, width, start)
+                if maze[neighbor[0]][neighbor[1]] == "#"]
+
+    # Visited frontier cells
+    visited = set()
+
+    carved = []
+    while frontier:
+        cell = rnd.choice(frontier)
+
+        # Skip if already visited
+        if cell in visited:
+            frontier.remove(cell)
+            continue
+
+        # Get neighbors that are already open
+        neighbors = [neighbor for neighbor in _two_step_neighbors(height, width, cell)
+                     if maze[neighbor[0]][neighbor[1]] != "#"]
+
+        # If neighbors is not empty, break the wall between the neighbor
+        # and the frontier cell
+        if neighbors:
+            neighbor = rnd.choice(neighbors)
+
+            wall = ((cell[0] + neighbor[0]) // 2,
+                    (cell[1] + neighbor[1]) // 2)
+
+            maze[wall[0]][wall[1]] = "1"
+            maze[cell[0]][cell[1]] = "1"
+            carved.extend((wall, cell))
+
+            frontier.extend(
+                neighbor for neighbor in _two_step_neighbors(height, width, cell)
+                if maze[neighbor[0]][neighbor[1]] == "#"
+            )
+
+        # Add current frontier cell to the visited cell
+        # and remove it from the frontier
+        visited.add(cell)
+        frontier.remove(cell)
+
+    return carved
+
+
+def recursive_division(
+    x1: int,
+    x2: int,
+    y1: int,
+    y2: int,
+    rnd: random.Random | None = None
+) -> list[list[tuple[int, int]]]:
+    """Divide a maze with walls by the recursive division algorithm
+
+    Args:
+        x1 (int): Grid column start
+        x2 (int): Grid column end
+        y1 (int): Grid row start
+        y2 (int): Grid row end
+        rnd (random.Random, optional): Random generator. Defaults to a
+            new unseeded one.
+
+    Returns:
+        list[list[tuple[int, int]]]: Wall lines, in the order they are drawn
+    """
+    rnd = rnd or random.Random()
+
+    lines: list[list[tuple[int, int]]] = []
+    _divide(x1, x2, y1, y2, rnd, lines)
+    return lines
+
+
+def _divide(
+    x1: int,
+    x2: int,
+    y1: int,
+    y2: int,
+    rnd: random.Random,
+    lines: list[list[tuple[int, int]]]
+) -> None:
+    width = x2 - x1
+    height = y2 - y1
+
+    # Base case:
+    if width < 1 or height < 1:
+        return
+
+    # Whether to draw horizontally or vertically
+    horizontal = True if height > width else (
+        False if width != height else rnd.choice((True, False)))
+
+    # Arguments for recursive calls
+    args_list: list[tuple[int, int, int, int]] = []
+
+    # Divide the maze and add new grids' properties to args_list
+    if horizontal:
+        y = _division_line(x1, x2, y1, y2, rnd, lines, horizontal=True)
+        args_list.extend([(x1, x2, y1, y - 1), (x1, x2, y + 1, y2)])
+    else:
+        x = _division_line(x1, x2, y1, y2, rnd, lines)
+        args_list.extend([(x1, x - 1, y1, y2), (x + 1, x2, y1, y2)])
+
+    # Divide the two grids
+    for args in args_list:
+        _divide(*args, rnd, lines)
+
+
+def _division_line(
+    x1: int,
+    x2: int,
+    y1: int,
+    y2: int,
+    rnd: random.Random,
+    lines: list[list[tuple[int, int]]],
+    horizontal: bool = False
+) -> int:
+    """Add a wall line with one hole across a region
+
+    Returns:
+        int: X or Y coordinate of wall line
+    """
+
+    # Handle horizontal division
+    if horizontal:
+        x1, y1 = y1, x1
+        x2, y2 = y2, x2
+
+    # Walls at even places
+    if x1 % 2 != 0:
+        x1 += 1
+    wall = rnd.randrange(x1, x2, 2)
+
+    # Holes at odd places
+    if y1 % 2 == 0:
+        y1 += 1
+    hole = rnd.randrange(y1, y2, 2)
+
+    # Coordinates
+    hole_coords = (hole, wall) if not horizontal else (wall, hole)
+    wall_coords = [-1, wall] if not horizontal else [wall, -1]
+
+    line = []
+    for i in range(y1, y2 + 1):
+        wall_coords[horizontal] = i
+        if hole_coords == tuple(wall_coords):
+            continue
+
+        line.append((wall_coords[0], wall_coords[1]))
+
+    lines.append(line)
+    return wall
@@ -1,24 +1,69 @@
+import copy
 import time
-from typing import Callable
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterator
 
 from .search.astar import AStarSearch
 from .search.gbfs import GreedyBestFirstSearch
 from .search.bfs import BreadthFirstSearch
 from .search.dfs import DepthFirstSearch
 from .search.dijkstras import DijkstrasSearch
+from .search.jps import JumpPointSearch
+from .search.bidirectional_bfs import BidirectionalBreadthFirstSearch
+from .search.bidirectional_astar import BidirectionalAStarSearch
+from .search.hpa import HierarchicalGraph, HierarchicalSearch
+from .search.lpa import LifelongPlanningAStarSearch
+from .search.weighted_astar import WeightedAStarSearch
+from .search.ara import AnytimeRepairingAStarSearch
+from .search.search import BasicSearch
 
+from .cache import SolutionCache
+from .models.budget import Budget
+from .models.buffers import INFINITY, SearchBuffers
+from .models.distance_field import DistanceField
+from .models.events import SearchEvent
 from .models.grid import Grid 
+from .models.landmarks import Landmarks
+from .models.path_tree import PathTree
 from .models.solution import Solution
 from .models.search_types import Search
 
-SearchFunction = Callable[[Grid], Solution]
+# search(grid, buffers=None, **options) -> Solution
+SearchFunction = Callable[..., Solution]
+# stream(grid, buffers=None, **options, pushes=False) -> Iterator[SearchEvent]
+StreamFunction = Callable[..., Iterator[SearchEvent]]
+Query = tuple[tuple[int, int], tuple[int, int]]
 
 SEARCH: dict[Search, SearchFunction] = {
     Search.ASTAR_SEARCH: AStarSearch.search,
     Search.DIJKSRAS_SEARCH: DijkstrasSearch.search,
     Search.BREADTH_FIRST_SEARCH: BreadthFirstSearch.search,
     Search.GREEDY_BEST_FIRST_SEARCH: GreedyBestFirstSearch.search,
-    Search.DEPTH_FIRST_SEARCH: DepthFirstSearch.search
+    Search.DEPTH_FIRST_SEARCH: DepthFirstSearch.search,
+    Search.JUMP_POINT_SEARCH: JumpPointSearch.search,
+    Search.BIDIRECTIONAL_BREADTH_FIRST_SEARCH: BidirectionalBreadthFirstSearch.search,
+    Search.BIDIRECTIONAL_ASTAR_SEARCH: BidirectionalAStarSearch.search,
+    Search.HIERARCHICAL_SEARCH: HierarchicalSearch.search,
+    Search.LIFELONG_PLANNING_ASTAR_SEARCH: LifelongPlanningAStarSearch.search,
+    Search.WEIGHTED_ASTAR_SEARCH: WeightedAStarSearch.search,
+    Search.ANYTIME_REPAIRING_ASTAR_SEARCH: AnytimeRepairingAStarSearch.search,
+}
+
+STREAM: dict[Search, StreamFunction] = {
+    Search.ASTAR_SEARCH: AStarSearch.stream,
+    Search.DIJKSRAS_SEARCH: DijkstrasSearch.stream,
+    Search.BREADTH_FIRST_SEARCH: BreadthFirstSearch.stream,
+    Search.GREEDY_BEST_FIRST_SEARCH: GreedyBestFirstSearch.stream,
+    Search.DEPTH_FIRST_SEARCH: DepthFirstSearch.stream,
+    Search.JUMP_POINT_SEARCH: JumpPointSearch.stream,
+    Search.BIDIRECTIONAL_BREADTH_FIRST_SEARCH: BidirectionalBreadthFirstSearch.stream,
+    Search.BIDIRECTIONAL_ASTAR_SEARCH: BidirectionalAStarSearch.stream,
+    Search.HIERARCHICAL_SEARCH: HierarchicalSearch.stream,
+    Search.LIFELONG_PLANNING_ASTAR_SEARCH: LifelongPlanningAStarSearch.stream,
+    Search.WEIGHTED_ASTAR_SEARCH: WeightedAStarSearch.stream,
+    Search.ANYTIME_REPAIRING_ASTAR_SEARCH: AnytimeRepairingAStarSearch.stream,
 }
 
 class PathFinder:
@@ -26,11 +71,326 @@ class PathFinder:
     def find_path(
         grid: Grid,
         search_type: Search,
+        budget: Budget | None = None,
+        cache: SolutionCache | None = None,
+        **options: Any,
     ) -> Solution:
+        """Find a path with a search algorithm and time it
+
+        Args:
+            grid (Grid): Grid of points
+            search_type (Search): Search algorithm
+            budget (Budget, optional): Time, expansion and frontier limits
+                and cancellation token. If one is hit, a NoSolution with
+                its `reason` set is returned. Limits are checked between
+                expansions, so setup before the first one, like building
+                an HPA* hierarchy, isn't cut short. Defaults to None.
+            cache (SolutionCache, optional): Cache to answer the query from
+                and store its solution in. Hits are copies marked `cached`,
+                timed by the lookup. Searches given options other than
+                `buffers` bypass it. Defaults to None.
+            **options: Extra keyword arguments for the search
+
+        Returns:
+            Solution: Solution found
+        """
         start_time = time.perf_counter()
-        solution = SEARCH[search_type](grid)
+        solution = _cached_search(grid, search_type, budget, cache, options)
         time_taken = (time.perf_counter() - start_time) * 1000
         solution.time = time_taken
         return solution
 
+    @staticmethod
+    def stream_path(
+        grid: Grid,
+        search_type: Search,
+        **options: Any,
+    ) -> Iterator[SearchEvent]:
+        """Run a search lazily, yielding its events as they happen
+
+        Nothing runs until the first event is pulled, and the search only
+        advances as far as its consumer reads. Expansions are not kept, so
+        memory stays bounded by the search state itself.
+
+        Args:
+            grid (Grid): Grid of points
+            search_type (Search): Search algorithm
+            **options: Extra keyword arguments for the search, such as
+                `pushes=True` to also receive frontier pushes
+
+        Returns:
+            Iterator[SearchEvent]: Events, ending with Event.FINISHED
+        """
+        return STREAM[search_type](grid, **options)
+
+    @staticmethod
+    def distance_field(grid: Grid, reverse: bool = True) -> DistanceField:
+        """Compute distances and next-step directions for every cell
+
+        With `reverse`, the field is rooted at the goal: following the
+        directions from any cell leads there along a shortest path, so
+        one field serves every unit heading to the same goal.
+
+        Args:
+            grid (Grid): Grid of points
+            reverse (bool, optional): Root the field at the goal instead of
+                the start. Defaults to True.
+
+        Returns:
+            DistanceField: Distance and direction field
+        """
+        start_time = time.perf_counter()
+        field = DijkstrasSearch.distance_field(grid, reverse=reverse)
+        field.time = (time.perf_counter() - start_time) * 1000
+        return field
+
+    @staticmethod
+    def path_tree(grid: Grid, reverse: bool = True) -> PathTree:
+        """Build a shortest-path tree rooted at one endpoint, to answer
+        queries while the other endpoint is dragged around
+
+        Args:
+            grid (Grid): Grid of points
+            reverse (bool, optional): Root the tree at the goal, for a
+                moving start. Otherwise root it at the start, for a moving
+                goal. Defaults to True.
+
+        Returns:
+            PathTree: Shortest-path tree
+        """
+        # Build over plain costs, with the endpoints counted as cells of
+        # cost 1, so the tree survives an endpoint moving off a cell
+        tree_grid = grid.with_plain_endpoints()
+
+        field = PathFinder.distance_field(tree_grid, reverse=reverse)
+        return PathTree(field, tree_grid.costs)
+
+    @staticmethod
+    def build_landmarks(grid: Grid, count: int = 8) -> Landmarks:
+        """Pick landmarks and precompute their distance tables (ALT)
+
+        Landmarks are chosen by farthest-point selection: each new one is
+        the reachable cell farthest from every landmark picked so far.
+        Pass the result as `landmarks=` to A* or Greedy Best First Search
+        to tighten their heuristic on every later query on this grid.
+
+        Args:
+            grid (Grid): Grid of points
+            count (int, optional): Number of landmarks. Defaults to 8.
+
+        Returns:
+            Landmarks: Landmark distance tables
+        """
+        start_time = time.perf_counter()
+
+        landmarks: list[tuple[int, int]] = []
+        to_landmark = []
+        from_landmark = []
+
+        # Distance from the nearest landmark, seeded from the start so the
+        # first landmark is the cell farthest away from it
+        nearest = DijkstrasSearch.distance_field(grid, reverse=False).distances
+
+        for _ in range(count):
+            candidate, farthest = -1, 0
+            for index, distance in enumerate(nearest):
+                if distance != INFINITY and distance > farthest:
+                    candidate, farthest = index, distance
+
+            if candidate < 0:
+                break
+
+            pos = grid.position(candidate)
+            landmark_grid = grid.with_endpoints(pos, pos)
+            to_table = DijkstrasSearch.distance_field(
+                landmark_grid, reverse=True).distances
+            from_table = DijkstrasSearch.distance_field(
+                landmark_grid, reverse=False).distances
+
+            landmarks.append(pos)
+            to_landmark.append(to_table)
+            from_landmark.append(from_table)
+
+            nearest = array("i", map(min, nearest, from_table))
+
+        return Landmarks(
+            size=grid.size,
+            landmarks=landmarks,
+            to_landmark=to_landmark,
+            from_landmark=from_landmark,
+            time=(time.perf_counter() - start_time) * 1000
+        )
+
+    @staticmethod
+    def build_hierarchy(grid: Grid, cluster_size: int = 10) -> HierarchicalGraph:
+        """Build the abstract cluster graph used by HPA*
+
+        Pass the result as `hierarchy=` to Hierarchical Search. Report
+        edited cells with `mark_dirty` and the next search only rebuilds
+        the clusters around them.
+
+        Args:
+            grid (Grid): Grid of points
+            cluster_size (int, optional): Width and height of a cluster in
+                cells. Defaults to 10.
+
+        Returns:
+            HierarchicalGraph: Abstract graph of the grid
+        """
+        return HierarchicalGraph(grid, cluster_size=cluster_size)
+
+    @staticmethod
+    def find_paths(
+        grid: Grid,
+        queries: list[Query],
+        search_type: Search,
+        workers: int = 1,
+        budget: Budget | None = None,
+        cache: SolutionCache | None = None,
+        **options: Any,
+    ) -> list[Solution]:
+        """Answer many (start, goal) queries on the same grid
+
+        The grid is compiled once and every query reuses the same scratch
+        buffers. With more than one worker, the queries are split into
+        contiguous chunks that are solved in a process pool.
+
+        Args:
+            grid (Grid): Grid of points
+            queries (list[Query]): (start, goal) pairs
+            search_type (Search): Search algorithm
+            workers (int, optional): Number of worker processes. Defaults to 1.
+            budget (Budget, optional): Limits of every single query. Its
+                token can only cancel the queries of a single worker run.
+                Defaults to None.
+            cache (SolutionCache, optional): Cache of solutions, only used
+                with a single worker. Defaults to None.
+            **options: Extra keyword arguments for the search, such as
+                `landmarks` for A* Search
+
+        Returns:
+            list[Solution]: One solution per query, in query order
+        """
+        if workers <= 1 or len(queries) < 2:
+            return _solve_batch(
+                grid, queries, search_type, options, budget, cache)
+
+        chunk_size = -(-len(queries) // workers)
+        chunks = [queries[i:i + chunk_size]
+                  for i in range(0, len(queries), chunk_size)]
+
+        solutions = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch in executor.map(
+                _solve_batch,
+                repeat(grid),
+                chunks,
+                repeat(search_type),
+                repeat(options),
+                repeat(budget),
+            ):
+                solutions.extend(batch)
+
+        return solutions
+
+
+def _solve_batch(
+    grid: Grid,
+    queries: list[Query],
+    search_type: Search,
+    options: dict[str, Any],
+    budget: Budget | None = None,
+    cache: SolutionCache | None = None,
+) -> list[Solution]:
+    """Solve queries one after another, sharing scratch buffers
+
+    Args:
+        grid (Grid): Grid of points
+        queries (list[Query]): (start, goal) pairs
+        search_type (Search): Search algorithm
+        options (dict[str, Any]): Extra keyword arguments for the search
+        budget (Budget, optional): Limits of every query. Defaults to None.
+        cache (SolutionCache, optional): Cache of solutions. Defaults to None.
+
+    Returns:
+        list[Solution]: One solution per query
+    """
+    buffers = SearchBuffers(grid.size)
+    options = {**options, "buffers": buffers}
+
+    # Raise the endpoints to cost 1 once, so that retargeting the grid
+    # for every query doesn't copy the costs
+    grid = grid.with_plain_endpoints()
+
+    solutions = []
+    for start, end in queries:
+        start_time = time.perf_counter()
+        solution = _cached_search(grid.with_endpoints(start, end),
+                                  search_type, budget, cache, options)
+        solution.time = (time.perf_counter() - start_time) * 1000
+        solutions.append(solution)
+
+    return solutions
+
+
+def _cached_search(
+    grid: Grid,
+    search_type: Search,
+    budget: Budget | None,
+    cache: SolutionCache | None,
+    options: dict[str, Any],
+) -> Solution:
+    """Answer a query from the cache, or run the search and cache it
+
+    Only complete solutions of searches without extra state are cached.
+    Hits are returned as copies, so their time can be set freely.
+
+    Args:
+        grid (Grid): Grid of points
+        search_type (Search): Search algorithm
+        budget (Budget | None): Limits of the search
+        cache (SolutionCache | None): Cache of solutions
+        options (dict[str, Any]): Extra keyword arguments for the search
+
+    Returns:
+        Solution: Solution found
+    """
+    if cache is None or set(options) - {"buffers"}:
+        return _search(grid, search_type, budget, options)
+
+    solution = cache.get(grid, search_type)
+    if solution is not None:
+        solution = copy.copy(solution)
+        solution.cached = True
+        return solution
+
+    solution = _search(grid, search_type, budget, options)
+    if solution.reason is None:
+        cache.put(grid, search_type, solution)
+
+    return solution
+
+
+def _search(
+    grid: Grid,
+    search_type: Search,
+    budget: Budget | None,
+    options: dict[str, Any],
+) -> Solution:
+    """Run a search, through its stream if it has a budget to respect
+
+    Args:
+        grid (Grid): Grid of points
+        search_type (Search): Search algorithm
+        budget (Budget | None): Limits of the search
+        options (dict[str, Any]): Extra keyword arguments for the search
+
+    Returns:
+        Solution: Solution found
+    """
+    if budget is None:
+        return SEARCH[search_type](grid, **options)
 
+    events = STREAM[search_type](
+        grid, pushes=budget.max_frontier is not None, **options)
+    return BasicSearch.collect(grid, events, budget)
@@ -0,0 +1,113 @@
+import time
+from enum import Enum
+
+from .events import Event, SearchEvent
+
+
+class StopReason(Enum):
+    """Why a search stopped before it finished"""
+
+    DEADLINE = "DEADLINE"
+    EXPANSIONS = "EXPANSIONS"
+    FRONTIER = "FRONTIER"
+    CANCELLED = "CANCELLED"
+
+
+class CancellationToken:
+    """Flag that asks the searches it is passed to to stop
+
+    Searches check it between expansions, so `cancel` can be called from
+    a UI callback, another thread or between the queries of a batch. It
+    is not shared with worker processes.
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Ask every search using this token to stop"""
+        self.cancelled = True
+
+    def __repr__(self) -> str:
+        return f"CancellationToken(cancelled={self.cancelled})"
+
+
+class Budget:
+    """Model the limits of a single search
+
+    Every limit is optional. The time limit starts counting when the
+    search starts, so one budget can be reused for many queries.
+
+    Args:
+        time_limit (float, optional): Wall-clock limit in ms.
+        max_expansions (int, optional): Most cells to expand.
+        max_frontier (int, optional): Most cells to hold in the frontier
+            at once.
+        token (CancellationToken, optional): Token to stop the search
+            early.
+    """
+
+    def __init__(
+        self,
+        time_limit: float | None = None,
+        max_expansions: int | None = None,
+        max_frontier: int | None = None,
+        token: CancellationToken | None = None
+    ) -> None:
+        self.time_limit = time_limit
+        self.max_expansions = max_expansions
+        self.max_frontier = max_frontier
+        self.token = token
+
+    def deadline(self) -> float | None:
+        """Get the deadline of a search starting now
+
+        Returns:
+            float | None: `time.perf_counter()` value to stop at, None if
+                there is no time limit
+        """
+        if self.time_limit is None:
+            return None
+
+        return time.perf_counter() + self.time_limit / 1000
+
+    def check(
+        self,
+        event: SearchEvent,
+        expansions: int,
+        deadline: float | None
+    ) -> StopReason | None:
+        """Check whether a search may go on with its next event
+
+        Args:
+            event (SearchEvent): Next event of the search
+            expansions (int): Cells expanded before this event
+            deadline (float | None): Deadline from `deadline`
+
+        Returns:
+            StopReason | None: Why the search must stop, None if it may
+                go on
+        """
+        kind = event[0]
+        if kind is Event.FINISHED or kind is Event.IMPROVED:
+            return None
+
+        if self.token is not None and self.token.cancelled:
+            return StopReason.CANCELLED
+
+        if deadline is not None and time.perf_counter() > deadline:
+            return StopReason.DEADLINE
+
+        if kind is Event.EXPANDED and self.max_expansions is not None \
+                and expansions >= self.max_expansions:
+            return StopReason.EXPANSIONS
+
+        if kind is Event.PUSHED and self.max_frontier is not None \
+                and event[2] > self.max_frontier:
+            return StopReason.FRONTIER
+
+        return None
+
+    def __repr__(self) -> str:
+        return f"Budget({self.time_limit}ms, {self.max_expansions} " \
+            f"expansions, {self.max_frontier} frontier)"
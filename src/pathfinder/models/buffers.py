@@ -0,0 +1,72 @@
+from array import array
+
+# g-score of cells that haven't been reached yet
+INFINITY = 2 ** 31 - 1
+
+
+class SearchBuffers:
+    """Scratch arrays a search keeps its per-query state in
+
+    One instance can be reused by consecutive searches over grids of the
+    same size. Searches record every cell they write to in `touched`, so
+    `reset` only has to restore those cells instead of reallocating
+    arrays the size of the grid.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.parents = array("i", [-1]) * size
+        self.g_scores = array("i", [INFINITY]) * size
+        self.explored = bytearray(size)
+        self.touched: list[int] = []
+
+        # Buffers for the backward half of a bidirectional search
+        self.reverse: SearchBuffers | None = None
+
+    def reset(self) -> None:
+        """Restore every touched cell to its initial state"""
+        parents = self.parents
+        g_scores = self.g_scores
+        explored = self.explored
+
+        for index in self.touched:
+            parents[index] = -1
+            g_scores[index] = INFINITY
+            explored[index] = 0
+
+        self.touched.clear()
+
+        if self.reverse is not None:
+            self.reverse.reset()
+
+    def get_reverse(self) -> "SearchBuffers":
+        """Get the buffers for the backward half of a bidirectional
+        search, creating them on first use
+
+        Returns:
+            SearchBuffers: Backward search buffers
+        """
+        if self.reverse is None:
+            self.reverse = SearchBuffers(self.size)
+
+        return self.reverse
+
+    @staticmethod
+    def prepare(size: int, buffers: "SearchBuffers | None") -> "SearchBuffers":
+        """Get clean buffers for a search over a grid
+
+        Args:
+            size (int): Number of cells in the grid
+            buffers (SearchBuffers | None): Buffers to reuse, if any
+
+        Returns:
+            SearchBuffers: Buffers ready for a new search
+        """
+        if buffers is None or buffers.size != size:
+            return SearchBuffers(size)
+
+        buffers.reset()
+        return buffers
+
+    def __repr__(self) -> str:
+        return f"SearchBuffers({self.size}, touched={len(self.touched)})"
@@ -0,0 +1,72 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterator
+
+
+class Cells(Sequence):
+    """Model a sequence of cells stored as flat cell indices
+
+    Only the `array("i")` of indices is kept, which takes 4 bytes per cell
+    instead of a (row, col) tuple. The cells still read as (row, col)
+    tuples, each one built when it is accessed.
+    """
+
+    def __init__(self, indices: array | None = None, width: int = 1) -> None:
+        self.indices = array("i") if indices is None else indices
+        self.width = width
+
+    @staticmethod
+    def from_positions(
+        positions: list[tuple[int, int]],
+        width: int
+    ) -> "Cells":
+        """Compact a list of positions
+
+        Args:
+            positions (list[tuple[int, int]]): (row, col) positions
+            width (int): Width of the grid the positions are in
+
+        Returns:
+            Cells: Cells at the positions
+        """
+        return Cells(array("i", [row * width + col for row, col in positions]),
+                     width)
+
+    def to_numpy(self) -> Any:
+        """Get the flat indices as a NumPy array, without copying them
+
+        `numpy.divmod(cells.to_numpy(), cells.width)` gives the rows and
+        columns.
+
+        Raises:
+            ImportError: NumPy isn't installed
+
+        Returns:
+            numpy.ndarray: Read-write view of the indices
+        """
+        import numpy
+
+        return numpy.frombuffer(self.indices, dtype=f"i{self.indices.itemsize}")
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return Cells(self.indices[key], self.width)
+
+        return divmod(self.indices[key], self.width)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        width = self.width
+        for index in self.indices:
+            yield divmod(index, width)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Cells):
+            return self.width == other.width and self.indices == other.indices
+
+        return list(self) == other
+
+    def __repr__(self) -> str:
+        return f"Cells({len(self)} cells, width={self.width})"
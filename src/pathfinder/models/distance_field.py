@@ -0,0 +1,89 @@
+from array import array
+
+from .buffers import INFINITY
+
+# Direction codes stored in `DistanceField.directions`, with the matching
+# (row, column) steps. NO_DIRECTION marks the root and unreachable cells.
+DIRECTIONS: tuple[str, ...] = ("up", "down", "left", "right")
+STEPS: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+NO_DIRECTION = 255
+
+
+class DistanceField:
+    """Model the distances from every cell of a grid to (or from) one root
+
+    `distances` holds the path cost for every cell (INFINITY if it can't
+    be reached). `directions` holds the code of the step each cell takes
+    towards the root, so following it from any cell traces a shortest
+    path. For a reverse field rooted at the goal this is a flow field.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        root: tuple[int, int],
+        distances: array,
+        directions: bytearray,
+        reverse: bool = True,
+        time: float = 0.0
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.root = root
+        self.distances = distances
+        self.directions = directions
+        self.reverse = reverse
+        self.time = time
+
+    def distance(self, pos: tuple[int, int]) -> int | None:
+        """Get the path cost between a cell and the root
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            int | None: Path cost, None if the cell can't be reached
+        """
+        distance = self.distances[pos[0] * self.width + pos[1]]
+        return None if distance == INFINITY else distance
+
+    def next_step(self, pos: tuple[int, int]) -> tuple[int, int] | None:
+        """Get the next cell on a shortest path towards the root
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            tuple[int, int] | None: Next cell, None at the root or if
+                the cell can't be reached
+        """
+        code = self.directions[pos[0] * self.width + pos[1]]
+        if code == NO_DIRECTION:
+            return None
+
+        dr, dc = STEPS[code]
+        return (pos[0] + dr, pos[1] + dc)
+
+    def trace(self, pos: tuple[int, int]) -> list[tuple[int, int]]:
+        """Follow the field from a cell to the root
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            list[tuple[int, int]]: Cells from `pos` to the root, empty if
+                the root can't be reached
+        """
+        if self.distance(pos) is None:
+            return []
+
+        path = [pos]
+        while (step := self.next_step(path[-1])) is not None:
+            path.append(step)
+
+        return path
+
+    def __repr__(self) -> str:
+        return f"DistanceField({self.width}x{self.height}, {self.root}, " \
+            f"reverse={self.reverse}, {self.time})"
@@ -0,0 +1,28 @@
+from enum import Enum
+
+
+class Event(Enum):
+    """Kinds of events yielded by streaming searches
+
+    Events are tuples that start with their kind:
+        (Event.EXPANDED, index): a cell was expanded
+        (Event.PUSHED, index, frontier_size): a cell was added to the
+            frontier or moved up in it. Only yielded when the stream is
+            asked for pushes.
+        (Event.IMPROVED, path, path_cost, bound): a path was found whose
+            cost is at most `bound` times the optimal cost. Yielded by
+            searches that don't guarantee optimal paths, anytime searches
+            yield one for every better path or tighter bound.
+        (Event.FINISHED, path, path_cost): the search is over. Always the
+            last event, `path` is Cells, empty if there is no path.
+
+    Cells are given by their flat index, row * width + col.
+    """
+
+    EXPANDED = "EXPANDED"
+    PUSHED = "PUSHED"
+    IMPROVED = "IMPROVED"
+    FINISHED = "FINISHED"
+
+
+SearchEvent = tuple
@@ -1,32 +1,39 @@
-from heapq import heappush, heappop 
 from collections import deque
 
-from .node import Node 
+# Most buckets a BucketFrontier is made with, larger priority steps use
+# the heap
+MAX_BUCKETS = 256
+
 
 class Frontier: 
-    """Model a frontier for managing nodes"""
+    """Model a frontier for managing states (flat cell indices)"""
 
     def __init__(self) -> None:
-        self.frontier: list[Node] = []
+        self.frontier: list[int] = []
+
+        # States currently in the frontier, kept in sync with add and
+        # remove so membership checks don't scan the whole frontier
+        self.states: set[int] = set()
     
-    def add(self, node: Node) -> None:
-        """Add a new node to the frontier
+    def add(self, state: int) -> None:
+        """Add a new state to the frontier
         
         Args:
-            node (Node): Maze node to add. 
+            state (int): Cell index to add. 
         """
-        self.frontier.append(node)
+        self.frontier.append(state)
+        self.states.add(state)
     
-    def contains_state(self, state: tuple[int, int]) -> bool:
+    def contains_state(self, state: int) -> bool:
         """Check if a state exists in the frontier
 
         Args:
-            state (tuple[int, int]): Position of a node
+            state (int): Cell index
 
         Returns:
             bool: Whether the provided state exists in the frontier.
         """
-        return any(node.state == state for node in self.frontier)
+        return state in self.states
 
     def is_empty(self) -> bool:
         """Check if the frontier is empty
@@ -36,78 +43,300 @@ class Frontier:
         """
         return len(self.frontier) == 0
 
+    def __len__(self) -> int:
+        return len(self.frontier)
+
 
 class PriorityQueueFrontier(Frontier):
+    """Indexed binary min-heap with decrease-key
+
+    Heap entries are `[priority, tiebreak, order, state]` lists. The
+    insertion order is unique, so it settles every remaining tie.
+    `positions` maps every state in the heap to its entry's index,
+    which keeps `get` and decrease-key O(1) and O(log n) respectively.
+    """
+
     def __init__(self) -> None:
-        self.frontier: list[tuple[int, Node]] = [] 
+        self.frontier: list[list] = []
+        self.positions: dict[int, int] = {}
+        self.order = 0
     
-    def add(self, node: Node, priority: int = 0) -> None:
-        """Add a new node to the frontier
+    def add(self, state: int, priority: int = 0, tiebreak: int = 0) -> None:
+        """Add a new state to the frontier. If the state is already in
+        the frontier, its priority is lowered instead (decrease-key).
         
         Args:
-            node (AStarNode): Maze node to add. 
-            priority (int, optional): Node priority. Defaults to 0. 
+            state (int): Cell index to add. 
+            priority (int, optional): State priority. Defaults to 0. 
+            tiebreak (int, optional): Secondary priority for states with
+                equal priority. Defaults to 0.
         """
-        heappush(self.frontier, (priority, node))
+        idx = self.positions.get(state)
+
+        if idx is not None:
+            entry = self.frontier[idx]
+            if priority > entry[0] \
+                    or (priority == entry[0] and tiebreak >= entry[1]):
+                return
+
+            entry[0], entry[1] = priority, tiebreak
+            self._sift_up(idx)
+            return
+
+        self.frontier.append([priority, tiebreak, self.order, state])
+        self.positions[state] = len(self.frontier) - 1
+        self.order += 1
+        self._sift_up(len(self.frontier) - 1)
     
-    def remove(self) -> Node:
-        """Remove a node from the frontier
+    def remove(self) -> int:
+        """Remove a state from the frontier
 
         Returns:
-            AStarNode: Node with lowest f-cost
+            int: State with the lowest priority
+        """
+        if self.is_empty():
+            raise Exception("Empty PriorityQueueFrontier")
+
+        heap = self.frontier
+        entry = heap[0]
+        last = heap.pop()
+
+        if heap:
+            heap[0] = last
+            self.positions[last[3]] = 0
+            self._sift_down(0)
+
+        del self.positions[entry[3]]
+        return entry[3]
+
+    def discard(self, state: int) -> None:
+        """Remove a state from anywhere in the frontier, if present
+
+        Args:
+            state (int): Cell index
         """
-        _, node = heappop(self.frontier)
-        return node
+        idx = self.positions.pop(state, None)
+        if idx is None:
+            return
+
+        heap = self.frontier
+        last = heap.pop()
+
+        if idx < len(heap):
+            heap[idx] = last
+            self.positions[last[3]] = idx
+            self._sift_up(idx)
+            self._sift_down(self.positions[last[3]])
 
-    def get(self, state: tuple[int, int]) -> Node | None:
-        """Check if node in frontier. Return node if present, 
+    def get(self, state: int) -> int | None:
+        """Check if state in frontier. Return its priority if present, 
         otherwise, return None. 
 
         Args:
-            state (tuple[int, int]): state (position) of the node 
+            state (int): Cell index 
         
         Returns:
-            Node: required node
+            int: Priority of the state
+        """
+        idx = self.positions.get(state)
+        return None if idx is None else self.frontier[idx][0]
+
+    def contains_state(self, state: int) -> bool:
+        return state in self.positions
+
+    def _sift_up(self, idx: int) -> None:
+        """Move an entry towards the root until the heap is ordered"""
+        heap = self.frontier
+        positions = self.positions
+        entry = heap[idx]
+
+        while idx > 0:
+            parent_idx = (idx - 1) >> 1
+            parent = heap[parent_idx]
+            if not entry < parent:
+                break
+
+            heap[idx] = parent
+            positions[parent[3]] = idx
+            idx = parent_idx
+
+        heap[idx] = entry
+        positions[entry[3]] = idx
+
+    def _sift_down(self, idx: int) -> None:
+        """Move an entry towards the leaves until the heap is ordered"""
+        heap = self.frontier
+        positions = self.positions
+        size = len(heap)
+        entry = heap[idx]
+
+        while True:
+            child_idx = 2 * idx + 1
+            if child_idx >= size:
+                break
+
+            right_idx = child_idx + 1
+            if right_idx < size and heap[right_idx] < heap[child_idx]:
+                child_idx = right_idx
+
+            child = heap[child_idx]
+            if not child < entry:
+                break
+
+            heap[idx] = child
+            positions[child[3]] = idx
+            idx = child_idx
+
+        heap[idx] = entry
+        positions[entry[3]] = idx
+
+
+class BucketFrontier(Frontier):
+    """Circular bucket queue (Dial's algorithm) for small integer priorities
+
+    It only works for monotone searches: no state may be added with a
+    priority below the last one removed, or more than `max_step` above
+    it. Those priorities all fit in `max_step + 1` buckets, so adding and
+    removing are O(1) instead of the heap's O(log n).
+
+    Decrease-key leaves the old entry in its bucket. `priorities` holds
+    the current priority of every state in the frontier, and entries that
+    disagree with it are skipped when they are reached. Ties are removed
+    last in, first out, and the tiebreak argument of `add` is ignored.
+
+    Args:
+        max_step (int): Largest amount a priority can rise by between the
+            state removed and the states added after it
+    """
+
+    def __init__(self, max_step: int) -> None:
+        self.buckets: list[list[int]] = [[] for _ in range(max_step + 1)]
+        self.priorities: dict[int, int] = {}
+
+        # Priority of the bucket being emptied, set by the first state
+        self.cursor: int | None = None
+
+    def add(self, state: int, priority: int = 0, tiebreak: int = 0) -> None:
+        """Add a new state to the frontier. If the state is already in
+        the frontier, its priority is lowered instead (decrease-key).
+
+        Args:
+            state (int): Cell index to add.
+            priority (int, optional): State priority. Defaults to 0.
+            tiebreak (int, optional): Ignored, accepted so the frontier
+                can replace a PriorityQueueFrontier. Defaults to 0.
+
+        Raises:
+            ValueError: Priority is outside the window of the buckets
+        """
+        current = self.priorities.get(state)
+        if current is not None and priority >= current:
+            return
+
+        if self.cursor is None:
+            self.cursor = priority
+        elif not self.cursor <= priority < self.cursor + len(self.buckets):
+            raise ValueError(
+                f"Priority {priority} is outside the bucket window "
+                f"[{self.cursor}, {self.cursor + len(self.buckets)})")
+
+        self.priorities[state] = priority
+        self.buckets[priority % len(self.buckets)].append(state)
+
+    def remove(self) -> int:
+        """Remove a state from the frontier
+
+        Raises:
+            Exception: Empty Frontier
+
+        Returns:
+            int: State with the lowest priority
         """
-        for _, node in self.frontier:
-            if node.state == state:
-                return node 
-            
-        return None
+        if self.is_empty():
+            raise Exception("Empty BucketFrontier")
+
+        buckets = self.buckets
+        priorities = self.priorities
+        count = len(buckets)
+
+        while True:
+            bucket = buckets[self.cursor % count]
+            while bucket:
+                state = bucket.pop()
+                if priorities.get(state) == self.cursor:
+                    del priorities[state]
+                    return state
+
+            self.cursor += 1
+
+    def discard(self, state: int) -> None:
+        """Remove a state from anywhere in the frontier, if present
+
+        Args:
+            state (int): Cell index
+        """
+        self.priorities.pop(state, None)
+
+    def get(self, state: int) -> int | None:
+        """Check if state in frontier. Return its priority if present,
+        otherwise, return None.
+
+        Args:
+            state (int): Cell index
+
+        Returns:
+            int: Priority of the state
+        """
+        return self.priorities.get(state)
+
+    def contains_state(self, state: int) -> bool:
+        return state in self.priorities
+
+    def is_empty(self) -> bool:
+        return not self.priorities
+
+    def __len__(self) -> int:
+        return len(self.priorities)
+
 
 class StackFrontier(Frontier):
-    def remove(self) -> Node:
+    def remove(self) -> int:
         """Remove element from the stack
 
         Raises:
             Exception: Empty Frontier
         
         Returns:
-            Node: Cell (Node) in the matrix
+            int: Cell index in the grid
         """
         if self.is_empty():
             raise Exception("Empty StackFrontier")
         else:
-            return self.frontier.pop()
+            state = self.frontier.pop()
+            self.states.discard(state)
+            return state
 
 
 class QueueFrontier(Frontier):
     def __init__(self) -> None:
         self.frontier = deque()
+        self.states = set()
         
-    def remove(self) -> Node:
+    def remove(self) -> int:
         """Remove element from the queue
 
         Raises:
             Exception: Empty Frontier
         
         Returns:
-            Node: Cell (Node) in the matrix
+            int: Cell index in the grid
         """
         if self.is_empty():
             raise Exception("Empty QueueFrontier")
         else:
-            return self.frontier.popleft()
+            state = self.frontier.popleft()
+            self.states.discard(state)
+            return state
 
 
 
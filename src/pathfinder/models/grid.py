@@ -1,4 +1,56 @@
-from .node import Node 
+import copy
+from array import array
+
+from .node import Node
+
+
+_MASK = (1 << 64) - 1
+
+# Zobrist pieces besides the cost of an open cell
+WALL = -1
+START = -2
+GOAL = -3
+
+
+def zobrist_key(index: int, piece: int) -> int:
+    """Get the 64-bit Zobrist key of a piece on a cell
+
+    Keys are derived from the cell and piece with the SplitMix64 mixer
+    instead of being drawn into a table, so they take no memory and are
+    the same in every process.
+
+    Args:
+        index (int): Index of the cell
+        piece (int): WALL, START, GOAL or the cost of an open cell
+
+    Returns:
+        int: Key of the piece on the cell
+    """
+    x = (index * 0x9E3779B97F4A7C15 + piece * 0xD1B54A32D192ED03) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _cell_key(index: int, wall: bool, cost: int) -> int:
+    """Get the Zobrist key of a cell's content
+
+    Open cells of cost 1 are the default and count for nothing, so a
+    cell's key can be swapped in and out with XOR.
+
+    Args:
+        index (int): Index of the cell
+        wall (bool): Whether the cell is a wall
+        cost (int): Cost of moving into the cell
+
+    Returns:
+        int: Key of the cell
+    """
+    if wall:
+        return zobrist_key(index, WALL)
+
+    return 0 if cost == 1 else zobrist_key(index, cost)
+
 
 class Grid:
     def __init__(
@@ -7,19 +59,247 @@ class Grid:
         start: tuple[int, int],
         end: tuple[int, int]
     ) -> None:
-        self.grid = grid 
-        self.start = start 
+        self.grid = grid
+        self.start = start
         self.end = end
 
         # calculate grid dimensions
         self.height = len(grid)
         self.width = max(len(row) for row in grid)
-    
+        self.size = self.width * self.height
+
+        # Compile the node matrix into flat arrays indexed by
+        # `row * width + col`. Missing cells of ragged rows are walls.
+        self.walls = bytearray(b"\x01") * self.size
+        self.costs = array("i", bytes(4 * self.size))
+
+        # Number of open cells for every cost, to know the highest cost
+        # without scanning the grid after an update
+        self.cost_counts: dict[int, int] = {}
+
+        # XOR of the Zobrist keys of every cell, kept up to date by
+        # `update_cell`. See `fingerprint`. It is held in an array of one
+        # so that grids made by `with_endpoints` share it like the costs.
+        self.content_hash = array("Q", [0])
+        content_hash = 0
+
+        for r, row in enumerate(grid):
+            offset = r * self.width
+            for c, node in enumerate(row):
+                wall = node.value == "#"
+                if not wall:
+                    self.walls[offset + c] = 0
+                    self.cost_counts[node.cost] = \
+                        self.cost_counts.get(node.cost, 0) + 1
+                self.costs[offset + c] = node.cost
+
+                if wall or node.cost != 1:
+                    content_hash ^= _cell_key(offset + c, wall, node.cost)
+
+            for c in range(len(row), self.width):
+                content_hash ^= _cell_key(offset + c, True, 0)
+
+        self.content_hash[0] = content_hash
+
+    @property
+    def fingerprint(self) -> int:
+        """64-bit Zobrist fingerprint of the walls, costs, start and goal
+
+        Equal grids have equal fingerprints, and any edit through
+        `update_cell` or new endpoints changes it in O(1).
+        """
+        return self.content_hash[0] \
+            ^ zobrist_key(self.index(self.start), START) \
+            ^ zobrist_key(self.index(self.end), GOAL)
+
+    @property
+    def max_cost(self) -> int:
+        """Highest cost of an open cell"""
+        return max(self.cost_counts, default=0)
+
+    def update_cell(self, pos: tuple[int, int], wall: bool, cost: int) -> bool:
+        """Update one cell of the compiled arrays in place
+
+        This is for the owner of the grid between searches. Grids made by
+        `with_endpoints` share the arrays, `cost_counts` and the content
+        hash, so they see the update and their fingerprint follows it.
+        Grids that moved off a free endpoint have their own copies.
+
+        Args:
+            pos (tuple[int, int]): Cell position
+            wall (bool): Whether the cell is a wall
+            cost (int): Cost of moving into the cell
+
+        Returns:
+            bool: Whether the cell changed
+        """
+        index = self.index(pos)
+        if bool(self.walls[index]) == wall and self.costs[index] == cost:
+            return False
+
+        if not self.walls[index]:
+            old_cost = self.costs[index]
+            self.cost_counts[old_cost] -= 1
+            if not self.cost_counts[old_cost]:
+                del self.cost_counts[old_cost]
+
+        if not wall:
+            self.cost_counts[cost] = self.cost_counts.get(cost, 0) + 1
+
+        self.content_hash[0] ^= _cell_key(
+            index, bool(self.walls[index]), self.costs[index]) \
+            ^ _cell_key(index, wall, cost)
+
+        self.walls[index] = wall
+        self.costs[index] = cost
+        return True
+
+    def with_endpoints(
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int]
+    ) -> "Grid":
+        """Get a grid for another query on the same map
+
+        The compiled arrays, `cost_counts` and the content hash are
+        shared, not copied, so the grid sees later updates. The exception
+        is an endpoint of cost 0, like the compiled start, that the query
+        moves away from. It would be a free cell in the middle of the map,
+        so the new grid gets its own costs with that cell raised to 1.
+
+        Args:
+            start (tuple[int, int]): Start position
+            end (tuple[int, int]): End position
+
+        Returns:
+            Grid: Grid with the new endpoints
+        """
+        freed = [pos for pos in (self.start, self.end)
+                 if pos != start and self._is_free(pos)]
+
+        grid = self._with_plain_cells(freed) if freed else copy.copy(self)
+        grid.start = start
+        grid.end = end
+        return grid
+
+    def with_plain_endpoints(self) -> "Grid":
+        """Get a copy of the grid whose endpoints are cells of cost 1
+
+        Queries on the copy don't depend on where the endpoints were, and
+        `with_endpoints` can retarget it without copying. The costs are
+        copied, the walls are still shared.
+
+        Returns:
+            Grid: Grid with its own costs
+        """
+        return self._with_plain_cells(
+            [pos for pos in (self.start, self.end) if self._is_free(pos)])
+
+    def _is_free(self, pos: tuple[int, int]) -> bool:
+        """Check whether moving into an open cell costs nothing
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            bool: Whether the cell is open and of cost 0
+        """
+        return not self.walls[self.index(pos)] and self.get_cost(pos) < 1
+
+    def _with_plain_cells(self, cells: list[tuple[int, int]]) -> "Grid":
+        """Get a copy of the grid with its own costs, and some cells
+        raised to cost 1
+
+        Args:
+            cells (list[tuple[int, int]]): Positions of the cells to raise
+
+        Returns:
+            Grid: Grid with its own costs, `cost_counts` and content hash
+        """
+        grid = copy.copy(self)
+        grid.costs = array("i", self.costs)
+        grid.cost_counts = dict(self.cost_counts)
+        grid.content_hash = array("Q", self.content_hash)
+
+        for pos in cells:
+            grid.update_cell(pos, False, 1)
+
+        return grid
+
+    def index(self, pos: tuple[int, int]) -> int:
+        """Get the flat index of a cell
+
+        Args:
+            pos (tuple[int, int]): Cell position
+
+        Returns:
+            int: Index of the cell in the compiled arrays
+        """
+        return pos[0] * self.width + pos[1]
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Get the position of a cell from its flat index
+
+        Args:
+            index (int): Index of the cell in the compiled arrays
+
+        Returns:
+            tuple[int, int]: Cell position
+        """
+        return divmod(index, self.width)
+
     def get_node(self, pos: tuple[int, int]) -> Node:
         return self.grid[pos[0]][pos[1]]
 
     def get_cost(self, pos: tuple[int, int]) -> int:
-        return self.grid[pos[0]][pos[1]].cost
+        return self.costs[pos[0] * self.width + pos[1]]
+
+    def neighbors(self, index: int) -> list[int]:
+        """Determine the open neighbors of a cell by flat index
+
+        Neighbors are returned in up, down, left, right order.
+
+        Args:
+            index (int): Index of the cell
+
+        Returns:
+            list[int]: Indices of the neighboring cells that are not walls
+        """
+        width = self.width
+        walls = self.walls
+        col = index % width
+
+        result = []
+        if index >= width and not walls[index - width]:
+            result.append(index - width)
+        if index + width < self.size and not walls[index + width]:
+            result.append(index + width)
+        if col > 0 and not walls[index - 1]:
+            result.append(index - 1)
+        if col < width - 1 and not walls[index + 1]:
+            result.append(index + 1)
+
+        return result
+
+    def get_action(self, index: int, neighbor: int) -> str:
+        """Determine the action that moves from one cell to its neighbor
+
+        Args:
+            index (int): Index of the current cell
+            neighbor (int): Index of the neighboring cell
+
+        Returns:
+            str: Action name
+        """
+        delta = neighbor - index
+
+        if delta == self.width:
+            return "down"
+        elif delta == -self.width:
+            return "up"
+        elif delta == 1:
+            return "right"
+        return "left"
 
     def get_neighbors(self, pos: tuple[int, int]) -> dict[str, tuple[int, int]]:
         """Determine the neighbors of a cell
@@ -30,30 +310,20 @@ class Grid:
         Returns:
             dict[str, tuple[int, int]]: Action - Position mapper
         """
-        row, col = pos 
+        index = self.index(pos)
 
         # Map actions with resulting cell positions
-        action_pos_mapper = {
-            "up": (row - 1, col),
-            "down": (row + 1, col),
-            "left": (row, col - 1),
-            "right": (row, col + 1)
+        return {
+            self.get_action(index, neighbor): self.position(neighbor)
+            for neighbor in self.neighbors(index)
         }
 
-        # Determine the possible actions
-        possible_actions = {}
-
-        for action, (r, c) in action_pos_mapper.items():
-            if not (0 <= r < self.height and 0 <= c < self.width):
-                continue 
-                
-            if self.grid[r][c].value == '#':
-                continue 
-            
-            possible_actions[action] = (r, c) 
-        
-        return possible_actions
+    def __getstate__(self) -> dict:
+        # Searches only need the compiled arrays, so the node matrix
+        # is left out when a grid is sent to a worker process
+        state = self.__dict__.copy()
+        state["grid"] = None
+        return state
 
     def __repr__(self) -> str:
         return f"Grid([[...], ...], {self.start}, {self.end})"
-            
\ No newline at end of file
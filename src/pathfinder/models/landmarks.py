@@ -0,0 +1,67 @@
+from array import array
+from typing import Callable
+
+from .buffers import INFINITY
+
+Heuristic = Callable[[int], int]
+
+
+class Landmarks:
+    """Model precomputed landmark distance tables for the ALT heuristic
+
+    For every landmark L, `to_landmark[k][v]` is the path cost from cell v
+    to L and `from_landmark[k][v]` the path cost from L to v (INFINITY if
+    there is no path). By the triangle inequality, both
+    d(v, L) - d(goal, L) and d(L, goal) - d(L, v) are lower bounds on the
+    cost from v to the goal.
+
+    The tables are only valid for the grid they were built on.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        landmarks: list[tuple[int, int]],
+        to_landmark: list[array],
+        from_landmark: list[array],
+        time: float = 0.0
+    ) -> None:
+        self.size = size
+        self.landmarks = landmarks
+        self.to_landmark = to_landmark
+        self.from_landmark = from_landmark
+        self.time = time
+
+    def heuristic(self, goal: int) -> Heuristic:
+        """Get the landmark lower bound towards one goal
+
+        Args:
+            goal (int): Index of the goal cell
+
+        Returns:
+            Heuristic: Function from a cell index to a lower bound on its
+                remaining cost
+        """
+        tables = [
+            (to_table, from_table, to_table[goal], from_table[goal])
+            for to_table, from_table in zip(self.to_landmark, self.from_landmark)
+            if to_table[goal] != INFINITY and from_table[goal] != INFINITY
+        ]
+
+        def bound(index: int) -> int:
+            best = 0
+            for to_table, from_table, goal_to, goal_from in tables:
+                to_cost = to_table[index]
+                if to_cost != INFINITY and to_cost - goal_to > best:
+                    best = to_cost - goal_to
+
+                from_cost = from_table[index]
+                if from_cost != INFINITY and goal_from - from_cost > best:
+                    best = goal_from - from_cost
+
+            return best
+
+        return bound
+
+    def __repr__(self) -> str:
+        return f"Landmarks({self.landmarks}, {self.time})"
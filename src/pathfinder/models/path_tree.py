@@ -0,0 +1,97 @@
+from array import array
+
+from .buffers import INFINITY
+from .cells import Cells
+from .distance_field import DistanceField
+from .grid import Grid
+from .solution import NoSolution, Solution
+
+
+class PathTree:
+    """Model a cached shortest-path tree rooted at one fixed endpoint
+
+    While the other endpoint moves around, every new position is answered
+    by stepping onto its best neighbor and following the tree from there,
+    without searching again.
+
+    `costs` is the cost (-1 for walls) every cell had when the tree was
+    built, with the endpoints counted as plain cells of cost 1, which is
+    what they turn back into once an endpoint moves off them. The tree
+    stays valid as long as every cell still has that cost, so dragging an
+    endpoint across plain cells never rebuilds it.
+    """
+
+    def __init__(self, field: DistanceField, costs: array) -> None:
+        self.field = field
+        self.costs = costs
+
+    @property
+    def root(self) -> tuple[int, int]:
+        return self.field.root
+
+    @property
+    def reverse(self) -> bool:
+        return self.field.reverse
+
+    def holds(self, grid: Grid, pos: tuple[int, int]) -> bool:
+        """Check if the tree is still valid after a cell was edited
+
+        Args:
+            grid (Grid): The edited grid
+            pos (tuple[int, int]): Position of the edited cell
+
+        Returns:
+            bool: Whether the cell still has the cost the tree was built with
+        """
+        index = grid.index(pos)
+        cost = -1 if grid.walls[index] else max(grid.costs[index], 1)
+        return self.costs[index] == cost
+
+    def solve(self, grid: Grid) -> Solution:
+        """Find the shortest path between the root and the other endpoint
+        of a grid by walking the tree
+
+        Args:
+            grid (Grid): Grid of points, with the same root
+
+        Returns:
+            Solution: Solution found. Nothing is explored.
+        """
+        field = self.field
+        pos = grid.start if self.reverse else grid.end
+
+        if pos == self.root:
+            return Solution(path=Cells.from_positions([pos], grid.width),
+                            explored_states=Cells(width=grid.width))
+
+        # Pick the neighbor the moving endpoint steps on first
+        index = grid.index(pos)
+        best, best_distance = -1, INFINITY
+        for neighbor in grid.neighbors(index):
+            distance = field.distances[neighbor]
+            if distance == INFINITY:
+                continue
+
+            if self.reverse:
+                distance += grid.costs[neighbor]
+
+            if distance < best_distance:
+                best, best_distance = neighbor, distance
+
+        if best < 0:
+            return NoSolution(Cells(width=grid.width),
+                              explored_states=Cells(width=grid.width))
+
+        path = [pos] + field.trace(grid.position(best))
+        if not self.reverse:
+            path.reverse()
+
+        path_cost = sum(grid.get_cost(cell) for cell in path[1:])
+
+        return Solution(path=Cells.from_positions(path, grid.width),
+                        explored_states=Cells(width=grid.width),
+                        path_cost=path_cost
+                        )
+
+    def __repr__(self) -> str:
+        return f"PathTree({self.root}, reverse={self.reverse})"
@@ -7,4 +7,11 @@ class Search(Enum):
     BREADTH_FIRST_SEARCH = "BFS"
     ASTAR_SEARCH = "A*"
     GREEDY_BEST_FIRST_SEARCH = "GBFS"
-    DIJKSRAS_SEARCH = "DS"
\ No newline at end of file
+    DIJKSRAS_SEARCH = "DS"
+    JUMP_POINT_SEARCH = "JPS"
+    BIDIRECTIONAL_BREADTH_FIRST_SEARCH = "BiBFS"
+    BIDIRECTIONAL_ASTAR_SEARCH = "BiA*"
+    HIERARCHICAL_SEARCH = "HPA*"
+    LIFELONG_PLANNING_ASTAR_SEARCH = "LPA*"
+    WEIGHTED_ASTAR_SEARCH = "WA*"
+    ANYTIME_REPAIRING_ASTAR_SEARCH = "ARA*"
\ No newline at end of file
@@ -1,20 +1,44 @@
+from .budget import StopReason
+from .cells import Cells
+
+
 class Solution:
-    """Model a solution to a pathfinding problem"""
+    """Model a solution to a pathfinding problem
+
+    The path and the explored states are stored as flat cell indices and
+    read as (row, col) tuples, see `Cells`.
+    """
 
     def __init__(
             self, 
-            path: list[tuple[int, int]],
-            explored_states: list[tuple[int, int]],
+            path: Cells,
+            explored_states: Cells,
             time: float = 0.0,
-            path_cost: int = 0
+            path_cost: int = 0,
+            explored_length: int | None = None,
+            reason: StopReason | None = None,
+            bound: float | None = None
     ) -> None:
         self.path = path
         self.path_cost = path_cost
         self.path_length = len(path)
         self.explored_states = explored_states
-        self.explored_length = len(explored_states)
+        # Streamed solutions count their expansions without keeping them
+        self.explored_length = len(explored_states) \
+            if explored_length is None else explored_length
         self.time = time
 
+        # Set when a budget stopped the search before it finished
+        self.reason = reason
+
+        # The path costs at most `bound` times the optimal cost. Only set
+        # by searches that trade optimality for speed.
+        self.bound = bound
+
+        # Whether this came from a SolutionCache. `time` is then the time
+        # the lookup took.
+        self.cached = False
+
     def __repr__(self) -> str:
         return f"Solution([{self.path[0]}, ..., {self.path[-1]}], {self.path_cost}, {self.time})"
 
@@ -23,5 +47,8 @@ class NoSolution(Solution):
 
     def __repr__(self) -> str:
         explored_states = list(self.explored_states)
-        return f"NoSolution([], [{explored_states[0]}, ..., {explored_states[-1]}], {self.time})"
+        reason = f", {self.reason.value}" if self.reason else ""
+        if not explored_states:
+            return f"NoSolution([], [], {self.time}{reason})"
+        return f"NoSolution([], [{explored_states[0]}, ..., {explored_states[-1]}], {self.time}{reason})"
     
\ No newline at end of file
@@ -0,0 +1,49 @@
+from .models.solution import Solution
+
+# Metrics of a solution that are summed over runs
+METRICS = ("explored_length", "path_length", "path_cost", "time")
+
+Results = dict[str, dict[str, float]]
+
+
+def add_result(results: Results, name: str, solution: Solution) -> None:
+    """Add a solution's metrics to the running totals of its algorithm
+
+    Args:
+        results (Results): Totals by algorithm name, updated in place
+        name (str): Algorithm name
+        solution (Solution): Solution to add
+    """
+    totals = results.setdefault(name, dict.fromkeys(METRICS, 0))
+    for metric in METRICS:
+        totals[metric] += getattr(solution, metric)
+
+
+def average_results(
+    results: Results,
+    runs: int = 1
+) -> list[tuple[str, dict[str, float]]]:
+    """Average the totals over a number of runs and rank the algorithms
+    from fastest to slowest
+
+    Args:
+        results (Results): Totals by algorithm name
+        runs (int, optional): Number of runs every total covers.
+            Defaults to 1.
+
+    Returns:
+        list[tuple[str, dict[str, float]]]: (algorithm name, averages)
+            pairs, fastest first
+    """
+    averages = [
+        (name, {
+            "explored_length": totals["explored_length"] // runs,
+            "path_length": totals["path_length"] // runs,
+            "path_cost": totals["path_cost"] // runs,
+            "time": totals["time"] / runs,
+        })
+        for name, totals in results.items()
+    ]
+
+    averages.sort(key=lambda item: item[1]["time"])
+    return averages
@@ -0,0 +1,190 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.frontier import PriorityQueueFrontier
+from ..models.grid import Grid
+from ..models.solution import Solution
+from .astar import AStarSearch
+from .search import INFINITY
+
+# Weight of the heuristic in the first pass
+DEFAULT_EPSILON = 3.0
+
+# How much the weight is lowered from one pass to the next
+DEFAULT_DECREMENT = 0.5
+
+
+class AnytimeRepairingAStarSearch(AStarSearch):
+    @staticmethod
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        epsilon: float = DEFAULT_EPSILON,
+        decrement: float = DEFAULT_DECREMENT
+    ) -> Solution:
+        """Find path between two points in a grid using Anytime Repairing
+        A* (ARA*)
+
+        Run to the end, the path is optimal. Give `PathFinder.find_path`
+        a budget to get the best path found when it runs out instead.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic in the
+                first pass. Defaults to DEFAULT_EPSILON.
+            decrement (float, optional): How much the weight is lowered
+                after every pass. Defaults to DEFAULT_DECREMENT.
+
+        Returns:
+            Solution: Solution found, with `bound` set to the bound of
+                its path
+        """
+        return AnytimeRepairingAStarSearch.collect(
+            grid, AnytimeRepairingAStarSearch.stream(
+                grid, buffers, epsilon, decrement))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        epsilon: float = DEFAULT_EPSILON,
+        decrement: float = DEFAULT_DECREMENT,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Anytime Repairing A* (ARA*), yielding its events as they
+        happen
+
+        A first Weighted A* pass finds a path quickly. Every later pass
+        lowers epsilon and repairs the previous one instead of starting
+        over: g-scores and parents are kept, and a closed cell is only
+        expanded again if its g-score dropped after it was closed. After
+        every pass, an Event.IMPROVED gives the path and its bound, the
+        smaller of epsilon and the path cost over the lowest f-score left
+        to expand. The search ends once the bound reaches 1.
+
+        Cells expanded again in a later pass are yielded again.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic in the
+                first pass. Defaults to DEFAULT_EPSILON.
+            decrement (float, optional): How much the weight is lowered
+                after every pass. Defaults to DEFAULT_DECREMENT.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Raises:
+            ValueError: Epsilon is below 1 or the decrement isn't positive
+
+        Yields:
+            SearchEvent: Expanded cells and the path of every pass, then
+                the best path found
+        """
+        if epsilon < 1:
+            raise ValueError("Epsilon must be at least 1")
+        if decrement <= 0:
+            raise ValueError("Decrement must be positive")
+
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        heuristic = AnytimeRepairingAStarSearch.heuristic_function(grid)
+
+        # Search state is owned by this call, the grid is only read
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        g_scores = buffers.g_scores
+        closed = buffers.explored
+        touched = buffers.touched
+
+        g_scores[start] = 0
+        touched.append(start)
+
+        frontier = PriorityQueueFrontier()
+        h_start = heuristic(start)
+        frontier.add(start, priority=epsilon * h_start, tiebreak=h_start)
+
+        # Cells closed in this pass, and closed cells whose g-score
+        # dropped since. Those are reopened by the next pass.
+        closed_cells: list[int] = []
+        inconsistent: set[int] = set()
+
+        while True:
+            # Expand while a cell could still lead to a path to the goal
+            # cheaper than the one found, under the current epsilon
+            while not frontier.is_empty() \
+                    and g_scores[end] > frontier.frontier[0][0]:
+                index = frontier.remove()
+                closed[index] = 1
+                closed_cells.append(index)
+                yield (Event.EXPANDED, index)
+
+                for neighbor in grid.neighbors(index):
+                    g_score = g_scores[index] + grid.costs[neighbor]
+
+                    if g_score < g_scores[neighbor]:
+                        if g_scores[neighbor] == INFINITY:
+                            touched.append(neighbor)
+
+                        g_scores[neighbor] = g_score
+                        parents[neighbor] = index
+
+                        if closed[neighbor]:
+                            inconsistent.add(neighbor)
+                            continue
+
+                        h_score = heuristic(neighbor)
+                        frontier.add(
+                            neighbor,
+                            priority=g_score + epsilon * h_score,
+                            tiebreak=h_score
+                        )
+
+                        if pushes:
+                            yield (Event.PUSHED, neighbor, len(frontier))
+
+            if g_scores[end] == INFINITY:
+                break
+
+            # The optimal cost is at least the lowest unweighted f-score
+            # of the cells left to expand
+            remaining = [entry[3] for entry in frontier.frontier]
+            remaining.extend(inconsistent)
+            lowest = min((g_scores[index] + heuristic(index)
+                          for index in remaining), default=INFINITY)
+            if g_scores[end] <= lowest:
+                bound = 1.0
+            else:
+                bound = min(epsilon, g_scores[end] / lowest)
+
+            path, path_cost = AnytimeRepairingAStarSearch.generate_path(
+                parents, end, grid)
+            yield (Event.IMPROVED, path, path_cost, bound)
+
+            if bound <= 1:
+                yield (Event.FINISHED, path, path_cost)
+                return
+
+            # Start the next pass from the open and inconsistent cells,
+            # ordered by the lowered epsilon
+            epsilon = max(1.0, epsilon - decrement)
+            for index in closed_cells:
+                closed[index] = 0
+            closed_cells.clear()
+            inconsistent.clear()
+
+            frontier = PriorityQueueFrontier()
+            for index in remaining:
+                h_score = heuristic(index)
+                frontier.add(
+                    index,
+                    priority=g_scores[index] + epsilon * h_score,
+                    tiebreak=h_score
+                )
+
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
@@ -1,80 +1,157 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
 from ..models.grid import Grid
+from ..models.landmarks import Landmarks
 from ..models.frontier import PriorityQueueFrontier
-from ..models.solution import NoSolution, Solution
-from .search import BasicSearch
+from ..models.solution import Solution
+from .search import BasicSearch, INFINITY
 
 class AStarSearch(BasicSearch):
     @staticmethod 
-    def search(grid: Grid) -> Solution:
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        landmarks: Landmarks | None = None,
+        epsilon: float = 1.0
+    ) -> Solution:
         """Find path between two points in a grid using A* Search
         
         Args:
             grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            landmarks (Landmarks, optional): Landmark tables to strengthen
+                the heuristic with. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic, see
+                `stream`. Defaults to 1.0.
         
         Returns:
             Solution: Solution found
         """
-        # Create node for the start cell
-        start = grid.get_node(pos=grid.start)
-
-        # Instantiate PriorityQueue frontier and add start node into it
-        frontier = PriorityQueueFrontier()
-        frontier.add(
-            node=start, 
-            priority=(0 + AStarSearch.heuristic(grid.start, grid.end))
-        )
-        # f = g + h
+        return AStarSearch.collect(
+            grid, AStarSearch.stream(grid, buffers, landmarks, epsilon))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        landmarks: Landmarks | None = None,
+        epsilon: float = 1.0,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run A* Search, yielding its events as they happen
+
+        With an epsilon above 1 this is Weighted A*: the heuristic is
+        multiplied by epsilon, which makes the search greedier. It
+        usually expands far fewer cells, and the path costs at most
+        epsilon times the optimal cost. That bound is yielded in an
+        Event.IMPROVED right before the path.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            landmarks (Landmarks, optional): Landmark tables to strengthen
+                the heuristic with. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic.
+                Defaults to 1.0.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Raises:
+            ValueError: Epsilon is below 1
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        if epsilon < 1:
+            raise ValueError("Epsilon must be at least 1")
+
+        # An epsilon of 1.0 is turned into the int 1, so that unweighted
+        # f-scores stay integers, as bucket queues need
+        if epsilon == 1:
+            epsilon = int(epsilon)
+
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+
+        # Instantiate the frontier and add start cell into it. The plain
+        # heuristic is consistent and an f-score rises by at most one
+        # cell's cost plus one, which a bucket queue holds. The landmark
+        # bound and a weighted heuristic can jump further and keep the heap.
+        if landmarks is None and epsilon == 1:
+            frontier = AStarSearch.priority_frontier(grid.max_cost + 1)
+        else:
+            frontier = PriorityQueueFrontier()
+        heuristic = AStarSearch.heuristic_function(grid, landmarks)
+        h_start = heuristic(start)
+        frontier.add(start, priority=(0 + epsilon * h_start), tiebreak=h_start)
+        # f = g + epsilon * h
         # f -> total estimated distance. The priority
-        # g -> distance from start to this node
-        # h -> heuristic, estimated distance from this node to goal
+        # g -> distance from start to this cell
+        # h -> heuristic, estimated distance from this cell to goal
+        # Ties on f are broken in favour of the lower h
 
-        # Keep track of G scores
-        g_scores = {grid.start: 0}
-        f_scores = {grid.start: AStarSearch.heuristic(grid.start, grid.end)}
+        # Search state is owned by this call, the grid is only read
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        g_scores = buffers.g_scores
+        explored = buffers.explored
+        touched = buffers.touched
 
-        # keep track of explored positions
-        explored_states = set() 
+        g_scores[start] = 0
+        touched.append(start)
 
         while not frontier.is_empty():
-            # Remove node from the frontier
-            node = frontier.remove()
-            # Add current node position to explored set
-            explored_states.add(node.state)
+            # Remove state from the frontier
+            index = frontier.remove()
+
+            # Add current position to explored set
+            if not explored[index]:
+                explored[index] = 1
+                yield (Event.EXPANDED, index)
 
             # Check if this is the destination point
-            if node.state == grid.end:
-                path, path_cost = AStarSearch.generate_path(node, grid)
-                return Solution(path=path,
-                                explored_states=list(explored_states),
-                                path_cost=path_cost
-                                )
+            if index == end:
+                path, path_cost = AStarSearch.generate_path(
+                    parents, index, grid)
+                if epsilon > 1:
+                    yield (Event.IMPROVED, path, path_cost, epsilon)
+                yield (Event.FINISHED, path, path_cost)
+                return
             
             # Explore neighbors
-            neighbors = grid.get_neighbors(node.state)
-            for action, state in neighbors.items():
+            for neighbor in grid.neighbors(index):
                 # Calculate g-score for this neighbor
-                g_score = g_scores[node.state] + grid.get_cost(state)
+                g_score = g_scores[index] + grid.costs[neighbor]
+
+                if g_score < g_scores[neighbor]:
+                    if g_scores[neighbor] == INFINITY:
+                        touched.append(neighbor)
 
-                if state not in explored_states or g_score < g_scores[state]:
                     # Store the g-score
-                    g_scores[state] = g_score
+                    g_scores[neighbor] = g_score
+                    parents[neighbor] = index
 
                     # Calculate h-score
-                    h_score = AStarSearch.heuristic(state, grid.end)
+                    h_score = heuristic(neighbor)
 
                     # Calculate f-score
-                    f_score = g_score + h_score
-                    f_scores[state] = f_score 
-
-                    neighbor = grid.get_node(pos=state)
-                    neighbor.parent = node 
-                    neighbor.estimated_distance = h_score
+                    f_score = g_score + epsilon * h_score
 
-                    neighbor.action = action
+                    frontier.add(
+                        neighbor,
+                        priority=f_score,
+                        tiebreak=h_score
+                    )
 
-                    frontier.add(node=neighbor, priority=f_score)
+                    if pushes:
+                        yield (Event.PUSHED, neighbor, len(frontier))
         
-        return NoSolution([], explored_states=list(explored_states))
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
 
 
     @staticmethod
@@ -1,53 +1,92 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
 from ..models.grid import Grid
 from ..models.frontier import QueueFrontier
-from ..models.solution import NoSolution, Solution
+from ..models.solution import Solution
 from .search import BasicSearch
+from .wavefront import WavefrontSearch
 
 class BreadthFirstSearch(BasicSearch):
     @staticmethod 
-    def search(grid: Grid) -> Solution:
+    def search(grid: Grid, buffers: SearchBuffers | None = None) -> Solution:
         """Find path between two points in a grid using Breadth First Search
 
+        Large unweighted grids are searched a whole generation at a time
+        by `WavefrontSearch` when NumPy is installed.
+
         Args:
             grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
         
         Returns:
             Solution: Solution found
         """
-        # Create a node for the start cell
-        start = grid.get_node(pos=grid.start)
+        if WavefrontSearch.supports(grid):
+            return WavefrontSearch.search(grid)
+
+        return BreadthFirstSearch.collect(
+            grid, BreadthFirstSearch.stream(grid, buffers))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Breadth First Search, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+
         frontier = QueueFrontier()
         frontier.add(start)
 
-        # keep track of explored positions
-        explored_states = set() 
+        # Search state is owned by this call, the grid is only read
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        explored = buffers.explored
+        touched = buffers.touched
+        touched.append(start)
 
         while not frontier.is_empty():
-            # Remove node from the frontier
-            node = frontier.remove()
+            # Remove state from the frontier
+            index = frontier.remove()
 
-            # Add current node position to explored set
-            explored_states.add(node.state)
+            # Add current position to explored set
+            explored[index] = 1
+            yield (Event.EXPANDED, index)
 
             # Check if this is the destination point
-            if node.state == grid.end:
-                # Generate path and return a Solution object
-                path, path_cost = BreadthFirstSearch.generate_path(node, grid)
-                return Solution(path=path, 
-                                explored_states=list(explored_states), 
-                                path_cost=path_cost
-                                )
+            if index == end:
+                path, path_cost = BreadthFirstSearch.generate_path(
+                    parents, index, grid)
+                yield (Event.FINISHED, path, path_cost)
+                return
             
             # Explore neighbors
-            neighbors = grid.get_neighbors(node.state)
-            for action, state in neighbors.items():
-                if state in explored_states or frontier.contains_state(state):
+            for neighbor in grid.neighbors(index):
+                if explored[neighbor] or frontier.contains_state(neighbor):
                     continue 
 
-                new = grid.get_node(pos=state) 
-                new.parent = node
-                new.action = action 
+                parents[neighbor] = index
+                touched.append(neighbor)
+                frontier.add(neighbor)
 
-                frontier.add(node=new)
+                if pushes:
+                    yield (Event.PUSHED, neighbor, len(frontier))
         
-        return NoSolution([], list(explored_states))
\ No newline at end of file
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
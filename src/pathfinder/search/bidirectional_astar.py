@@ -0,0 +1,161 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.grid import Grid
+from ..models.frontier import PriorityQueueFrontier
+from ..models.solution import Solution
+from .search import BasicSearch, INFINITY
+
+class BidirectionalAStarSearch(BasicSearch):
+    @staticmethod 
+    def search(grid: Grid, buffers: SearchBuffers | None = None) -> Solution:
+        """Find path between two points in a grid using A* Search from
+        both ends at once
+
+        Both sides use the average potential p = (h_goal - h_start) / 2,
+        the forward side adding it and the backward side subtracting it.
+        With these keys the two searches work on the same non-negative
+        reduced costs, so the search can stop as soon as the smallest
+        forward and backward keys add up to the best path found so far.
+        Keys are doubled to keep them integers.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+        
+        Returns:
+            Solution: Solution found
+        """
+        return BidirectionalAStarSearch.collect(
+            grid, BidirectionalAStarSearch.stream(grid, buffers))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Bidirectional A* Search, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        width = grid.width
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        start_row, start_col = grid.start
+        end_row, end_col = grid.end
+
+        def manhattan(index: int) -> int:
+            row, col = divmod(index, width)
+            return (abs(row - end_row) + abs(col - end_col)) \
+                - (abs(row - start_row) + abs(col - start_col))
+
+        def zero(index: int) -> int:
+            return 0
+
+        # Distances in steps only bound the cost while no cell is free,
+        # otherwise both sides run as Dijkstra's
+        if BidirectionalAStarSearch.has_free_cells(grid):
+            potential = zero
+        else:
+            potential = manhattan
+
+        # Search state is owned by this call, the grid is only read
+        forward = SearchBuffers.prepare(grid.size, buffers)
+        backward = forward.get_reverse()
+
+        forward.g_scores[start] = 0
+        forward.touched.append(start)
+        backward.g_scores[end] = 0
+        backward.touched.append(end)
+
+        # Both sides would start on the same cell and never meet
+        if start == end:
+            forward.explored[start] = 1
+            yield (Event.EXPANDED, start)
+
+            path, path_cost = BidirectionalAStarSearch.generate_path(
+                forward.parents, start, grid)
+            yield (Event.FINISHED, path, path_cost)
+            return
+
+        forward_frontier = PriorityQueueFrontier()
+        forward_frontier.add(start, priority=potential(start))
+        backward_frontier = PriorityQueueFrontier()
+        backward_frontier.add(end, priority=-potential(end))
+
+        # Cost of the best path found so far, and where its halves meet
+        best = INFINITY
+        meeting = -1
+
+        while not forward_frontier.is_empty() \
+                and not backward_frontier.is_empty():
+            if forward_frontier.frontier[0][0] \
+                    + backward_frontier.frontier[0][0] >= 2 * best:
+                break
+
+            # Expand the side with the smaller frontier
+            is_forward = len(forward_frontier.frontier) \
+                <= len(backward_frontier.frontier)
+            if is_forward:
+                this, other, frontier = forward, backward, forward_frontier
+                sign, root = 1, end
+            else:
+                this, other, frontier = backward, forward, backward_frontier
+                sign, root = -1, start
+
+            index = frontier.remove()
+
+            this.explored[index] = 1
+            if not other.explored[index]:
+                yield (Event.EXPANDED, index)
+
+            # Paths through the other side's root are never shortest
+            if index == root:
+                continue
+
+            # Explore neighbors. Moving into a cell costs that cell's cost,
+            # so the backward side pays for the cell it is leaving.
+            for neighbor in grid.neighbors(index):
+                cost = grid.costs[neighbor] if is_forward else grid.costs[index]
+                g_score = this.g_scores[index] + cost
+
+                if g_score < this.g_scores[neighbor]:
+                    if this.g_scores[neighbor] == INFINITY:
+                        this.touched.append(neighbor)
+
+                    this.g_scores[neighbor] = g_score
+                    this.parents[neighbor] = index
+                    frontier.add(
+                        neighbor,
+                        priority=2 * g_score + sign * potential(neighbor)
+                    )
+
+                    if pushes:
+                        yield (Event.PUSHED, neighbor,
+                               len(forward_frontier)
+                               + len(backward_frontier))
+
+                    # Check if this completes a better path
+                    if g_score + other.g_scores[neighbor] < best:
+                        best = g_score + other.g_scores[neighbor]
+                        meeting = neighbor
+
+        if meeting < 0:
+            yield (Event.FINISHED, Cells(width=grid.width), 0)
+            return
+
+        path, path_cost = BidirectionalAStarSearch.generate_bidirectional_path(
+            forward.parents, backward.parents, meeting, grid)
+        yield (Event.FINISHED, path, path_cost)
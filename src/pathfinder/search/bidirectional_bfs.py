@@ -0,0 +1,127 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.grid import Grid
+from ..models.frontier import QueueFrontier
+from ..models.solution import Solution
+from .search import BasicSearch, INFINITY
+
+class BidirectionalBreadthFirstSearch(BasicSearch):
+    @staticmethod 
+    def search(grid: Grid, buffers: SearchBuffers | None = None) -> Solution:
+        """Find path between two points in a grid using Breadth First Search
+        from both ends at once
+
+        The smaller frontier is expanded one whole level at a time. Once a
+        level reaches cells seen by the other side, the meeting cell with
+        the fewest steps in total joins the two halves.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+        
+        Returns:
+            Solution: Solution found
+        """
+        return BidirectionalBreadthFirstSearch.collect(
+            grid, BidirectionalBreadthFirstSearch.stream(grid, buffers))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Bidirectional Breadth First Search, yielding its events as
+        they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+
+        # Search state is owned by this call, the grid is only read.
+        # g-scores hold the number of steps from each side's root.
+        forward = SearchBuffers.prepare(grid.size, buffers)
+        backward = forward.get_reverse()
+
+        forward.g_scores[start] = 0
+        forward.touched.append(start)
+        backward.g_scores[end] = 0
+        backward.touched.append(end)
+
+        # Both sides would start on the same cell and never meet
+        if start == end:
+            forward.explored[start] = 1
+            yield (Event.EXPANDED, start)
+
+            path, path_cost = BidirectionalBreadthFirstSearch.generate_path(
+                forward.parents, start, grid)
+            yield (Event.FINISHED, path, path_cost)
+            return
+
+        forward_frontier = QueueFrontier()
+        forward_frontier.add(start)
+        backward_frontier = QueueFrontier()
+        backward_frontier.add(end)
+
+        while not forward_frontier.is_empty() \
+                and not backward_frontier.is_empty():
+            # Expand the side with the smaller frontier
+            if len(forward_frontier.frontier) <= len(backward_frontier.frontier):
+                this, other, frontier = forward, backward, forward_frontier
+            else:
+                this, other, frontier = backward, forward, backward_frontier
+
+            best = INFINITY
+            meeting = -1
+
+            for _ in range(len(frontier.frontier)):
+                index = frontier.remove()
+
+                this.explored[index] = 1
+                if not other.explored[index]:
+                    yield (Event.EXPANDED, index)
+
+                # Explore neighbors
+                for neighbor in grid.neighbors(index):
+                    if this.g_scores[neighbor] != INFINITY:
+                        continue
+
+                    this.g_scores[neighbor] = this.g_scores[index] + 1
+                    this.parents[neighbor] = index
+                    this.touched.append(neighbor)
+
+                    # Check if the other side has seen this cell
+                    if other.g_scores[neighbor] != INFINITY:
+                        steps = this.g_scores[neighbor] \
+                            + other.g_scores[neighbor]
+                        if steps < best:
+                            best, meeting = steps, neighbor
+
+                    frontier.add(neighbor)
+
+                    if pushes:
+                        yield (Event.PUSHED, neighbor,
+                               len(forward_frontier)
+                               + len(backward_frontier))
+
+            if meeting >= 0:
+                path, path_cost = \
+                    BidirectionalBreadthFirstSearch.generate_bidirectional_path(
+                        forward.parents, backward.parents, meeting, grid)
+                yield (Event.FINISHED, path, path_cost)
+                return
+        
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
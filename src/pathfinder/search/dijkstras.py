@@ -1,66 +1,154 @@
+from array import array
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.distance_field import DistanceField, NO_DIRECTION
+from ..models.events import Event, SearchEvent
 from ..models.grid import Grid
-from ..models.frontier import PriorityQueueFrontier
-from ..models.solution import NoSolution, Solution
-from .search import BasicSearch
+from ..models.solution import Solution
+from .search import BasicSearch, INFINITY
 
 class DijkstrasSearch(BasicSearch):
     @staticmethod 
-    def search(grid: Grid) -> Solution:
+    def search(grid: Grid, buffers: SearchBuffers | None = None) -> Solution:
         """Find path between two points in a grid using Dijkstras Shortest Path Algorithm
         
         Args:
             grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
         
         Returns:
             Solution: Solution found
         """
-        # Create node for the start cell
-        start = grid.get_node(pos=grid.start)
+        return DijkstrasSearch.collect(
+            grid, DijkstrasSearch.stream(grid, buffers))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Dijkstras Shortest Path Algorithm, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
 
-        # Instantiate PriorityQueue frontier and add start node into it
-        frontier = PriorityQueueFrontier()
+        # Instantiate the frontier and add start cell into it. A g-score
+        # only ever rises by the cost of one cell, so small costs get a
+        # bucket queue instead of the heap.
+        frontier = DijkstrasSearch.priority_frontier(grid.max_cost)
         frontier.add(start)
         
-        # Keep track of G scores
-        g_scores = {grid.start: 0}
+        # Search state is owned by this call, the grid is only read
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        g_scores = buffers.g_scores
+        explored = buffers.explored
+        touched = buffers.touched
 
-        # Keep track of explored positions
-        explored_states = set()
+        g_scores[start] = 0
+        touched.append(start)
 
         while not frontier.is_empty():
-            # Remove node from the frontier
-            node = frontier.remove()
+            # Remove state from the frontier
+            index = frontier.remove()
 
             # Check if this is the destination point
-            if node.state == grid.end:
-                path, path_cost = DijkstrasSearch.generate_path(node, grid)
-                return Solution(path=path,
-                                explored_states=list(explored_states),
-                                path_cost=path_cost
-                                )
+            if index == end:
+                path, path_cost = DijkstrasSearch.generate_path(
+                    parents, index, grid)
+                yield (Event.FINISHED, path, path_cost)
+                return
             
-            if node.state in explored_states:
+            if explored[index]:
                 continue
 
-            # Add current node position to explored set
-            explored_states.add(node.state)
+            # Add current position to explored set
+            explored[index] = 1
+            yield (Event.EXPANDED, index)
             
             # Explore neighbors
-            neighbors = grid.get_neighbors(node.state)
-            for action, state in neighbors.items():
+            for neighbor in grid.neighbors(index):
                 # Calculate g-score for this neighbor
-                g_score = g_scores.get(node.state) + grid.get_cost(state)
+                g_score = g_scores[index] + grid.costs[neighbor]
+
+                if g_score < g_scores[neighbor]:
+                    if g_scores[neighbor] == INFINITY:
+                        touched.append(neighbor)
 
-                if state not in explored_states or g_score < g_scores[state]:
                     # Store the g-score
-                    g_scores[state] = g_score
+                    g_scores[neighbor] = g_score
+                    parents[neighbor] = index
+                    frontier.add(neighbor, priority=g_score)
 
-                    neighbor = grid.get_node(pos=state)
-                    neighbor.parent = node
-                    neighbor.action = action
-                    frontier.add(node=neighbor, priority=g_score)
+                    if pushes:
+                        yield (Event.PUSHED, neighbor, len(frontier))
 
-        return NoSolution([], explored_states=list(explored_states))
-        
-            
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
+
+    @staticmethod
+    def distance_field(grid: Grid, reverse: bool = True) -> DistanceField:
+        """Run Dijkstras Shortest Path Algorithm over the whole grid
+
+        Args:
+            grid (Grid): Grid of points
+            reverse (bool, optional): Measure distances to the goal instead
+                of from the start. Defaults to True.
+
+        Returns:
+            DistanceField: Distance and next-step direction of every cell
+        """
+        width = grid.width
+        root = grid.index(grid.end if reverse else grid.start)
+
+        distances = array("i", [INFINITY]) * grid.size
+        directions = bytearray([NO_DIRECTION]) * grid.size
+        distances[root] = 0
+
+        frontier = DijkstrasSearch.priority_frontier(grid.max_cost)
+        frontier.add(root)
+
+        while not frontier.is_empty():
+            index = frontier.remove()
+
+            for neighbor in grid.neighbors(index):
+                # Moving into a cell costs that cell's cost. Going
+                # backwards from the goal, the cost is paid for `index`.
+                cost = grid.costs[index] if reverse else grid.costs[neighbor]
+                distance = distances[index] + cost
+
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+
+                    # Store the step from the neighbor back to this cell
+                    delta = index - neighbor
+                    if delta == width:
+                        directions[neighbor] = 1
+                    elif delta == -width:
+                        directions[neighbor] = 0
+                    else:
+                        directions[neighbor] = 3 if delta == 1 else 2
+
+                    frontier.add(neighbor, priority=distance)
 
+        return DistanceField(
+            width=grid.width,
+            height=grid.height,
+            root=grid.end if reverse else grid.start,
+            distances=distances,
+            directions=directions,
+            reverse=reverse
+        )
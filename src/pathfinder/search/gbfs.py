@@ -1,75 +1,101 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
 from ..models.grid import Grid
+from ..models.landmarks import Landmarks
 from ..models.frontier import PriorityQueueFrontier
-from ..models.solution import NoSolution, Solution
+from ..models.solution import Solution
 from .search import BasicSearch
 
 class GreedyBestFirstSearch(BasicSearch):
     @staticmethod 
-    def search(grid: Grid) -> Solution:
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        landmarks: Landmarks | None = None
+    ) -> Solution:
         """Find path between two points in a grid using Greedy Best First Search Algorithm
         
         Args:
             grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            landmarks (Landmarks, optional): Landmark tables to strengthen
+                the heuristic with. Defaults to None.
         
         Returns:
             Solution: Solution found
         """
-        # Create node for the start cell
-        start = grid.get_node(pos=grid.start)
+        return GreedyBestFirstSearch.collect(
+            grid, GreedyBestFirstSearch.stream(grid, buffers, landmarks))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        landmarks: Landmarks | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Greedy Best First Search, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            landmarks (Landmarks, optional): Landmark tables to strengthen
+                the heuristic with. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
 
-        # Instantiate PriorityQueue frontier and add start node into it
+        # Instantiate PriorityQueue frontier and add start cell into it
         frontier = PriorityQueueFrontier()
-        frontier.add(
-            node=start, 
-            priority=GreedyBestFirstSearch.heuristic(grid.start, grid.end)
-        )
+        heuristic = GreedyBestFirstSearch.heuristic_function(
+            grid, landmarks, admissible=False)
+        frontier.add(start, priority=heuristic(start))
 
-        # Keep track of explored positions
-        explored_states = set()
+        # Search state is owned by this call, the grid is only read
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        explored = buffers.explored
+        touched = buffers.touched
+        touched.append(start)
 
         while not frontier.is_empty():
-            # Remove node from the frontier
-            node = frontier.remove()
-            # Add current node position to explored set
-            explored_states.add(node.state)
+            # Remove state from the frontier
+            index = frontier.remove()
+
+            # Add current position to explored set
+            explored[index] = 1
+            yield (Event.EXPANDED, index)
 
             # Check if this is the destination point
-            if node.state == grid.end:
-                path, path_cost = GreedyBestFirstSearch.generate_path(node, grid)
-                return Solution(path=path,
-                                explored_states=list(explored_states),
-                                path_cost=path_cost
-                                )
+            if index == end:
+                path, path_cost = GreedyBestFirstSearch.generate_path(
+                    parents, index, grid)
+                yield (Event.FINISHED, path, path_cost)
+                return
             
             # Explore neighbors
-            neighbors = grid.get_neighbors(node.state)
-            for action, state in neighbors.items():
-                if state not in explored_states:
-                    neighbor = grid.get_node(pos=state)
-                    neighbor.parent = node
+            for neighbor in grid.neighbors(index):
+                if not explored[neighbor] \
+                        and not frontier.contains_state(neighbor):
+                    parents[neighbor] = index
+                    touched.append(neighbor)
 
                     # Calculate h-score
-                    h_score = GreedyBestFirstSearch.heuristic(state, grid.end)
-
-                    neighbor.estimated_distance = h_score
+                    h_score = heuristic(neighbor)
 
-                    neighbor.action = action
-                    frontier.add(node=neighbor, priority=h_score)
-
-        return NoSolution([], explored_states=list(explored_states))
-    
-    @staticmethod
-    def heuristic(state: tuple[int, int], goal: tuple[int, int]) -> int:
-        """Heuristic function for estimating remaining distance
+                    frontier.add(neighbor, priority=h_score)
 
-        Args:
-            state (tuple[int, int]): current position
-            goal (tuple[int, int]): final position
-        
-        Returns:
-            int: Estimated remaining distance from state to goal
-        """
-        x1, y1 = state 
-        x2, y2 = goal 
+                    if pushes:
+                        yield (Event.PUSHED, neighbor, len(frontier))
 
-        return abs(x1 - x2) + abs(y1 - y2)
\ No newline at end of file
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
@@ -0,0 +1,463 @@
+from array import array
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers, INFINITY
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.grid import Grid
+from ..models.frontier import PriorityQueueFrontier
+from ..models.solution import Solution
+from .search import BasicSearch
+
+# Border segments at least this long get a transition at both ends
+# instead of one in the middle
+LONG_ENTRANCE = 6
+
+# (first row, last row, first column, last column) of a cluster
+Bounds = tuple[int, int, int, int]
+
+# ("h", cluster row, cluster column) is the border between a cluster and
+# the one to its right, ("v", ...) between a cluster and the one below
+BorderKey = tuple[str, int, int]
+
+
+class HierarchicalGraph:
+    """Model the abstract graph used by Hierarchical Pathfinding A* (HPA*)
+
+    The grid is split into square clusters. Where two clusters share an
+    open border segment, a transition links a cell on each side. Those
+    cells are the abstract nodes. Inside every cluster, abstract nodes are
+    joined by edges weighted with their shortest distance in the cluster.
+
+    Cells edited after the graph was built are reported with `mark_dirty`.
+    The next `refresh` then rebuilds only the borders of those clusters
+    and the intra-cluster edges of the clusters those borders touch.
+    """
+
+    def __init__(self, grid: Grid, cluster_size: int = 10) -> None:
+        self.width = grid.width
+        self.height = grid.height
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+
+        # Transitions (cell, cell) across every border
+        self.transitions: dict[BorderKey, list[tuple[int, int]]] = {}
+
+        # Directed edges between abstract nodes. `inter` crosses borders,
+        # `intra[cluster][u][v]` stays inside a cluster.
+        self.inter: dict[int, dict[int, int]] = {}
+        self.intra: dict[int, dict[int, dict[int, int]]] = {}
+
+        self.dirty: set[int] = set()
+
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if col + 1 < self.columns:
+                    self._build_border(grid, ("h", row, col))
+                if row + 1 < self.rows:
+                    self._build_border(grid, ("v", row, col))
+
+        for cluster in range(self.rows * self.columns):
+            self._build_cluster(grid, cluster)
+
+    def cluster_of(self, index: int) -> int:
+        """Get the cluster a cell belongs to
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            int: Cluster id
+        """
+        row, col = divmod(index, self.width)
+        return (row // self.cluster_size) * self.columns \
+            + col // self.cluster_size
+
+    def bounds(self, cluster: int) -> Bounds:
+        """Get the cell bounds of a cluster
+
+        Args:
+            cluster (int): Cluster id
+
+        Returns:
+            Bounds: First and last row, first and last column
+        """
+        row, col = divmod(cluster, self.columns)
+        size = self.cluster_size
+        return (
+            row * size, min((row + 1) * size, self.height) - 1,
+            col * size, min((col + 1) * size, self.width) - 1,
+        )
+
+    def mark_dirty(self, pos: tuple[int, int]) -> None:
+        """Record that a cell's wall or cost changed
+
+        Args:
+            pos (tuple[int, int]): Cell position
+        """
+        self.dirty.add(self.cluster_of(pos[0] * self.width + pos[1]))
+
+    def refresh(self, grid: Grid) -> None:
+        """Rebuild the parts of the graph affected by dirty clusters
+
+        Args:
+            grid (Grid): The edited grid
+        """
+        if not self.dirty:
+            return
+
+        borders: set[BorderKey] = set()
+        clusters: set[int] = set(self.dirty)
+
+        for cluster in self.dirty:
+            row, col = divmod(cluster, self.columns)
+            if col + 1 < self.columns:
+                borders.add(("h", row, col))
+                clusters.add(cluster + 1)
+            if col > 0:
+                borders.add(("h", row, col - 1))
+                clusters.add(cluster - 1)
+            if row + 1 < self.rows:
+                borders.add(("v", row, col))
+                clusters.add(cluster + self.columns)
+            if row > 0:
+                borders.add(("v", row - 1, col))
+                clusters.add(cluster - self.columns)
+
+        for border in borders:
+            self._build_border(grid, border)
+
+        for cluster in clusters:
+            self._build_cluster(grid, cluster)
+
+        self.dirty.clear()
+
+    def nodes_in(self, cluster: int) -> set[int]:
+        """Get the abstract nodes of a cluster
+
+        Args:
+            cluster (int): Cluster id
+
+        Returns:
+            set[int]: Cell indices
+        """
+        row, col = divmod(cluster, self.columns)
+        borders = [("h", row, col), ("h", row, col - 1),
+                   ("v", row, col), ("v", row - 1, col)]
+
+        nodes = set()
+        for border in borders:
+            for a, b in self.transitions.get(border, []):
+                nodes.add(a if self.cluster_of(a) == cluster else b)
+
+        return nodes
+
+    def _build_border(self, grid: Grid, border: BorderKey) -> None:
+        """Find the transitions across one border
+
+        Args:
+            grid (Grid): Grid of points
+            border (BorderKey): Border to build
+        """
+        # Drop the old transitions and their inter-cluster edges
+        for a, b in self.transitions.pop(border, []):
+            for u, v in ((a, b), (b, a)):
+                edges = self.inter.get(u, {})
+                edges.pop(v, None)
+                if not edges:
+                    self.inter.pop(u, None)
+
+        direction, row, col = border
+        first_row, last_row, first_col, last_col = \
+            self.bounds(row * self.columns + col)
+
+        # Pairs of facing cells along the border
+        if direction == "h":
+            pairs = [(r * self.width + last_col, r * self.width + last_col + 1)
+                     for r in range(first_row, last_row + 1)]
+        else:
+            pairs = [(last_row * self.width + c, (last_row + 1) * self.width + c)
+                     for c in range(first_col, last_col + 1)]
+
+        # Split them into maximal runs where both sides are open
+        segments: list[list[tuple[int, int]]] = []
+        segment: list[tuple[int, int]] = []
+        for a, b in pairs:
+            if not grid.walls[a] and not grid.walls[b]:
+                segment.append((a, b))
+            elif segment:
+                segments.append(segment)
+                segment = []
+        if segment:
+            segments.append(segment)
+
+        transitions = []
+        for segment in segments:
+            if len(segment) < LONG_ENTRANCE:
+                transitions.append(segment[len(segment) // 2])
+            else:
+                transitions.extend((segment[0], segment[-1]))
+
+        for a, b in transitions:
+            self.inter.setdefault(a, {})[b] = grid.costs[b]
+            self.inter.setdefault(b, {})[a] = grid.costs[a]
+
+        self.transitions[border] = transitions
+
+    def _build_cluster(self, grid: Grid, cluster: int) -> None:
+        """Compute the edges between the abstract nodes of one cluster
+
+        Args:
+            grid (Grid): Grid of points
+            cluster (int): Cluster id
+        """
+        nodes = self.nodes_in(cluster)
+        bounds = self.bounds(cluster)
+
+        edges: dict[int, dict[int, int]] = {}
+        for node in nodes:
+            distances, _ = HierarchicalSearch.local_search(grid, node, bounds)
+            edges[node] = {other: distances[other] for other in nodes
+                           if other != node and other in distances}
+
+        self.intra[cluster] = edges
+
+    def __repr__(self) -> str:
+        return f"HierarchicalGraph({self.rows}x{self.columns} clusters, " \
+            f"{len(self.inter)} nodes)"
+
+
+class HierarchicalSearch(BasicSearch):
+    @staticmethod
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        hierarchy: HierarchicalGraph | None = None
+    ) -> Solution:
+        """Find path between two points in a grid using Hierarchical
+        Pathfinding A* (HPA*)
+
+        The start and goal are linked to the abstract nodes of their
+        clusters. A* then runs on the abstract graph, and each abstract
+        edge on the result is refined into cells by a search confined to
+        its cluster. Paths are near-optimal, not guaranteed shortest.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Unused, accepted for a
+                uniform search signature. Defaults to None.
+            hierarchy (HierarchicalGraph, optional): Abstract graph of this
+                grid, refreshed before use. Built from scratch if not
+                given. Defaults to None.
+
+        Returns:
+            Solution: Solution found
+        """
+        return HierarchicalSearch.collect(
+            grid, HierarchicalSearch.stream(grid, buffers, hierarchy))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        hierarchy: HierarchicalGraph | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run HPA*, yielding its events as they happen
+
+        Only the abstract search is reported, so the expanded cells are
+        the abstract nodes it went through.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Unused, accepted for a
+                uniform search signature. Defaults to None.
+            hierarchy (HierarchicalGraph, optional): Abstract graph of this
+                grid, refreshed before use. Built from scratch if not
+                given. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        if hierarchy is None:
+            hierarchy = HierarchicalGraph(grid)
+        else:
+            hierarchy.refresh(grid)
+
+        width = grid.width
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        end_row, end_col = grid.end
+
+        start_cluster = hierarchy.cluster_of(start)
+        end_cluster = hierarchy.cluster_of(end)
+
+        # Temporary edges from the start and into the goal
+        distances, _ = HierarchicalSearch.local_search(
+            grid, start, hierarchy.bounds(start_cluster))
+        start_edges = {node: distances[node]
+                       for node in hierarchy.nodes_in(start_cluster)
+                       if node in distances and node != start}
+        if start_cluster == end_cluster and end in distances:
+            start_edges[end] = distances[end]
+
+        distances, _ = HierarchicalSearch.local_search(
+            grid, end, hierarchy.bounds(end_cluster), reverse=True)
+        goal_edges = {node: distances[node]
+                      for node in hierarchy.nodes_in(end_cluster)
+                      if node in distances and node != end}
+
+        # A* over the abstract graph
+        frontier = PriorityQueueFrontier()
+        frontier.add(start)
+        g_scores = {start: 0}
+        parents: dict[int, int] = {}
+        explored = set()
+
+        while not frontier.is_empty():
+            index = frontier.remove()
+
+            if index in explored:
+                continue
+            explored.add(index)
+            yield (Event.EXPANDED, index)
+
+            if index == end:
+                break
+
+            edges = list(hierarchy.inter.get(index, {}).items())
+            edges.extend(hierarchy.intra[hierarchy.cluster_of(index)]
+                         .get(index, {}).items())
+            if index == start:
+                edges.extend(start_edges.items())
+            if index in goal_edges:
+                edges.append((end, goal_edges[index]))
+
+            for neighbor, cost in edges:
+                g_score = g_scores[index] + cost
+                if g_score < g_scores.get(neighbor, INFINITY):
+                    g_scores[neighbor] = g_score
+                    parents[neighbor] = index
+
+                    row, col = divmod(neighbor, width)
+                    h_score = abs(row - end_row) + abs(col - end_col)
+                    frontier.add(
+                        neighbor,
+                        priority=g_score + h_score,
+                        tiebreak=h_score
+                    )
+
+                    if pushes:
+                        yield (Event.PUSHED, neighbor, len(frontier))
+
+        if end not in explored:
+            yield (Event.FINISHED, Cells(width=grid.width), 0)
+            return
+
+        # Refine the abstract path into cells
+        abstract_path = [end]
+        while abstract_path[-1] != start:
+            abstract_path.append(parents[abstract_path[-1]])
+        abstract_path.reverse()
+
+        cells = [start]
+        for u, v in zip(abstract_path, abstract_path[1:]):
+            cells.extend(HierarchicalSearch._refine(grid, hierarchy, u, v))
+
+        path = Cells(array("i", cells), grid.width)
+        path_cost = sum(grid.costs[index] for index in cells[1:])
+
+        yield (Event.FINISHED, path, path_cost)
+
+    @staticmethod
+    def local_search(
+        grid: Grid,
+        source: int,
+        bounds: Bounds,
+        reverse: bool = False,
+        target: int = -1
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """Run Dijkstras algorithm without leaving a cluster
+
+        Args:
+            grid (Grid): Grid of points
+            source (int): Index of the cell to start from
+            bounds (Bounds): Bounds of the cluster
+            reverse (bool, optional): Measure distances to the source
+                instead of from it. Defaults to False.
+            target (int, optional): Stop once this cell is reached.
+                Defaults to -1.
+
+        Returns:
+            tuple[dict[int, int], dict[int, int]]: Distances and parents
+                of the reached cells
+        """
+        width = grid.width
+        first_row, last_row, first_col, last_col = bounds
+
+        distances = {source: 0}
+        parents: dict[int, int] = {}
+        done = set()
+
+        frontier = PriorityQueueFrontier()
+        frontier.add(source)
+
+        while not frontier.is_empty():
+            index = frontier.remove()
+            if index == target:
+                break
+            done.add(index)
+
+            for neighbor in grid.neighbors(index):
+                if neighbor in done:
+                    continue
+
+                row, col = divmod(neighbor, width)
+                if not (first_row <= row <= last_row
+                        and first_col <= col <= last_col):
+                    continue
+
+                cost = grid.costs[index] if reverse else grid.costs[neighbor]
+                distance = distances[index] + cost
+                if distance < distances.get(neighbor, INFINITY):
+                    distances[neighbor] = distance
+                    parents[neighbor] = index
+                    frontier.add(neighbor, priority=distance)
+
+        return distances, parents
+
+    @staticmethod
+    def _refine(
+        grid: Grid,
+        hierarchy: HierarchicalGraph,
+        u: int,
+        v: int
+    ) -> list[int]:
+        """Turn one abstract edge into the cells after `u` up to `v`
+
+        Args:
+            grid (Grid): Grid of points
+            hierarchy (HierarchicalGraph): Abstract graph
+            u (int): Index of the first abstract node
+            v (int): Index of the second abstract node
+
+        Returns:
+            list[int]: Cell indices
+        """
+        # Neighboring cells, including every transition
+        if v - u in (grid.width, -grid.width) \
+                or (abs(v - u) == 1 and v // grid.width == u // grid.width):
+            return [v]
+
+        bounds = hierarchy.bounds(hierarchy.cluster_of(u))
+        _, parents = HierarchicalSearch.local_search(grid, u, bounds, target=v)
+
+        cells = [v]
+        while parents[cells[-1]] != u:
+            cells.append(parents[cells[-1]])
+        cells.reverse()
+
+        return cells
@@ -0,0 +1,235 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.grid import Grid
+from ..models.frontier import PriorityQueueFrontier
+from ..models.solution import Solution
+from .astar import AStarSearch
+from .search import BasicSearch, INFINITY
+
+# (row, column) step of every direction
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class JumpPointSearch(BasicSearch):
+    @staticmethod
+    def search(grid: Grid, buffers: SearchBuffers | None = None) -> Solution:
+        """Find path between two points in a grid using Jump Point Search
+
+        JPS only prunes symmetric paths on uniform-cost grids, so grids
+        with weighted or free cells are handed over to A* Search.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+
+        Returns:
+            Solution: Solution found
+        """
+        return JumpPointSearch.collect(
+            grid, JumpPointSearch.stream(grid, buffers))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Jump Point Search, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        # Paths are only as costly as they are long on uniform grids
+        if grid.max_cost > 1 or JumpPointSearch.has_free_cells(grid):
+            yield from AStarSearch.stream(grid, buffers, pushes=pushes)
+            return
+
+        width = grid.width
+        start = grid.index(grid.start)
+        end = grid.index(grid.end)
+        end_row, end_col = grid.end
+
+        # Instantiate PriorityQueue frontier and add start cell into it
+        frontier = PriorityQueueFrontier()
+        h_start = AStarSearch.heuristic(grid.start, grid.end)
+        frontier.add(start, priority=h_start, tiebreak=h_start)
+
+        # Search state is owned by this call, the grid is only read.
+        # Parents link jump points, not neighboring cells.
+        buffers = SearchBuffers.prepare(grid.size, buffers)
+        parents = buffers.parents
+        g_scores = buffers.g_scores
+        explored = buffers.explored
+        touched = buffers.touched
+
+        g_scores[start] = 0
+        touched.append(start)
+
+        while not frontier.is_empty():
+            # Remove jump point from the frontier
+            index = frontier.remove()
+
+            if not explored[index]:
+                explored[index] = 1
+                yield (Event.EXPANDED, index)
+
+            # Check if this is the destination point
+            if index == end:
+                JumpPointSearch._fill_segments(grid, buffers, end)
+                path, path_cost = JumpPointSearch.generate_path(
+                    parents, end, grid)
+                yield (Event.FINISHED, path, path_cost)
+                return
+
+            row, col = divmod(index, width)
+            for dr, dc in JumpPointSearch._directions(grid, index, parents[index]):
+                jump_point = JumpPointSearch._jump(grid, row + dr, col + dc, dr, dc)
+                if jump_point < 0:
+                    continue
+
+                jump_row, jump_col = divmod(jump_point, width)
+                g_score = g_scores[index] \
+                    + abs(jump_row - row) + abs(jump_col - col)
+
+                if g_score < g_scores[jump_point]:
+                    if g_scores[jump_point] == INFINITY:
+                        touched.append(jump_point)
+
+                    g_scores[jump_point] = g_score
+                    parents[jump_point] = index
+
+                    h_score = abs(jump_row - end_row) + abs(jump_col - end_col)
+                    frontier.add(
+                        jump_point,
+                        priority=g_score + h_score,
+                        tiebreak=h_score
+                    )
+
+                    if pushes:
+                        yield (Event.PUSHED, jump_point, len(frontier))
+
+        yield (Event.FINISHED, Cells(width=grid.width), 0)
+
+    @staticmethod
+    def _directions(
+        grid: Grid,
+        index: int,
+        parent: int
+    ) -> list[tuple[int, int]]:
+        """Get the directions to jump in from a jump point
+
+        The start point jumps in every direction. Other jump points keep
+        going forward and may turn, but never turn back.
+
+        Args:
+            grid (Grid): Grid of points
+            index (int): Index of the jump point
+            parent (int): Index of its parent jump point, -1 for the start
+
+        Returns:
+            list[tuple[int, int]]: (row, column) steps
+        """
+        if parent < 0:
+            return list(DIRECTIONS)
+
+        row, col = divmod(index, grid.width)
+        parent_row, parent_col = divmod(parent, grid.width)
+
+        if row == parent_row:
+            return [(-1, 0), (1, 0), (0, 1 if col > parent_col else -1)]
+
+        return [(0, -1), (0, 1), (1 if row > parent_row else -1, 0)]
+
+    @staticmethod
+    def _is_open(grid: Grid, row: int, col: int) -> bool:
+        return 0 <= row < grid.height and 0 <= col < grid.width \
+            and not grid.walls[row * grid.width + col]
+
+    @staticmethod
+    def _jump(grid: Grid, row: int, col: int, dr: int, dc: int) -> int:
+        """Move in a straight line until a jump point is found
+
+        A cell is a jump point if it is the goal, if it has a forced
+        neighbor (an open cell beside it whose cell behind is blocked),
+        or, when moving vertically, if a horizontal jump from it finds
+        a jump point.
+
+        Args:
+            grid (Grid): Grid of points
+            row (int): Row to start from
+            col (int): Column to start from
+            dr (int): Row step
+            dc (int): Column step
+
+        Returns:
+            int: Index of the jump point, -1 if the line hits a wall
+        """
+        is_open = JumpPointSearch._is_open
+        end_row, end_col = grid.end
+
+        while is_open(grid, row, col):
+            if row == end_row and col == end_col:
+                return row * grid.width + col
+
+            if dr == 0:
+                if (is_open(grid, row - 1, col)
+                        and not is_open(grid, row - 1, col - dc)) \
+                        or (is_open(grid, row + 1, col)
+                            and not is_open(grid, row + 1, col - dc)):
+                    return row * grid.width + col
+            else:
+                if (is_open(grid, row, col - 1)
+                        and not is_open(grid, row - dr, col - 1)) \
+                        or (is_open(grid, row, col + 1)
+                            and not is_open(grid, row - dr, col + 1)):
+                    return row * grid.width + col
+
+                if JumpPointSearch._jump(grid, row, col + 1, 0, 1) >= 0 \
+                        or JumpPointSearch._jump(grid, row, col - 1, 0, -1) >= 0:
+                    return row * grid.width + col
+
+            row += dr
+            col += dc
+
+        return -1
+
+    @staticmethod
+    def _fill_segments(grid: Grid, buffers: SearchBuffers, end: int) -> None:
+        """Point every cell between consecutive jump points on the path
+        to its predecessor, so `generate_path` can follow cell by cell
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers): Buffers of the finished search
+            end (int): Index of the goal
+        """
+        parents = buffers.parents
+        start = grid.index(grid.start)
+
+        # Collect the jump points first, the links are rewritten below
+        jump_points = [end]
+        while jump_points[-1] != start:
+            jump_points.append(parents[jump_points[-1]])
+
+        for curr, prev in zip(jump_points, jump_points[1:]):
+            distance = abs(curr - prev)
+            step = 1 if distance < grid.width else grid.width
+            if curr < prev:
+                step = -step
+
+            cell = prev
+            while cell != curr:
+                parents[cell + step] = cell
+                buffers.touched.append(cell + step)
+                cell += step
@@ -0,0 +1,243 @@
+from array import array
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers, INFINITY
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.grid import Grid
+from ..models.frontier import PriorityQueueFrontier
+from ..models.solution import Solution
+from .search import BasicSearch
+
+
+class LifelongPlanner:
+    """Model the state Lifelong Planning A* (LPA*) keeps between searches
+
+    For every cell, `g_scores` holds the cost the last search settled on
+    and `rhs` the one-step lookahead min(g(p) + cost(cell)) over its
+    neighbors p. Cells where the two differ are inconsistent and sit on
+    the frontier. When cells are edited, only they and their neighbors
+    are re-evaluated, and the next search repairs the costs from there
+    instead of starting over.
+
+    A planner is only valid for the grid it searched. Report every cell
+    whose wall or cost changed since then with `mark_dirty`.
+    """
+
+    def __init__(self, grid: Grid) -> None:
+        self.reset(grid)
+
+    def reset(self, grid: Grid) -> None:
+        """Forget every previous search and plan from scratch
+
+        Args:
+            grid (Grid): Grid of points
+        """
+        self.size = grid.size
+        self.width = grid.width
+        self.start = grid.index(grid.start)
+        self.end = grid.index(grid.end)
+        self.end_pos = grid.end
+
+        self.g_scores = array("i", [INFINITY]) * grid.size
+        self.rhs = array("i", [INFINITY]) * grid.size
+        self.frontier = PriorityQueueFrontier()
+        self.dirty: set[int] = set()
+
+        self.rhs[self.start] = 0
+        self._enqueue(grid, self.start)
+
+    def matches(self, grid: Grid) -> bool:
+        """Check if the planner was set up for a grid's size and endpoints
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            bool: Whether the previous searches can be reused
+        """
+        return self.size == grid.size and self.width == grid.width \
+            and self.start == grid.index(grid.start) \
+            and self.end == grid.index(grid.end)
+
+    def mark_dirty(self, pos: tuple[int, int]) -> None:
+        """Record that a cell's wall or cost changed
+
+        Args:
+            pos (tuple[int, int]): Cell position
+        """
+        self.dirty.add(pos[0] * self.width + pos[1])
+
+    def key(self, grid: Grid, index: int) -> tuple[int, int]:
+        """Get the frontier key of a cell
+
+        Args:
+            grid (Grid): Grid of points
+            index (int): Cell index
+
+        Returns:
+            tuple[int, int]: (min(g, rhs) + h, min(g, rhs))
+        """
+        score = min(self.g_scores[index], self.rhs[index])
+        row, col = divmod(index, grid.width)
+        end_row, end_col = self.end_pos
+        return score + abs(row - end_row) + abs(col - end_col), score
+
+    def update_cell(self, grid: Grid, index: int) -> None:
+        """Recompute the lookahead cost of a cell and requeue it if it is
+        inconsistent
+
+        Args:
+            grid (Grid): Grid of points
+            index (int): Cell index
+        """
+        g_scores = self.g_scores
+
+        if index != self.start:
+            rhs = INFINITY
+            if not grid.walls[index]:
+                cost = grid.costs[index]
+                for neighbor in grid.neighbors(index):
+                    g_score = g_scores[neighbor]
+                    if g_score != INFINITY and g_score + cost < rhs:
+                        rhs = g_score + cost
+            self.rhs[index] = rhs
+
+        self.frontier.discard(index)
+        if g_scores[index] != self.rhs[index]:
+            self._enqueue(grid, index)
+
+    def _enqueue(self, grid: Grid, index: int) -> None:
+        priority, tiebreak = self.key(grid, index)
+        self.frontier.add(index, priority=priority, tiebreak=tiebreak)
+
+    def __repr__(self) -> str:
+        return f"LifelongPlanner({self.size}, {self.start} -> {self.end}, " \
+            f"dirty={len(self.dirty)})"
+
+
+class LifelongPlanningAStarSearch(BasicSearch):
+    @staticmethod
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        planner: LifelongPlanner | None = None
+    ) -> Solution:
+        """Find path between two points in a grid using Lifelong Planning
+        A* (LPA*)
+
+        With a planner kept from an earlier search on the same grid, only
+        the cells made inconsistent by the edits reported since then are
+        expanded again. A new planner, or one set up for other endpoints,
+        searches from scratch like A*.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Unused, accepted for a
+                uniform search signature. Defaults to None.
+            planner (LifelongPlanner, optional): State of earlier searches
+                on this grid, updated in place. Defaults to None.
+
+        Returns:
+            Solution: Solution found
+        """
+        return LifelongPlanningAStarSearch.collect(
+            grid, LifelongPlanningAStarSearch.stream(grid, buffers, planner))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        planner: LifelongPlanner | None = None,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run LPA*, yielding its events as they happen
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Unused, accepted for a
+                uniform search signature. Defaults to None.
+            planner (LifelongPlanner, optional): State of earlier searches
+                on this grid, updated in place. Defaults to None.
+            pushes (bool, optional): Also yield cells (re)queued on the
+                frontier. Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the path found
+        """
+        if planner is None:
+            planner = LifelongPlanner(grid)
+        elif not planner.matches(grid):
+            planner.reset(grid)
+
+        end = planner.end
+        g_scores = planner.g_scores
+        rhs = planner.rhs
+        frontier = planner.frontier
+
+        # Re-evaluate the edited cells and the cells that can move into them
+        for index in planner.dirty:
+            planner.update_cell(grid, index)
+            for neighbor in grid.neighbors(index):
+                planner.update_cell(grid, neighbor)
+        planner.dirty.clear()
+
+        # keep track of cells expanded by this search, in the order they
+        # were expanded
+        expanded = set()
+
+        while not frontier.is_empty() and (
+            tuple(frontier.frontier[0][:2]) < planner.key(grid, end)
+            or rhs[end] != g_scores[end]
+        ):
+            index = frontier.remove()
+
+            if g_scores[index] > rhs[index]:
+                # Overconsistent, its cost went down: settle it
+                g_scores[index] = rhs[index]
+            else:
+                # Underconsistent, its cost went up: invalidate it
+                g_scores[index] = INFINITY
+                planner.update_cell(grid, index)
+
+            for neighbor in grid.neighbors(index):
+                planner.update_cell(grid, neighbor)
+
+            # Only yield once every inconsistent cell is queued again, so a
+            # stream that is dropped here leaves the planner usable
+            if index not in expanded:
+                expanded.add(index)
+                yield (Event.EXPANDED, index)
+
+            if pushes:
+                for neighbor in grid.neighbors(index):
+                    if frontier.contains_state(neighbor):
+                        yield (Event.PUSHED, neighbor, len(frontier))
+
+        if g_scores[end] == INFINITY:
+            yield (Event.FINISHED, Cells(width=grid.width), 0)
+            return
+
+        path = LifelongPlanningAStarSearch.trace_path(grid, planner)
+        yield (Event.FINISHED, path, g_scores[end])
+
+    @staticmethod
+    def trace_path(grid: Grid, planner: LifelongPlanner) -> Cells:
+        """Follow the lowest g-scores back from the goal to the start
+
+        Args:
+            grid (Grid): Grid of points
+            planner (LifelongPlanner): Planner of a finished search
+
+        Returns:
+            Cells: Path from the start to the goal
+        """
+        g_scores = planner.g_scores
+
+        cells = array("i", [planner.end])
+        while cells[-1] != planner.start:
+            cells.append(min(grid.neighbors(cells[-1]),
+                             key=g_scores.__getitem__))
+        cells.reverse()
+
+        return Cells(cells, grid.width)
@@ -1,20 +1,229 @@
+from array import array
+from typing import Iterator
+
+from ..models.budget import Budget, StopReason
+from ..models.buffers import INFINITY
+from ..models.cells import Cells
+from ..models.events import Event, SearchEvent
+from ..models.frontier import (
+    BucketFrontier, MAX_BUCKETS, PriorityQueueFrontier
+)
 from ..models.grid import Grid
-from ..models.node import Node
+from ..models.landmarks import Heuristic, Landmarks
+from ..models.solution import NoSolution, Solution
 
 
 class BasicSearch: 
     @staticmethod
-    def generate_path(node: Node, grid: Grid) -> tuple[list[tuple[int, int]], int]:
-        # Generate path from start to goal
-        path = []
+    def collect(
+        grid: Grid,
+        events: Iterator[SearchEvent],
+        budget: Budget | None = None
+    ) -> Solution:
+        """Run a streaming search to the end and gather its events into
+        a solution
+
+        With a budget, the search is stopped as soon as one of its limits
+        is hit, and a NoSolution with the cells explored so far and the
+        reason is returned. The frontier limit is only checked if the
+        stream yields its pushes. If the search already yielded a path in
+        an Event.IMPROVED, the best one is returned with the reason
+        instead, so anytime searches answer with what they had.
+
+        Args:
+            grid (Grid): Grid of points the search runs on
+            events (Iterator[SearchEvent]): Events of a streaming search
+            budget (Budget, optional): Limits of the search.
+                Defaults to None.
+
+        Returns:
+            Solution: Solution found
+        """
+        explored = array("i")
+        explored_states = Cells(explored, grid.width)
+        path, path_cost = Cells(width=grid.width), 0
+        bound = None
+
+        deadline = budget.deadline() if budget else None
+        if budget and budget.token and budget.token.cancelled:
+            return NoSolution(path, explored_states=explored_states,
+                              reason=StopReason.CANCELLED)
+
+        for event in events:
+            if budget is not None:
+                reason = budget.check(event, len(explored), deadline)
+                if reason is not None:
+                    break
+
+            if event[0] is Event.EXPANDED:
+                explored.append(event[1])
+            elif event[0] is Event.IMPROVED:
+                _, path, path_cost, bound = event
+            elif event[0] is Event.FINISHED and event[1]:
+                _, path, path_cost = event
+        else:
+            reason = None
+
+        if not path:
+            return NoSolution(path, explored_states=explored_states,
+                              reason=reason)
+
+        return Solution(path=path,
+                        explored_states=explored_states,
+                        path_cost=path_cost,
+                        reason=reason,
+                        bound=bound
+                        )
+
+    @staticmethod
+    def generate_path(
+        parents: array,
+        end: int,
+        grid: Grid
+    ) -> tuple[Cells, int]:
+        """Generate path from start to a cell by following parent indices
+
+        Args:
+            parents (array): Parent index of every reached cell
+            end (int): Index of the last cell in the path
+            grid (Grid): Grid of points
+
+        Returns:
+            tuple[Cells, int]: Path and its cost
+        """
+        path = array("i")
         path_cost = 0
 
-        curr = node
-        while curr.parent:
-            path.append(curr.state)
-            path_cost += curr.cost 
-            curr = curr.parent
+        start = grid.index(grid.start)
+        curr = end
+        while curr != start:
+            path.append(curr)
+            path_cost += grid.costs[curr]
+            curr = parents[curr]
         
-        path.append(grid.start)
+        path.append(start)
         path.reverse()
-        return path, path_cost
\ No newline at end of file
+        return Cells(path, grid.width), path_cost
+
+    @staticmethod
+    def generate_bidirectional_path(
+        forward_parents: array,
+        backward_parents: array,
+        meeting: int,
+        grid: Grid
+    ) -> tuple[Cells, int]:
+        """Stitch the halves of a bidirectional search into one path
+
+        Args:
+            forward_parents (array): Parents of the search from the start
+            backward_parents (array): Parents of the search from the goal,
+                pointing towards the goal
+            meeting (int): Index of the cell where the searches met
+            grid (Grid): Grid of points
+
+        Returns:
+            tuple[Cells, int]: Path and its cost
+        """
+        path, path_cost = BasicSearch.generate_path(
+            forward_parents, meeting, grid)
+
+        end = grid.index(grid.end)
+        curr = meeting
+        while curr != end:
+            curr = backward_parents[curr]
+            path.indices.append(curr)
+            path_cost += grid.costs[curr]
+
+        return path, path_cost
+
+    @staticmethod
+    def priority_frontier(
+        max_step: int
+    ) -> BucketFrontier | PriorityQueueFrontier:
+        """Pick the frontier for a search whose priorities never decrease
+
+        Cell costs are small integers, so the priorities of Dijkstras and
+        A* with a consistent heuristic fit in a bucket queue. The heap is
+        only used when the step is too large for it.
+
+        Args:
+            max_step (int): Largest amount a priority can rise by from a
+                removed state to the states added after it
+
+        Returns:
+            BucketFrontier | PriorityQueueFrontier: Empty frontier
+        """
+        if 0 <= max_step < MAX_BUCKETS:
+            return BucketFrontier(max_step)
+
+        return PriorityQueueFrontier()
+
+    @staticmethod
+    def has_free_cells(grid: Grid) -> bool:
+        """Check whether moving into a cell other than the start can cost
+        nothing
+
+        Such cells let a path be cheaper than its number of steps, so
+        distances in steps no longer bound its cost.
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            bool: Whether an open cell besides the start has cost 0
+        """
+        free_start = grid.get_cost(grid.start) == 0
+        return grid.cost_counts.get(0, 0) > free_start
+
+    @staticmethod
+    def heuristic_function(
+        grid: Grid,
+        landmarks: Landmarks | None = None,
+        admissible: bool = True
+    ) -> Heuristic:
+        """Build the heuristic towards the grid's goal
+
+        The Manhattan distance is used, and with landmarks, the larger of
+        it and the landmark (ALT) lower bound is taken. The Manhattan
+        distance only bounds the remaining cost while every cell but the
+        start costs at least 1. On a grid with other free cells it is left
+        out of an admissible heuristic, leaving the landmark bound, or 0
+        without landmarks.
+
+        Args:
+            grid (Grid): Grid of points
+            landmarks (Landmarks, optional): Landmark tables built for this
+                grid. Defaults to None.
+            admissible (bool, optional): Never overestimate the remaining
+                cost. Defaults to True.
+
+        Raises:
+            ValueError: Landmarks were built for a grid of another size
+
+        Returns:
+            Heuristic: Function from a cell index to its estimated
+                remaining cost
+        """
+        width = grid.width
+        end_row, end_col = grid.end
+
+        def manhattan(index: int) -> int:
+            row, col = divmod(index, width)
+            return abs(row - end_row) + abs(col - end_col)
+
+        def zero(index: int) -> int:
+            return 0
+
+        if admissible and BasicSearch.has_free_cells(grid):
+            distance = zero
+        else:
+            distance = manhattan
+
+        if landmarks is None:
+            return distance
+
+        if landmarks.size != grid.size:
+            raise ValueError("Landmarks were built for a different grid")
+
+        alt = landmarks.heuristic(grid.index(grid.end))
+        return lambda index: max(distance(index), alt(index))
@@ -0,0 +1,147 @@
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ..models.cells import Cells
+from ..models.grid import Grid
+from ..models.solution import NoSolution, Solution
+from .search import BasicSearch
+
+# Smallest grid worth the overhead of the array operations
+MIN_SIZE = 4096
+
+
+class WavefrontSearch(BasicSearch):
+    @staticmethod
+    def supports(grid: Grid) -> bool:
+        """Check whether the wavefront search can stand in for Breadth
+        First Search on a grid
+
+        Args:
+            grid (Grid): Grid of points
+
+        Returns:
+            bool: Whether NumPy is installed and the grid is big enough
+                and has no weighted cells
+        """
+        return numpy is not None and grid.size >= MIN_SIZE \
+            and grid.max_cost <= 1
+
+    @staticmethod
+    def search(grid: Grid) -> Solution:
+        """Find path between two points in an unweighted grid by expanding
+        whole Breadth First Search generations at once with NumPy
+
+        The grid is padded with a border of walls, so the neighbors of
+        every open cell are found by shifting the frontier's indices by
+        one row or column without bounds checks. Every reached cell
+        records its generation, and the path is traced back from the goal
+        through cells of decreasing generation.
+
+        Args:
+            grid (Grid): Grid of points, without weighted cells
+
+        Raises:
+            ImportError: NumPy isn't installed
+
+        Returns:
+            Solution: Solution found. Cells are explored generation by
+                generation, and in index order within one.
+        """
+        if numpy is None:
+            raise ImportError("WavefrontSearch needs NumPy")
+
+        height, width = grid.height, grid.width
+        padded_width = width + 2
+
+        # Cells that can't be entered: walls, the border and cells that
+        # were already reached
+        blocked = numpy.ones((height + 2, padded_width), dtype=bool)
+        blocked[1:-1, 1:-1] = numpy.frombuffer(
+            grid.walls, dtype=numpy.uint8).reshape(height, width)
+        blocked = blocked.ravel()
+
+        generation = numpy.full(blocked.size, -1, dtype=numpy.int32)
+        stamp = numpy.zeros(blocked.size, dtype=numpy.int64)
+
+        # Up, down, left, right
+        offsets = numpy.array([-padded_width, padded_width, -1, 1])
+
+        def padded(pos: tuple[int, int]) -> int:
+            return (pos[0] + 1) * padded_width + pos[1] + 1
+
+        start = padded(grid.start)
+        end = padded(grid.end)
+
+        frontier = numpy.array([start])
+        blocked[start] = True
+        generation[start] = 0
+        generations = []
+
+        while frontier.size and generation[end] < 0:
+            generations.append(frontier)
+
+            neighbors = (frontier[:, None] + offsets).ravel()
+            neighbors = neighbors[~blocked[neighbors]]
+
+            # Drop duplicates: only the last write of each index survives
+            order = numpy.arange(neighbors.size)
+            stamp[neighbors] = order
+            neighbors = neighbors[stamp[neighbors] == order]
+
+            blocked[neighbors] = True
+            generation[neighbors] = len(generations)
+            frontier = neighbors
+
+        explored = numpy.concatenate(generations) if generations \
+            else numpy.array([], dtype=numpy.int64)
+        if generation[end] >= 0:
+            explored = numpy.append(explored, end)
+        explored_states = Cells(
+            WavefrontSearch._unpad(explored, padded_width, width), width)
+
+        if generation[end] < 0:
+            return NoSolution(Cells(width=width),
+                              explored_states=explored_states)
+
+        # Step back to any neighbor one generation closer to the start
+        cells = [end]
+        curr = end
+        for step in range(int(generation[end]) - 1, -1, -1):
+            for offset in (-padded_width, padded_width, -1, 1):
+                if generation[curr + offset] == step:
+                    curr += offset
+                    break
+            cells.append(curr)
+        cells.reverse()
+
+        path = WavefrontSearch._unpad(
+            numpy.array(cells), padded_width, width)
+        path_cost = sum(grid.costs[index] for index in path[1:])
+
+        return Solution(path=Cells(path, width),
+                        explored_states=explored_states,
+                        path_cost=path_cost
+                        )
+
+    @staticmethod
+    def _unpad(indices, padded_width: int, width: int) -> array:
+        """Convert indices of the padded grid to indices of the grid
+
+        Args:
+            indices (numpy.ndarray): Indices in the padded grid
+            padded_width (int): Width of the padded grid
+            width (int): Width of the grid
+
+        Returns:
+            array: Indices in the grid
+        """
+        rows, cols = numpy.divmod(indices, padded_width)
+        flat = (rows - 1) * width + cols - 1
+
+        result = array("i")
+        result.frombytes(flat.astype(f"i{result.itemsize}").tobytes())
+        return result
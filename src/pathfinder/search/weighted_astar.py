@@ -0,0 +1,61 @@
+from typing import Iterator
+
+from ..models.buffers import SearchBuffers
+from ..models.events import SearchEvent
+from ..models.grid import Grid
+from ..models.solution import Solution
+from .astar import AStarSearch
+
+# Weight of the heuristic when none is given
+DEFAULT_EPSILON = 2.0
+
+
+class WeightedAStarSearch(AStarSearch):
+    @staticmethod
+    def search(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        epsilon: float = DEFAULT_EPSILON
+    ) -> Solution:
+        """Find path between two points in a grid using Weighted A* Search
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic. The path
+                costs at most epsilon times the optimal cost.
+                Defaults to DEFAULT_EPSILON.
+
+        Returns:
+            Solution: Solution found, with `bound` set to epsilon
+        """
+        return WeightedAStarSearch.collect(
+            grid, WeightedAStarSearch.stream(grid, buffers, epsilon))
+
+    @staticmethod
+    def stream(
+        grid: Grid,
+        buffers: SearchBuffers | None = None,
+        epsilon: float = DEFAULT_EPSILON,
+        pushes: bool = False
+    ) -> Iterator[SearchEvent]:
+        """Run Weighted A* Search, yielding its events as they happen
+
+        This is A* Search with its heuristic multiplied by epsilon, see
+        `AStarSearch.stream`.
+
+        Args:
+            grid (Grid): Grid of points
+            buffers (SearchBuffers, optional): Scratch buffers to reuse
+                between searches. Defaults to None.
+            epsilon (float, optional): Weight of the heuristic.
+                Defaults to DEFAULT_EPSILON.
+            pushes (bool, optional): Also yield frontier pushes.
+                Defaults to False.
+
+        Yields:
+            SearchEvent: Expanded cells, then the bound and the path found
+        """
+        yield from AStarSearch.stream(
+            grid, buffers, epsilon=epsilon, pushes=pushes)
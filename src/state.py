@@ -12,6 +12,13 @@ class State:
     run_all_mazes = False
     results_popup: Popup | None = None 
 
+    # Whether the next frame redraws the whole window instead of the
+    # header and the cells that changed
+    full_redraw = True
+
+    # Whether the header layer has to be drawn again, see `draw_header`
+    header_changed = True
+
     def __new__(cls):
         if State.__instance is None:
             State.__instance = object.__new__(cls) 
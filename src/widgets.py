@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import pygame
 
+from .fonts import BOLD, REGULAR, render
 from .constants import (
     BLACK,
     DARK_BLUE,
@@ -54,12 +55,8 @@ class Button(Widget):
         self.background_color = background_color
 
         # Render text
-        if bold:
-            font = pygame.font.Font("assets/font/Montserrat-Bold.ttf", font_size)
-        else: 
-            font = pygame.font.Font("assets/font/Montserrat-Regular.ttf", font_size)
-        
-        self.text_surf = font.render(text, True, foreground_color)
+        self.text_surf = render(
+            text, foreground_color, font_size, BOLD if bold else REGULAR)
 
         # Get Rect object out of the text surface
         self.text_rect = self.text_surf.get_rect()
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def maze(monkeypatch):
+    """Maze on a headless display, with its assets found from the root"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(sys, "argv", ["run.pyw"])
+
+    # The display constants are loaded by this import
+    import pygame
+    from src.maze import Maze
+
+    return Maze(surface=pygame.Surface((1, 1)))
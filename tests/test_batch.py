@@ -0,0 +1,63 @@
+import random
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+
+
+def make_grid(seed: int) -> tuple[Grid, list[tuple[int, int]]]:
+    """Build a random weighted map compiled the way the Maze does it
+
+    Args:
+        seed (int): Random seed
+
+    Returns:
+        tuple[Grid, list[tuple[int, int]]]: Grid and its open cells
+    """
+    rnd = random.Random(seed)
+    height, width = 12, 16
+
+    nodes = []
+    for r in range(height):
+        row = []
+        for c in range(width):
+            roll = rnd.random()
+            if roll < 0.25:
+                row.append(Node("#", (r, c), -1))
+            elif roll < 0.35:
+                cost = rnd.randint(2, 9)
+                row.append(Node(str(cost), (r, c), cost))
+            else:
+                row.append(Node("1", (r, c), 1))
+        nodes.append(row)
+
+    cells = [(r, c) for r in range(height) for c in range(width)
+             if nodes[r][c].value != "#"]
+    start, goal = rnd.sample(cells, 2)
+
+    # The start is compiled with cost 0, as in the Maze
+    nodes[start[0]][start[1]] = Node("A", start, 0)
+    nodes[goal[0]][goal[1]] = Node("B", goal, 1)
+
+    return Grid(nodes, start, goal), cells
+
+
+def test_batch_astar_matches_dijkstra_when_start_moves():
+    for seed in range(200):
+        grid, cells = make_grid(seed)
+        rnd = random.Random(seed)
+        queries = [tuple(rnd.sample(cells, 2)) for _ in range(10)]
+
+        expected = [
+            solution.path_cost for solution in
+            PathFinder.find_paths(grid, queries, Search.DIJKSRAS_SEARCH)
+        ]
+
+        for search_type in (Search.ASTAR_SEARCH,
+                            Search.BIDIRECTIONAL_ASTAR_SEARCH):
+            costs = [
+                solution.path_cost for solution in
+                PathFinder.find_paths(grid, queries, search_type)
+            ]
+            assert costs == expected, (seed, search_type)
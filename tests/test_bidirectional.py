@@ -0,0 +1,59 @@
+import random
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+
+
+def make_grid(seed: int) -> Grid:
+    """Build a random map with walls and free cells
+
+    Args:
+        seed (int): Random seed
+
+    Returns:
+        Grid: Grid with random endpoints
+    """
+    rnd = random.Random(seed)
+    height, width = 12, 16
+
+    nodes = []
+    for r in range(height):
+        row = []
+        for c in range(width):
+            roll = rnd.random()
+            if roll < 0.25:
+                row.append(Node("#", (r, c), -1))
+            elif roll < 0.4:
+                row.append(Node("0", (r, c), 0))
+            else:
+                row.append(Node("1", (r, c), 1))
+        nodes.append(row)
+
+    cells = [(r, c) for r in range(height) for c in range(width)
+             if nodes[r][c].value != "#"]
+    start, goal = rnd.sample(cells, 2)
+    return Grid(nodes, start, goal)
+
+
+def test_bidirectional_astar_is_optimal_with_free_cells():
+    for seed in range(200):
+        grid = make_grid(seed)
+
+        expected = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        solution = PathFinder.find_path(
+            grid, Search.BIDIRECTIONAL_ASTAR_SEARCH)
+        assert solution.path_cost == expected.path_cost, seed
+
+
+def test_bidirectional_searches_when_start_is_the_goal():
+    nodes = [[Node("1", (r, c), 1) for c in range(4)] for r in range(3)]
+    grid = Grid(nodes, (1, 1), (1, 1))
+
+    expected = PathFinder.find_path(grid, Search.BREADTH_FIRST_SEARCH)
+    for search_type in (Search.BIDIRECTIONAL_BREADTH_FIRST_SEARCH,
+                        Search.BIDIRECTIONAL_ASTAR_SEARCH):
+        solution = PathFinder.find_path(grid, search_type)
+        assert list(solution.path) == list(expected.path) == [(1, 1)]
+        assert solution.path_cost == expected.path_cost == 0
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.frontier import (
+    BucketFrontier, MAX_BUCKETS, PriorityQueueFrontier
+)
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+from src.pathfinder.search import search
+from src.pathfinder.search.search import BasicSearch
+
+
+def make_grid(seed: int, free: float = 0.0) -> Grid:
+    """Build a random map with walls, weighted cells and free cells
+
+    Args:
+        seed (int): Random seed
+        free (float, optional): Share of free cells. Defaults to 0.0.
+
+    Returns:
+        Grid: Grid with random endpoints, the start compiled with cost 0
+    """
+    rnd = random.Random(seed)
+    height, width = 20, 25
+
+    nodes = []
+    for r in range(height):
+        row = []
+        for c in range(width):
+            roll = rnd.random()
+            if roll < 0.25:
+                row.append(Node("#", (r, c), -1))
+            elif roll < 0.25 + free:
+                row.append(Node("0", (r, c), 0))
+            elif roll < 0.4 + free:
+                cost = rnd.randint(2, 9)
+                row.append(Node(str(cost), (r, c), cost))
+            else:
+                row.append(Node("1", (r, c), 1))
+        nodes.append(row)
+
+    cells = [(r, c) for r in range(height) for c in range(width)
+             if nodes[r][c].value != "#"]
+    start, goal = rnd.sample(cells, 2)
+    nodes[start[0]][start[1]] = Node("A", start, 0)
+    nodes[goal[0]][goal[1]] = Node("B", goal, 1)
+    return Grid(nodes, start, goal)
+
+
+def test_bucket_frontier_removes_in_priority_order():
+    # The first state sets the bottom of the window, like a search's start
+    frontier = BucketFrontier(max_step=3)
+    frontier.add(2, priority=0)
+    frontier.add(1, priority=2)
+    frontier.add(3, priority=3)
+    frontier.add(4, priority=1)
+
+    # Decrease-key, and a higher priority that is ignored
+    frontier.add(3, priority=1)
+    frontier.add(2, priority=3)
+
+    assert len(frontier) == 4
+    assert frontier.get(3) == 1
+
+    removed = [frontier.remove() for _ in range(4)]
+    assert removed[0] == 2
+    assert set(removed[1:3]) == {3, 4}
+    assert removed[3] == 1
+    assert frontier.is_empty()
+
+
+def test_bucket_frontier_discard_and_window():
+    frontier = BucketFrontier(max_step=2)
+    frontier.add(1, priority=5)
+    frontier.add(2, priority=6)
+    frontier.discard(1)
+
+    assert not frontier.contains_state(1)
+    assert frontier.remove() == 2
+
+    with pytest.raises(ValueError):
+        frontier.add(3, priority=4)
+    with pytest.raises(ValueError):
+        frontier.add(3, priority=9)
+
+    with pytest.raises(Exception):
+        BucketFrontier(max_step=2).remove()
+
+
+def test_priority_frontier_switches_at_max_buckets():
+    assert isinstance(BasicSearch.priority_frontier(0), BucketFrontier)
+    assert isinstance(
+        BasicSearch.priority_frontier(MAX_BUCKETS - 1), BucketFrontier)
+    assert isinstance(
+        BasicSearch.priority_frontier(MAX_BUCKETS), PriorityQueueFrontier)
+
+
+@pytest.mark.parametrize("max_buckets", [MAX_BUCKETS, 0])
+def test_dijkstra_and_astar_agree_on_both_frontiers(monkeypatch, max_buckets):
+    # With no buckets allowed, every search falls back to the heap
+    monkeypatch.setattr(search, "MAX_BUCKETS", max_buckets)
+
+    for seed in range(100):
+        grid = make_grid(seed)
+        dijkstra = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        astar = PathFinder.find_path(grid, Search.ASTAR_SEARCH)
+        assert astar.path_cost == dijkstra.path_cost, seed
+
+
+def test_astar_is_optimal_with_free_cells():
+    for seed in range(100):
+        grid = make_grid(seed, free=0.1)
+        expected = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        landmarks = PathFinder.build_landmarks(grid)
+
+        for search_type, options in (
+            (Search.ASTAR_SEARCH, {}),
+            (Search.ASTAR_SEARCH, {"landmarks": landmarks}),
+            (Search.ANYTIME_REPAIRING_ASTAR_SEARCH, {}),
+        ):
+            solution = PathFinder.find_path(grid, search_type, **options)
+            assert solution.path_cost == expected.path_cost, (
+                seed, search_type, options)
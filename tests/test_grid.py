@@ -0,0 +1,47 @@
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+
+# The 0 at (2, 4) is the compiled start
+ROWS = ["#1#1111", "1##1#11", "1#1101#", "1111111", "#1#1111"]
+
+
+def make_grid() -> Grid:
+    """Compile ROWS with the start on its free cell
+
+    Returns:
+        Grid: Grid of ROWS
+    """
+    nodes = [
+        [Node(value, (r, c), -1 if value == "#" else int(value))
+         for c, value in enumerate(row)]
+        for r, row in enumerate(ROWS)
+    ]
+    return Grid(nodes, (2, 4), (0, 6))
+
+
+def test_with_endpoints_raises_the_old_start():
+    grid = make_grid()
+    query = grid.with_endpoints((1, 5), (1, 3))
+
+    assert query.get_cost((2, 4)) == 1
+    assert grid.get_cost((2, 4)) == 0
+
+    expected = PathFinder.find_path(query, Search.DIJKSRAS_SEARCH).path_cost
+    for search_type in (Search.ASTAR_SEARCH, Search.JUMP_POINT_SEARCH,
+                        Search.BIDIRECTIONAL_ASTAR_SEARCH):
+        solution = PathFinder.find_path(query, search_type)
+        assert solution.path_cost == expected, search_type
+
+
+def test_with_endpoints_shares_arrays_when_the_start_stays():
+    grid = make_grid()
+    query = grid.with_endpoints((2, 4), (3, 0))
+
+    grid.update_cell((3, 3), True, -1)
+
+    assert query.walls is grid.walls
+    assert query.costs is grid.costs
+    assert query.fingerprint != make_grid().with_endpoints(
+        (2, 4), (3, 0)).fingerprint
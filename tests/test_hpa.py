@@ -0,0 +1,79 @@
+import random
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.search_types import Search
+from src.pathfinder.models.solution import Solution
+from src.pathfinder.search.hpa import HierarchicalGraph
+
+
+def assert_valid_path(grid: Grid, solution: Solution) -> None:
+    """Check that a path walks open cells from the start to the goal
+
+    Args:
+        grid (Grid): Grid of points
+        solution (Solution): Solution with a path
+    """
+    path = list(solution.path)
+    assert path[0] == grid.start
+    assert path[-1] == grid.end
+
+    for prev, curr in zip(path, path[1:]):
+        assert abs(prev[0] - curr[0]) + abs(prev[1] - curr[1]) == 1
+        assert not grid.walls[grid.index(curr)]
+
+    assert solution.path_cost == sum(grid.get_cost(pos) for pos in path[1:])
+
+
+def assert_matches_rebuilt(maze) -> None:
+    """Check the Maze's refreshed hierarchy against one built from scratch
+
+    Args:
+        maze (Maze): Maze solved with HPA* before
+    """
+    solution = maze.solve("HPA* Search")
+    grid = maze.grid
+
+    rebuilt = HierarchicalGraph(grid, cluster_size=maze.hierarchy.cluster_size)
+    assert maze.hierarchy.inter == rebuilt.inter
+    assert maze.hierarchy.intra == rebuilt.intra
+
+    fresh = PathFinder.find_path(
+        grid, Search.HIERARCHICAL_SEARCH, hierarchy=rebuilt)
+    reachable = bool(PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH).path)
+
+    assert bool(solution.path) == bool(fresh.path) == reachable
+    if reachable:
+        assert_valid_path(grid, solution)
+        assert_valid_path(grid, fresh)
+
+
+def test_refreshed_hierarchy_matches_a_rebuilt_one(maze):
+    rnd = random.Random(10)
+    cells = [(r, c) for r in range(maze.height) for c in range(maze.width)
+             if (r, c) not in (maze.start, maze.goal)]
+
+    maze.solve("HPA* Search")
+    assert maze.hierarchy is not None
+
+    for _ in range(10):
+        for _ in range(40):
+            maze.set_cell(rnd.choice(cells), rnd.choice(["#", "#", "1", "5"]))
+        assert_matches_rebuilt(maze)
+
+
+def test_refreshed_hierarchy_when_the_goal_is_walled_in(maze):
+    maze.solve("HPA* Search")
+
+    row, col = maze.goal
+    around = [(row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)]
+
+    for pos in around:
+        maze.set_cell(pos, "#")
+    assert_matches_rebuilt(maze)
+    assert not maze.solve("HPA* Search").path
+
+    for pos in around:
+        maze.set_cell(pos, "1")
+    assert_matches_rebuilt(maze)
+    assert maze.solve("HPA* Search").path
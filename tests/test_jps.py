@@ -0,0 +1,19 @@
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+
+
+def test_jump_point_search_with_a_free_cell():
+    # Every shortest path takes 5 steps, but only the ones through the
+    # free cells at (1, 1) and (1, 2) cost 3
+    rows = ["1111", "1001", "1111"]
+    nodes = [
+        [Node(value, (r, c), int(value)) for c, value in enumerate(row)]
+        for r, row in enumerate(rows)
+    ]
+    grid = Grid(nodes, (0, 0), (2, 3))
+
+    expected = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+    solution = PathFinder.find_path(grid, Search.JUMP_POINT_SEARCH)
+    assert solution.path_cost == expected.path_cost == 3
@@ -0,0 +1,66 @@
+import random
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.search_types import Search
+
+
+def assert_replans_optimally(maze) -> list[tuple[int, int]]:
+    """Check the Maze's LPA* answer against a fresh Dijkstra search
+
+    Args:
+        maze (Maze): Maze to solve
+
+    Returns:
+        list[tuple[int, int]]: Path found by LPA*
+    """
+    solution = maze.solve("LPA* Search")
+    expected = PathFinder.find_path(maze.grid, Search.DIJKSRAS_SEARCH)
+
+    assert bool(solution.path) == bool(expected.path)
+    assert solution.path_cost == expected.path_cost
+    return list(solution.path)
+
+
+def test_replanned_costs_match_dijkstra(maze):
+    rnd = random.Random(11)
+    cells = [(r, c) for r in range(maze.height) for c in range(maze.width)
+             if (r, c) not in (maze.start, maze.goal)]
+
+    assert_replans_optimally(maze)
+    assert maze.planner is not None
+
+    for _ in range(30):
+        for _ in range(rnd.randint(1, 10)):
+            maze.set_cell(rnd.choice(cells), rnd.choice(["#", "1", "3", "9"]))
+        assert_replans_optimally(maze)
+
+
+def test_replanned_costs_when_the_path_is_blocked_and_reopened(maze):
+    path = assert_replans_optimally(maze)
+    blocked = []
+
+    # Wall off a cell in the middle of every path found
+    for _ in range(8):
+        pos = path[len(path) // 2]
+        maze.set_cell(pos, "#")
+        blocked.append(pos)
+
+        path = assert_replans_optimally(maze)
+        assert pos not in path
+
+    # Reopen them in reverse, which gives the earlier paths back
+    for pos in reversed(blocked):
+        maze.set_cell(pos, "1")
+        assert_replans_optimally(maze)
+
+    # Wall in the goal, then open it again
+    row, col = maze.goal
+    around = [(row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)]
+
+    for pos in around:
+        maze.set_cell(pos, "#")
+    assert not assert_replans_optimally(maze)
+
+    for pos in around:
+        maze.set_cell(pos, "1")
+    assert assert_replans_optimally(maze)
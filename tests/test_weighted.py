@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from src.pathfinder.main import PathFinder
+from src.pathfinder.models.frontier import BucketFrontier
+from src.pathfinder.models.grid import Grid
+from src.pathfinder.models.node import Node
+from src.pathfinder.models.search_types import Search
+from src.pathfinder.search.astar import AStarSearch
+
+
+def make_grid(seed: int) -> Grid:
+    """Build a random map with walls and weighted cells
+
+    Args:
+        seed (int): Random seed
+
+    Returns:
+        Grid: Grid with random endpoints
+    """
+    rnd = random.Random(seed)
+    height, width = 20, 25
+
+    nodes = []
+    for r in range(height):
+        row = []
+        for c in range(width):
+            roll = rnd.random()
+            if roll < 0.25:
+                row.append(Node("#", (r, c), -1))
+            elif roll < 0.45:
+                cost = rnd.randint(2, 9)
+                row.append(Node(str(cost), (r, c), cost))
+            else:
+                row.append(Node("1", (r, c), 1))
+        nodes.append(row)
+
+    cells = [(r, c) for r in range(height) for c in range(width)
+             if nodes[r][c].value != "#"]
+    start, goal = rnd.sample(cells, 2)
+    return Grid(nodes, start, goal)
+
+
+@pytest.mark.parametrize("epsilon", [1.25, 1.5, 2.0, 3.0, 5.0])
+def test_weighted_astar_stays_within_its_bound(epsilon):
+    for seed in range(100):
+        grid = make_grid(seed)
+        optimal = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        solution = PathFinder.find_path(
+            grid, Search.WEIGHTED_ASTAR_SEARCH, epsilon=epsilon)
+
+        assert bool(solution.path) == bool(optimal.path), seed
+        if optimal.path:
+            assert solution.path_cost <= epsilon * optimal.path_cost, seed
+            assert solution.bound == epsilon, seed
+
+
+def test_anytime_repairing_astar_ends_optimal():
+    for seed in range(100):
+        grid = make_grid(seed)
+        optimal = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        solution = PathFinder.find_path(
+            grid, Search.ANYTIME_REPAIRING_ASTAR_SEARCH,
+            epsilon=5.0, decrement=1.5)
+
+        assert solution.path_cost == optimal.path_cost, seed
+        if optimal.path:
+            assert solution.bound == 1.0, seed
+
+
+def test_float_epsilon_of_one_uses_the_bucket_queue(monkeypatch):
+    # An epsilon of 1.0 left as a float makes the f-scores floats, which
+    # can't index the buckets
+    frontiers = []
+    priority_frontier = AStarSearch.priority_frontier
+
+    def spy(max_step: int):
+        frontier = priority_frontier(max_step)
+        frontiers.append(frontier)
+        return frontier
+
+    monkeypatch.setattr(AStarSearch, "priority_frontier", staticmethod(spy))
+
+    for seed in range(20):
+        grid = make_grid(seed)
+        optimal = PathFinder.find_path(grid, Search.DIJKSRAS_SEARCH)
+        solution = PathFinder.find_path(
+            grid, Search.ASTAR_SEARCH, epsilon=1.0)
+        assert solution.path_cost == optimal.path_cost, seed
+
+    assert frontiers
+    assert all(isinstance(frontier, BucketFrontier) for frontier in frontiers)
+
+
+def test_epsilon_below_one_is_rejected():
+    grid = make_grid(0)
+
+    for search_type in (Search.ASTAR_SEARCH,
+                        Search.WEIGHTED_ASTAR_SEARCH,
+                        Search.ANYTIME_REPAIRING_ASTAR_SEARCH):
+        with pytest.raises(ValueError):
+            PathFinder.find_path(grid, search_type, epsilon=0.5)